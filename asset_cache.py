@@ -0,0 +1,228 @@
+import hashlib
+import mmap
+import os
+import struct
+
+import numpy as np
+import pygame
+
+# ------------------------------
+# ΜΟΝΙΜΟ CACHE ΑΠΟΚΩΔΙΚΟΠΟΙΗΜΕΝΩΝ ASSETS
+# ------------------------------
+# Αντί για decode PNG/JPG/MP3 σε κάθε άνοιγμα, κρατάμε στον δίσκο τα έτοιμα pixels
+# (ήδη κλιμακωμένα) και τον ήχο ως PCM, σε «ωμή» μορφή: header + bytes.
+# Το αρχείο διαβάζεται με mmap και περνάει κατευθείαν στο pygame χωρίς decode.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".asset_cache")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# magic, πλάτος/συχνότητα, ύψος/μέγεθος δείγματος, alpha/κανάλια
+HEADER = struct.Struct("<8siii")
+IMAGE_MAGIC = b"PGIMG001"
+SOUND_MAGIC = b"PGPCM001"
+
+_hashes = {}  # path -> (mtime, size, hash), για να μη διαβάζουμε το ίδιο αρχείο δύο φορές
+
+
+def file_hash(path):
+    """SHA-1 του περιεχομένου του αρχείου (το κλειδί του cache)."""
+    st = os.stat(path)
+    known = _hashes.get(path)
+    if known and known[0] == st.st_mtime and known[1] == st.st_size:
+        return known[2]
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    digest = h.hexdigest()[:20]
+    _hashes[path] = (st.st_mtime, st.st_size, digest)
+    return digest
+
+
+def _resolve(path):
+    return path if os.path.isabs(path) else os.path.join(BASE_DIR, path)
+
+
+def _cache_file(key, ext):
+    return os.path.join(CACHE_DIR, f"{key}.{ext}")
+
+
+def _write_atomic(path, header, data):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(data)
+        os.replace(tmp, path)   # οι άλλοι βλέπουν είτε όλο το αρχείο είτε τίποτα
+    except OSError:
+        pass  # χωρίς cache απλώς αργεί το επόμενο άνοιγμα
+
+
+def _read_mapped(path, magic):
+    """Επιστρέφει (mmap, header) ή None αν το αρχείο λείπει/δεν είναι σωστό."""
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mm) < HEADER.size or mm[:8] != magic:
+        mm.close()
+        return None
+    return mm, HEADER.unpack_from(mm)
+
+
+# ------------------------------
+# ΕΙΚΟΝΕΣ
+# ------------------------------
+def store_surface(key, surface):
+    """Γράφει τα pixels του surface στο cache με το κλειδί key."""
+    alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    fmt = "RGBA" if alpha else "RGB"
+    data = pygame.image.tobytes(surface, fmt)
+    w, h = surface.get_size()
+    _write_atomic(_cache_file(key, "img"), HEADER.pack(IMAGE_MAGIC, w, h, int(alpha)), data)
+
+
+def load_surface(key):
+    """Φορτώνει surface από το cache (ή None). Αν υπάρχει οθόνη, είναι ήδη σε display format."""
+    mapped = _read_mapped(_cache_file(key, "img"), IMAGE_MAGIC)
+    if mapped is None:
+        return None
+    mm, (_, w, h, alpha) = mapped
+    fmt = "RGBA" if alpha else "RGB"
+    expected = w * h * len(fmt)
+    try:
+        if len(mm) - HEADER.size != expected:
+            return None
+        view = memoryview(mm)[HEADER.size:]
+        try:
+            raw = pygame.image.frombuffer(view, (w, h), fmt)
+            if pygame.display.get_surface() is not None:
+                surf = raw.convert_alpha() if alpha else raw.convert()
+            else:
+                surf = raw.copy()
+            del raw
+        finally:
+            view.release()
+        return surf
+    finally:
+        mm.close()
+
+
+# ------------------------------
+# FORMAT ΟΘΟΝΗΣ
+# ------------------------------
+# Ένα blit είναι γρήγορο μόνο όταν η εικόνα έχει ήδη το pixel format της οθόνης, και
+# ακόμα πιο γρήγορο όταν δεν χρειάζεται alpha ανά pixel (μετρήσεις: python assets.py).
+# Η επιλογή γίνεται από το ίδιο το περιεχόμενο της εικόνας:
+#   "opaque":   κανένα διάφανο pixel                   -> convert()
+#   "colorkey": pixels μόνο εντελώς διάφανα ή αδιαφανή -> convert() + colorkey με RLE
+#   "alpha":    ημιδιάφανα pixels (π.χ. λειασμένες άκρες) -> convert_alpha()
+IMAGE_MODES = ("opaque", "colorkey", "alpha")
+_KEY_CANDIDATES = ((255, 0, 255), (0, 255, 0), (0, 255, 255), (1, 2, 3))
+
+
+def display_format():
+    """Το pixel format της οθόνης (None χωρίς οθόνη): αν αλλάξει, οι εικόνες θέλουν νέο convert."""
+    screen = pygame.display.get_surface()
+    if screen is None:
+        return None
+    return screen.get_bitsize(), screen.get_masks()
+
+
+def choose_mode(surface, colorkey=None):
+    """opaque / colorkey / alpha για την εικόνα (colorkey: χρώμα που δηλώνουμε ως διάφανο)."""
+    if colorkey is not None or surface.get_colorkey() is not None:
+        return "colorkey"
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return "opaque"
+    alpha = pygame.surfarray.pixels_alpha(surface)
+    try:
+        if alpha.min() == 255:
+            return "opaque"
+        if np.count_nonzero((alpha > 0) & (alpha < 255)):
+            return "alpha"
+        return "colorkey"
+    finally:
+        del alpha   # ξεκλειδώνει την επιφάνεια
+
+
+def _binary_alpha_to_key(surface):
+    """Εικόνα με alpha μόνο 0/255 -> αντίγραφο όπου τα διάφανα pixels έχουν ένα αχρησιμοποίητο χρώμα."""
+    rgb = pygame.surfarray.array3d(surface)
+    alpha = pygame.surfarray.array_alpha(surface)
+    visible = rgb[alpha > 0]
+    key = next((k for k in _KEY_CANDIDATES if not np.all(visible == k, axis=-1).any()), _KEY_CANDIDATES[-1])
+    rgb[alpha == 0] = key
+    return pygame.surfarray.make_surface(rgb), key
+
+
+def prepare(surface, colorkey=None):
+    """
+    Η εικόνα έτοιμη για blit: (surface στο format της οθόνης, mode). Χωρίς οθόνη
+    επιστρέφεται όπως είναι (το mode ισχύει, το convert γίνεται όταν ανοίξει η οθόνη).
+    """
+    mode = choose_mode(surface, colorkey)
+    if pygame.display.get_surface() is None:
+        return surface, mode
+    if mode == "alpha":
+        return surface.convert_alpha(), mode
+    if mode == "opaque":
+        return surface.convert(), mode
+    key = colorkey if colorkey is not None else surface.get_colorkey()
+    if key is None:
+        surface, key = _binary_alpha_to_key(surface)
+    out = surface.convert()
+    # RLE: οι διάφανες «τρύπες» παραλείπονται ολόκληρες αντί να ελέγχεται κάθε pixel
+    out.set_colorkey(key, pygame.RLEACCEL)
+    return out, mode
+
+
+def load_image(path, size=None, smooth=True):
+    """
+    Όπως pygame.image.load (+ scale σε size), αλλά από το 2ο άνοιγμα διαβάζει
+    τα έτοιμα pixels από το cache. Κλειδί: hash του αρχείου + μέγεθος + τρόπος scale.
+    Επιστρέφεται μέσα από το prepare(): στο format της οθόνης, με alpha μόνο αν χρειάζεται.
+    """
+    full = _resolve(path)
+    size_tag = "orig" if size is None else f"{size[0]}x{size[1]}{'s' if smooth else 'n'}"
+    key = f"{file_hash(full)}-{size_tag}"
+
+    surf = load_surface(key)
+    if surf is None:
+        surf = pygame.image.load(full)
+        if size is not None:
+            surf = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(surf, size)
+        store_surface(key, surf)
+    return prepare(surf)[0]
+
+
+# ------------------------------
+# ΗΧΟΣ
+# ------------------------------
+def load_sound(path):
+    """
+    Όπως pygame.mixer.Sound(path), αλλά κρατάει το αποκωδικοποιημένο PCM στο cache.
+    Το PCM εξαρτάται από τις ρυθμίσεις του mixer, οπότε μπαίνουν κι αυτές στο κλειδί.
+    """
+    full = _resolve(path)
+    freq, fmt_size, channels = pygame.mixer.get_init()
+    key = f"{file_hash(full)}-{freq}_{fmt_size}_{channels}"
+    cache_path = _cache_file(key, "pcm")
+
+    mapped = _read_mapped(cache_path, SOUND_MAGIC)
+    if mapped is not None:
+        mm, (_, c_freq, c_size, c_channels) = mapped
+        try:
+            if (c_freq, c_size, c_channels) == (freq, fmt_size, channels):
+                view = memoryview(mm)[HEADER.size:]
+                try:
+                    return pygame.mixer.Sound(buffer=view)   # αντιγράφει τα bytes
+                finally:
+                    view.release()
+        finally:
+            mm.close()
+
+    sound = pygame.mixer.Sound(full)
+    _write_atomic(cache_path, HEADER.pack(SOUND_MAGIC, freq, fmt_size, channels), sound.get_raw())
+    return sound
@@ -0,0 +1,140 @@
+import os
+import time
+
+import pygame
+
+from asset_cache import display_format, load_image, prepare
+from atlas import load_atlas
+
+# ------------------------------
+# ΚΕΝΤΡΙΚΟΣ ΔΙΑΧΕΙΡΙΣΤΗΣ ΕΙΚΟΝΩΝ
+# ------------------------------
+# Όλα τα scripts παίρνουν τις εικόνες τους από το ASSETS:
+#   - κάθε εικόνα είναι στο format της οθόνης, με opaque/colorkey/alpha ανάλογα με το
+#     περιεχόμενό της (asset_cache.prepare)
+#   - κάθε μέγεθος (π.χ. το background στο μέγεθος του παραθύρου) κλιμακώνεται μία φορά
+#     και μένει έτοιμο, και στον δίσκο (asset_cache)
+#   - αν αλλάξει το format της οθόνης (νέο set_mode σε άλλο βάθος χρώματος, fullscreen),
+#     το επόμενο image()/atlas() ξανακάνει convert όλες τις εικόνες και καλεί τα
+#     on_reconvert callbacks. Γι' αυτό τα scripts ζητάνε την εικόνα σε κάθε frame
+#     (ένα dict lookup) αντί να κρατάνε το surface.
+#   python assets.py        # χρόνος ανά blit: όπως φορτώνονταν πριν / μέσω ASSETS
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class AssetManager:
+
+    def __init__(self):
+        self._images = {}      # (path, size, smooth, colorkey) -> [surface, mode, source]
+        self._atlases = {}     # (paths, name) -> Atlas
+        self._listeners = []
+        self._format = display_format()
+        self.conversions = 0
+
+    def image(self, path, size=None, smooth=True, colorkey=None):
+        """
+        Η εικόνα path (κλιμακωμένη σε size) έτοιμη για blit. colorkey: χρώμα φόντου που
+        πρέπει να φαίνεται διάφανο (π.χ. το λευκό γύρω από το player.png).
+        """
+        self.check_display()
+        key = (path, tuple(size) if size is not None else None, smooth, colorkey)
+        entry = self._images.get(key)
+        if entry is None:
+            source = load_image(path, size, smooth)
+            surface, mode = prepare(source, colorkey)
+            self.conversions += 1
+            entry = self._images[key] = [surface, mode, source]
+        return entry[0]
+
+    def mode(self, path, size=None, smooth=True, colorkey=None):
+        """opaque / colorkey / alpha: πώς θα γίνεται το blit της εικόνας."""
+        self.image(path, size, smooth, colorkey)
+        return self._images[(path, tuple(size) if size is not None else None, smooth, colorkey)][1]
+
+    def atlas(self, paths, name="atlas"):
+        """Atlas των εικόνων paths (atlas.load_atlas), ένα ανά (paths, name)."""
+        self.check_display()
+        key = (tuple(paths), name)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = load_atlas(paths, name=name)
+        return atlas
+
+    def on_reconvert(self, fn):
+        """fn() καλείται όταν οι εικόνες ξαναγίνουν convert (π.χ. για να ανανεωθεί ένα SpriteCache)."""
+        self._listeners.append(fn)
+
+    def check_display(self):
+        """Ξανακάνει convert όλες τις εικόνες αν άλλαξε το format της οθόνης· True αν έγινε."""
+        current = display_format()
+        if current == self._format:
+            return False
+        self._format = current
+        for (path, size, smooth, colorkey), entry in self._images.items():
+            entry[0], entry[1] = prepare(entry[2], colorkey)
+            self.conversions += 1
+        for key in list(self._atlases):
+            # το atlas διαβάζεται από το cache (mmap) και μπαίνει στο νέο format
+            self._atlases[key] = load_atlas(key[0], name=key[1])
+        for fn in self._listeners:
+            fn()
+        return True
+
+    def stats(self):
+        """Για το perf overlay (FrameStats.add_source)."""
+        modes = [entry[1] for entry in self._images.values()]
+        return {"images": f"{len(modes)} img", "opaque": modes.count("opaque"),
+                "colorkey": modes.count("colorkey"), "alpha": modes.count("alpha")}
+
+
+# κοινός διαχειριστής για όλα τα scripts
+ASSETS = AssetManager()
+
+
+# ---- benchmark ----
+def time_blit(screen, surface, count=2000):
+    """μs ανά blit του surface στην οθόνη."""
+    for _ in range(50):
+        screen.blit(surface, (10, 10))
+    t0 = time.perf_counter()
+    for _ in range(count):
+        screen.blit(surface, (10, 10))
+    return (time.perf_counter() - t0) / count * 1e6
+
+
+def benchmark(screen):
+    """
+    Κάθε εικόνα των scripts όπως φορτωνόταν πριν και όπως τη δίνει το ASSETS.
+    Επιστρέφει [(όνομα, μs πριν, μs τώρα, mode τώρα)].
+    """
+    w, h = screen.get_size()
+    rows = []
+
+    background = pygame.transform.scale(pygame.image.load(os.path.join(BASE_DIR, "space.jpg")), (w, h))
+    rows.append((f"space.jpg {w}x{h}, χωρίς convert", time_blit(screen, background, 300),
+                 time_blit(screen, ASSETS.image("space.jpg", (w, h), smooth=False), 300),
+                 ASSETS.mode("space.jpg", (w, h), smooth=False)))
+
+    player = pygame.transform.scale(pygame.image.load(os.path.join(BASE_DIR, "player.png")), (50, 50)).convert_alpha()
+    player.set_colorkey((255, 255, 255))
+    rows.append(("player.png 50x50, convert_alpha + colorkey", time_blit(screen, player),
+                 time_blit(screen, ASSETS.image("player.png", (50, 50), smooth=False, colorkey=(255, 255, 255))),
+                 ASSETS.mode("player.png", (50, 50), smooth=False, colorkey=(255, 255, 255))))
+
+    face = pygame.image.load(os.path.join(BASE_DIR, "dice-1.png")).convert_alpha()
+    old_face = pygame.transform.smoothscale(face, (100, 100))
+    new_face = ASSETS.atlas([f"dice-{i}.png" for i in range(1, 7)], name="dice").get("dice-1.png")
+    new_face = pygame.transform.smoothscale(new_face, (100, 100))
+    rows.append(("όψη ζαριού 100x100 από alpha atlas", time_blit(screen, old_face),
+                 time_blit(screen, new_face), "opaque" if not new_face.get_flags() & pygame.SRCALPHA else "alpha"))
+    return rows
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((700, 500))
+    print(f"{'εικόνα':45} {'πριν μs':>9} {'τώρα μs':>9}  mode")
+    for name, before, after, mode in benchmark(screen):
+        print(f"{name:45} {before:9.2f} {after:9.2f}  {mode} (x{before / after:.1f})")
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+
+import pygame
+
+from asset_cache import CACHE_DIR, choose_mode, file_hash, load_surface, store_surface
+
+DICE_FILES = [f"dice-{i}.png" for i in range(1, 7)]
+ATLAS_FORMAT = 2   # μπαίνει στο κλειδί του cache: 2 = αδιαφανές atlas όταν όλες οι εικόνες είναι αδιαφανείς
+
+
+class Atlas:
+    """
+    Πολλές μικρές εικόνες πακεταρισμένες σε ένα surface.
+    Το get() επιστρέφει subsurface: «παράθυρο» στο ίδιο surface, χωρίς αντιγραφή pixels.
+    """
+
+    def __init__(self, surface, regions):
+        self.surface = surface
+        self.regions = {name: pygame.Rect(r) for name, r in regions.items()}
+        self._views = {}
+        self._scaled = {}
+
+    def get(self, name):
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = self.surface.subsurface(self.regions[name])
+        return view
+
+    def faces(self):
+        """Οι όψεις των ζαριών 1..6 (λίστα με index 0..5)."""
+        return [self.get(name) for name in DICE_FILES]
+
+    def scaled(self, size, names=None):
+        """
+        Νέο atlas όπου κάθε εικόνα είναι κλιμακωμένη σε size (int ή (w, h)).
+        Φτιάχνεται μία φορά ανά μέγεθος.
+        """
+        if isinstance(size, int):
+            size = (size, size)
+        names = tuple(names or self.regions)
+        key = (tuple(size), names)
+        atlas = self._scaled.get(key)
+        if atlas is None:
+            images = {n: pygame.transform.smoothscale(self.get(n), size) for n in names}
+            atlas = self._scaled[key] = build_atlas(images)
+        return atlas
+
+
+def build_atlas(images, padding=1):
+    """
+    Πακετάρει τις εικόνες {όνομα: surface} σε ένα surface (shelf packing: γραμμές
+    από εικόνες, οι ψηλότερες πρώτα) και επιστρέφει Atlas.
+    """
+    order = sorted(images, key=lambda n: images[n].get_height(), reverse=True)
+    total_area = sum(images[n].get_width() * images[n].get_height() for n in order)
+    widest = max(images[n].get_width() for n in order)
+    # περίπου τετράγωνο atlas
+    max_w = max(widest, int(total_area ** 0.5) + 1) + padding
+
+    regions = {}
+    x = y = shelf_h = 0
+    for name in order:
+        w, h = images[name].get_size()
+        if x + w > max_w:
+            x = 0
+            y += shelf_h + padding
+            shelf_h = 0
+        regions[name] = (x, y, w, h)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    atlas_w = max(r[0] + r[2] for r in regions.values())
+    atlas_h = y + shelf_h
+
+    if all(choose_mode(img) == "opaque" for img in images.values()):
+        # π.χ. οι όψεις των ζαριών: χωρίς alpha κάθε blit (και κάθε scaled αντίγραφο) είναι ~5x φθηνότερο
+        surface = pygame.Surface((atlas_w, atlas_h))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        for name, (x, y, w, h) in regions.items():
+            surface.blit(images[name], (x, y))
+        return Atlas(surface, regions)
+
+    surface = pygame.Surface((atlas_w, atlas_h), pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    surface.fill((0, 0, 0, 0))
+    for name, (x, y, w, h) in regions.items():
+        # BLEND_RGBA_MAX πάνω σε διάφανο φόντο = ακριβές αντίγραφο (και του alpha)
+        surface.blit(images[name], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+    return Atlas(surface, regions)
+
+
+def load_atlas(paths, name="atlas", use_cache=True):
+    """
+    Φορτώνει τις εικόνες paths σε ένα atlas (το όνομα κάθε εικόνας είναι το basename της).
+    Αν υπάρχει έτοιμο atlas στο asset cache για τα ίδια αρχεία (ίδιο hash περιεχομένου),
+    φορτώνονται κατευθείαν τα pixels του, χωρίς κανένα decode.
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    full = [p if os.path.isabs(p) else os.path.join(base_dir, p) for p in paths]
+    for p in full:
+        if not os.path.isfile(p):
+            raise FileNotFoundError(f"Λείπει το αρχείο {p}")
+    stamp = [[os.path.basename(p), file_hash(p)] for p in full]
+    key = f"{name}-" + hashlib.sha1(json.dumps([ATLAS_FORMAT, stamp]).encode()).hexdigest()[:20]
+
+    layout_path = os.path.join(CACHE_DIR, key + ".json")
+    if use_cache and os.path.isfile(layout_path):
+        try:
+            with open(layout_path, encoding="utf-8") as f:
+                layout = json.load(f)
+            surface = load_surface(key)
+            if surface is not None and layout["sources"] == stamp:
+                return Atlas(surface, layout["regions"])
+        except (OSError, ValueError, KeyError):
+            pass  # χαλασμένο cache: το ξαναφτιάχνουμε
+
+    images = {os.path.basename(p): pygame.image.load(p) for p in full}
+    atlas = build_atlas(images)
+    if use_cache:
+        store_surface(key, atlas.surface)
+        try:
+            regions = {n: list(r) for n, r in atlas.regions.items()}
+            with open(layout_path, "w", encoding="utf-8") as f:
+                json.dump({"sources": stamp, "regions": regions}, f)
+        except OSError:
+            pass  # χωρίς cache απλώς αργεί λίγο το επόμενο άνοιγμα
+    return atlas
+
+
+def load_dice_atlas(extra=()):
+    """Atlas με τις 6 όψεις (και προαιρετικά άλλες εικόνες, π.χ. player.png)."""
+    paths = DICE_FILES + list(extra)
+    name = "dice" if not extra else "dice+" + "+".join(os.path.splitext(os.path.basename(p))[0] for p in extra)
+    return load_atlas(paths, name=name)
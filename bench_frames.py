@@ -0,0 +1,334 @@
+import argparse
+import json
+import os
+import random
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# ------------------------------
+# FRAME-TIME BENCHMARK ΓΙΑ ΚΑΘΕ SCRIPT
+# ------------------------------
+# Τρέχει κάθε script headless (SDL dummy) με προγραμματισμένο input για σταθερό
+# αριθμό frames και μετράει χρόνο ανά frame (p50/p95/p99/max) και, σε δεύτερο πέρασμα,
+# τη μνήμη ανά frame:
+#   blocks_per_frame   νέα memory blocks της Python που ζουν ακόμα στο τέλος του frame
+#                      (διαφορά του sys.getallocatedblocks(), μέσος όρος, >= 0 ανά frame)
+#   peak_kb_per_frame  πόσο ανεβαίνει η κορυφή του tracemalloc μέσα στο frame (προσωρινά)
+# Με --baseline, regression είναι: χειρότερο p50/p95/p99/max ή blocks_per_frame, script
+# που έβγαλε σφάλμα ή δεν έχει μετρήσεις, ή script του baseline που λείπει από τα αποτελέσματα.
+#   python bench_frames.py                          # όλα τα scripts -> bench_results.json
+#   python bench_frames.py --save-baseline          # κρατάει τα αποτελέσματα ως baseline
+#   python bench_frames.py --baseline bench_baseline.json   # σύγκριση, exit 1 αν χειροτέρεψε
+#   python bench_frames.py main.py --frames 300     # μόνο ένα script
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULTS = "bench_results.json"
+DEFAULT_BASELINE = "bench_baseline.json"
+REGRESSION_TOLERANCE = 0.20   # +20% στο p50/p95/p99 θεωρείται regression
+NOISE_FLOOR_MS = 0.2          # διαφορές κάτω από αυτό αγνοούνται
+# μετρική -> (ανοχή, ελάχιστη διαφορά). Το max είναι ένα μόνο frame και πολύ πιο θορυβώδες.
+REGRESSION_METRICS = {
+    "p50_ms": (REGRESSION_TOLERANCE, NOISE_FLOOR_MS),
+    "p95_ms": (REGRESSION_TOLERANCE, NOISE_FLOOR_MS),
+    "p99_ms": (REGRESSION_TOLERANCE, NOISE_FLOOR_MS),
+    "max_ms": (1.0, 5.0),
+    "blocks_per_frame": (REGRESSION_TOLERANCE, 2.0),
+}
+REQUIRED_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+# ---- Σενάρια input ----
+# Κάθε σενάριο: πόσα frames, ποια events στέλνονται σε ποιο frame και ποια πλήκτρα
+# «κρατιούνται πατημένα» (για τα scripts που διαβάζουν pygame.key.get_pressed()).
+def click(pos):
+    return [("MOUSEBUTTONDOWN", {"button": 1, "pos": pos}),
+            ("MOUSEBUTTONUP", {"button": 1, "pos": pos})]
+
+
+def key(name, char=""):
+    return [("KEYDOWN", {"key": name, "unicode": char, "mod": 0, "scancode": 0}),
+            ("KEYUP", {"key": name, "unicode": char, "mod": 0, "scancode": 0})]
+
+
+def resize(w, h):
+    return [("VIDEORESIZE", {"w": w, "h": h, "size": (w, h)})]
+
+
+def every(start, step, stop, events):
+    return {f: events for f in range(start, stop, step)}
+
+
+def merge(*schedules):
+    out = {}
+    for schedule in schedules:
+        for frame, events in schedule.items():
+            out.setdefault(frame, []).extend(events)
+    return out
+
+
+MOVE_KEYS = [("K_RIGHT", 10, 90), ("K_LEFT", 90, 170), ("K_UP", 170, 200),
+             ("K_DOWN", 200, 230), ("K_SPACE", 240, 245), ("K_SPACE", 300, 305)]
+
+SCENARIOS = {
+    "main.py": {"frames": 600, "events": every(5, 150, 600, click((400, 440)))},
+    "main_enhanced.py": {"frames": 600, "events": merge(
+        {2: key("K_2", "2"), 320: key("K_4", "4")},
+        every(150, 150, 600, click((450, 580))))},
+    "main_alternative_chatgpt.py": {"frames": 600, "events": every(5, 150, 600, click((400, 432)))},
+    "dice_thrown_from_chatgpt_prompt.py": {"frames": 600, "events": merge(
+        every(5, 150, 300, click((450, 555))),
+        {300 + i: resize(900 + i * 5, 600 + i * 5) for i in range(20)},
+        every(450, 100, 600, click((500, 649))))},
+    "simple_movable_rectangle.py": {"frames": 400, "held": MOVE_KEYS},
+    "simple_movable_rectangle_with_jump.py": {"frames": 400, "held": MOVE_KEYS},
+    "simple_movable_rectangle_with_jump.v2.py": {"frames": 400, "held": MOVE_KEYS},
+    "simple_movable_rectangle_with_jump.v2.withsound_images.py": {
+        "frames": 400, "held": MOVE_KEYS, "events": every(5, 20, 400, click((100, 100)))},
+}
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+# ---- Child: τρέχει ένα script μέσα σε αυτή τη διεργασία ----
+class _HeldKeys:
+    """Αντικαθιστά το pygame.key.get_pressed(): keys[K_LEFT] κ.λπ."""
+
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, k):
+        return k in self.held
+
+
+def run_child(script, frames, measure_alloc):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("DICE_SEED", "1")
+    # οι ρίψεις του benchmark δεν μπαίνουν στο πραγματικό ιστορικό (rolls.log)
+    os.environ.setdefault("DICE_ROLL_LOG", os.path.join(tempfile.gettempdir(), "bench_rolls.log"))
+    random.seed(1)
+    os.chdir(BASE_DIR)
+    sys.path.insert(0, BASE_DIR)
+
+    import pygame
+    import frame_pacing
+
+    scenario = SCENARIOS.get(script, {"frames": frames})
+    frames = frames or scenario["frames"]
+    schedule = scenario.get("events", {})
+    held_spec = [(getattr(pygame, k), a, b) for k, a, b in scenario.get("held", [])]
+
+    times = []
+    peak_growth = []
+    blocks = []
+    state = {"frame": 0, "t": None, "mem": 0, "blocks": 0}
+    orig_clock = pygame.time.Clock
+
+    def frame_boundary():
+        now = time.perf_counter()
+        if state["t"] is not None:
+            times.append((now - state["t"]) * 1000.0)
+        if measure_alloc:
+            current, peak = tracemalloc.get_traced_memory()
+            if state["t"] is not None:
+                # πόσο πάνω από τη μνήμη της αρχής του frame έφτασε η κορυφή του
+                peak_growth.append(max(0, peak - state["mem"]))
+            tracemalloc.reset_peak()
+            state["mem"] = current
+            allocated = sys.getallocatedblocks()
+            if state["t"] is not None:
+                blocks.append(max(0, allocated - state["blocks"]))
+            state["blocks"] = allocated
+        state["frame"] += 1
+        f = state["frame"]
+        for name, attrs in schedule.get(f, []):
+            attrs = dict(attrs)
+            if "key" in attrs:
+                attrs["key"] = getattr(pygame, attrs["key"])
+            pygame.event.post(pygame.event.Event(getattr(pygame, name), attrs))
+        if f >= frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        state["t"] = time.perf_counter()
+
+    class BenchClock:
+        """pygame.time.Clock χωρίς αναμονή: κάθε tick είναι ένα όριο frame."""
+
+        def __init__(self):
+            self._clock = orig_clock()
+
+        def tick(self, fps=0):
+            frame_boundary()
+            real = self._clock.tick()
+            # όπως το SimClock: το frame «κράτησε» 1000/fps ms, ώστε ό,τι προχωράει με τον
+            # χρόνο του tick (fixed step, dt) να τρέχει με την κανονική ταχύτητα
+            return 1000.0 / fps if fps else real
+
+        def get_fps(self):
+            return self._clock.get_fps()
+
+        def get_time(self):
+            return self._clock.get_time()
+
+    def always_active(clock, active, fps=60, idle_timeout=None):
+        # στο benchmark δεν μπλοκάρουμε ποτέ στο event.wait()
+        clock.tick(fps)
+        return pygame.event.get()
+
+    def get_pressed():
+        f = state["frame"]
+        return _HeldKeys({k for k, a, b in held_spec if a <= f < b})
+
+    class _NoMusic:
+        # headless: χωρίς background music (και χωρίς να χρειάζεται το αρχείο της)
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: None
+
+    pygame.time.Clock = BenchClock
+    frame_pacing.next_events = always_active
+    pygame.key.get_pressed = get_pressed
+    pygame.mixer.music = _NoMusic()
+
+    if measure_alloc:
+        tracemalloc.start()
+    error = None
+    try:
+        runpy.run_path(os.path.join(BASE_DIR, script), run_name="__main__")
+    except SystemExit:
+        pass
+    except Exception as e:   # το αποτέλεσμα γράφει το σφάλμα αντί να σταματήσει όλο το benchmark
+        error = f"{type(e).__name__}: {e}"
+    if measure_alloc:
+        tracemalloc.stop()
+
+    ordered = sorted(times)
+    result = {"frames": len(times)}
+    if error:
+        result["error"] = error
+    if ordered:
+        result.update({
+            "p50_ms": round(percentile(ordered, 50), 4),
+            "p95_ms": round(percentile(ordered, 95), 4),
+            "p99_ms": round(percentile(ordered, 99), 4),
+            "max_ms": round(ordered[-1], 4),
+            "mean_ms": round(sum(ordered) / len(ordered), 4),
+        })
+    if not times and not error:
+        result["error"] = "no frames"
+    if peak_growth:
+        result["peak_kb_per_frame"] = round(sum(peak_growth) / len(peak_growth) / 1024.0, 3)
+    if blocks:
+        result["blocks_per_frame"] = round(sum(blocks) / len(blocks), 2)
+    return result
+
+
+# ---- Parent: ένα subprocess ανά script, σύνοψη και σύγκριση ----
+def bench_script(script, frames):
+    def child(alloc):
+        cmd = [sys.executable, os.path.abspath(__file__), "--child", script]
+        if frames:
+            cmd += ["--frames", str(frames)]
+        if alloc:
+            cmd.append("--alloc")
+        out = subprocess.run(cmd, capture_output=True, text=True)
+        for line in reversed(out.stdout.splitlines()):
+            if line.startswith("{"):
+                return json.loads(line)
+        return {"error": (out.stderr.strip().splitlines() or ["no output"])[-1]}
+
+    result = child(alloc=False)
+    # δεύτερο πέρασμα με tracemalloc (το tracemalloc αλλοιώνει τους χρόνους, γι' αυτό χωριστά)
+    alloc = child(alloc=True)
+    for metric in ("blocks_per_frame", "peak_kb_per_frame"):
+        if metric in alloc:
+            result[metric] = alloc[metric]
+    return result
+
+
+def compare(results, baseline):
+    """Λίστα με τις regressions των results απέναντι στο baseline (κενή αν όλα καλά)."""
+    regressions = []
+    for script in baseline:
+        if script not in results:
+            regressions.append(f"{script}: λείπει από τα αποτελέσματα")
+    for script, res in results.items():
+        if "error" in res:
+            regressions.append(f"{script}: σφάλμα: {res['error']}")
+        missing = [m for m in REQUIRED_METRICS if res.get(m) is None]
+        if missing:
+            regressions.append(f"{script}: χωρίς {', '.join(missing)}")
+        base = baseline.get(script)
+        if not base:
+            continue
+        for metric, (tolerance, floor) in REGRESSION_METRICS.items():
+            new, old = res.get(metric), base.get(metric)
+            if old is None:
+                continue
+            if new is None:
+                if metric not in missing:
+                    regressions.append(f"{script}: {metric} {old:.3f} -> χωρίς τιμή")
+                continue
+            if new > old * (1 + tolerance) and new - old > floor:
+                regressions.append(f"{script}: {metric} {old:.3f} -> {new:.3f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame-time benchmark για κάθε script")
+    parser.add_argument("scripts", nargs="*", help="ποια scripts (default: όλα)")
+    parser.add_argument("--frames", type=int, default=0, help="frames ανά script (default: του σεναρίου)")
+    parser.add_argument("--out", default=DEFAULT_RESULTS)
+    parser.add_argument("--baseline", help="JSON με παλιότερα αποτελέσματα για σύγκριση")
+    parser.add_argument("--save-baseline", action="store_true", help=f"γράφει και το {DEFAULT_BASELINE}")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--alloc", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.frames, args.alloc)))
+        return 0
+
+    scripts = args.scripts or list(SCENARIOS)
+    results = {}
+    print(f"{'script':58} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'blocks':>7} {'peakKB':>7}")
+    for script in scripts:
+        res = results[script] = bench_script(script, args.frames)
+        if "p50_ms" not in res:
+            print(f"{script:58} ΣΦΑΛΜΑ: {res.get('error', 'no frames')}")
+            continue
+        print(f"{script:58} {res['p50_ms']:7.3f} {res['p95_ms']:7.3f} {res['p99_ms']:7.3f} "
+              f"{res['max_ms']:7.3f} {res.get('blocks_per_frame', 0):7.1f} {res.get('peak_kb_per_frame', 0):7.2f}")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    if args.save_baseline:
+        with open(DEFAULT_BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if args.scripts:
+            # μόνο τα scripts που ζητήθηκαν· τα υπόλοιπα δεν «λείπουν»
+            baseline = {k: v for k, v in baseline.items() if k in scripts}
+        regressions = compare(results, baseline)
+        for line in regressions:
+            print("REGRESSION:", line)
+        if regressions:
+            return 1
+        print("Καμία regression σε σχέση με το baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
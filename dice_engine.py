@@ -0,0 +1,126 @@
+import sys
+import time
+
+import numpy as np
+
+# ------------------------------
+# ΚΑΝΟΝΕΣ ΡΙΨΗΣ (ίδιοι με το DiceRoller.start_roll)
+# ------------------------------
+DURATION_RANGE = (0.8, 1.8)    # πόσο «γυρίζει» κάθε ζάρι σε δευτερόλεπτα
+INTERVAL_RANGE = (0.05, 0.12)  # κάθε πότε αλλάζει όψη
+FACES = 6
+
+
+class RollBatch:
+    """
+    Ένα πακέτο από ρίψεις σε μορφή πινάκων (rolls x dice).
+    faces: τελικές όψεις 1..6, durations/intervals: ο χρόνος animation ανά ζάρι.
+    """
+
+    def __init__(self, faces, durations=None, intervals=None):
+        self.faces = faces
+        self.durations = durations
+        self.intervals = intervals
+
+    @property
+    def rolls(self):
+        return self.faces.shape[0]
+
+    @property
+    def dice(self):
+        return self.faces.shape[1]
+
+    def sums(self):
+        """Άθροισμα κάθε ρίψης (ένας αριθμός ανά γραμμή)."""
+        return roll_sums(self.faces)
+
+    def histogram(self):
+        """Πόσες φορές βγήκε η κάθε όψη 1..6 (πίνακας 6 θέσεων)."""
+        return face_histogram(self.faces)
+
+    def changes(self):
+        """
+        Πόσες φορές αλλάζει όψη κάθε ζάρι μέχρι να σταματήσει.
+        Όπως στο update_rolling: αλλαγή στο t=0, t=interval, t=2*interval, ... όσο t < duration.
+        """
+        if self.durations is None:
+            return None
+        return np.ceil(self.durations / self.intervals).astype(np.int32)
+
+    def animation_time(self):
+        """Πόσο κρατάει το animation κάθε ρίψης (μέχρι να σταματήσει και το τελευταίο ζάρι)."""
+        if self.durations is None:
+            return None
+        return self.durations.max(axis=1)
+
+
+def roll_sums(faces):
+    # uint16 φτάνει για 10.000 ζάρια (max 60.000)
+    return faces.sum(axis=1, dtype=np.uint16 if faces.shape[1] <= 10000 else np.uint32)
+
+
+def face_histogram(faces):
+    return np.bincount(faces.ravel(), minlength=FACES + 1)[1:]
+
+
+def sum_histogram(sums, dice):
+    """Συχνότητες για κάθε δυνατό άθροισμα από dice έως 6*dice (index 0 -> άθροισμα dice)."""
+    return np.bincount(sums, minlength=FACES * dice + 1)[dice:]
+
+
+class RollEngine:
+    """
+    Headless μηχανή ρίψεων: ίδιοι κανόνες με το DiceRoller, χωρίς pygame.
+    Όλες οι ρίψεις ενός πακέτου βγαίνουν με μία κλήση του NumPy αντί για randint ανά ζάρι.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+
+    def roll(self, rolls, dice, timing=True):
+        faces = self.rng.integers(1, FACES + 1, size=(rolls, dice), dtype=np.uint8)
+        if not timing:
+            return RollBatch(faces)
+        # float32 φτάνει για χρόνους animation και είναι 2x φθηνότερο από float64
+        durations = self.rng.random((rolls, dice), dtype=np.float32)
+        durations *= DURATION_RANGE[1] - DURATION_RANGE[0]
+        durations += DURATION_RANGE[0]
+        intervals = self.rng.random((rolls, dice), dtype=np.float32)
+        intervals *= INTERVAL_RANGE[1] - INTERVAL_RANGE[0]
+        intervals += INTERVAL_RANGE[0]
+        return RollBatch(faces, durations, intervals)
+
+    def simulate(self, rolls, dice, chunk=1_000_000):
+        """
+        Τρέχει πολλές ρίψεις σε κομμάτια (για να μη γεμίσει η μνήμη)
+        και επιστρέφει (ιστόγραμμα όψεων, ιστόγραμμα αθροισμάτων).
+        """
+        faces_hist = np.zeros(FACES, dtype=np.int64)
+        sums_hist = np.zeros(FACES * dice - dice + 1, dtype=np.int64)
+        per_chunk = max(1, chunk // dice)
+        done = 0
+        while done < rolls:
+            n = min(per_chunk, rolls - done)
+            batch = self.roll(n, dice, timing=False)
+            faces_hist += batch.histogram()
+            sums_hist += sum_histogram(batch.sums(), dice)
+            done += n
+        return faces_hist, sums_hist
+
+
+if __name__ == "__main__":
+    # γρήγορο benchmark: python dice_engine.py [ρίψεις] [ζάρια]
+    rolls = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    dice = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    engine = RollEngine(seed=1)
+
+    t0 = time.perf_counter()
+    batch = engine.roll(rolls, dice)
+    sums = batch.sums()
+    hist = batch.histogram()
+    elapsed = time.perf_counter() - t0
+
+    print(f"{rolls} ρίψεις x {dice} ζάρια σε {elapsed*1000:.1f} ms "
+          f"-> {rolls*dice/elapsed/1e6:.1f}M ζάρια/δευτ.")
+    print("Όψεις 1..6:", hist.tolist())
+    print("Μέσο άθροισμα:", float(sums.mean()))
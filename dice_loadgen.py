@@ -0,0 +1,131 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from dice_server import DEFAULT_HOST, DEFAULT_PORT
+
+# ------------------------------
+# LOAD GENERATOR ΓΙΑ ΤΟ dice_server.py
+# ------------------------------
+# N συνδέσεις, η καθεμία στέλνει --pipeline requests μαζί και περιμένει τις απαντήσεις
+# πριν στείλει τα επόμενα. Τυπώνει requests/δευτ. και latency ανά «κύμα» requests.
+#   python dice_loadgen.py --spawn                        # ξεκινάει και τον server
+#   python dice_loadgen.py --spawn --http --pipeline 64   # ίδιο μέσω HTTP keep-alive
+#   python dice_loadgen.py --spawn --batch 1000           # batch requests των 1000 ρίψεων
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_request(args):
+    if args.batch:
+        req = {"op": "batch", "dice": args.dice, "rolls": args.batch, "sums_only": True}
+    else:
+        req = {"op": "roll", "dice": args.dice}
+    if args.http:
+        body = json.dumps(req).encode()
+        return (f"POST /{req['op']} HTTP/1.1\r\nHost: {args.host}\r\nContent-Length: {len(body)}\r\n\r\n"
+                .encode() + body)
+    return json.dumps(req).encode() + b"\n"
+
+
+async def read_http_responses(reader, count):
+    for _ in range(count):
+        length = 0
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("server closed the connection")
+            if line == b"\r\n":
+                break
+            if line[:15].lower() == b"content-length:":
+                length = int(line[15:])
+        await reader.readexactly(length)
+
+
+async def read_line_responses(reader, count):
+    for _ in range(count):
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+
+
+async def client(args, requests, waves):
+    reader, writer = await asyncio.open_connection(args.host, args.port, limit=1 << 22)
+    request = make_request(args)
+    read = read_http_responses if args.http else read_line_responses
+    done = 0
+    while done < requests:
+        n = min(args.pipeline, requests - done)
+        t0 = time.perf_counter()
+        writer.write(request * n)
+        await writer.drain()
+        await read(reader, n)
+        waves.append((time.perf_counter() - t0) * 1000.0)
+        done += n
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(args):
+    waves = []
+    per_client = args.requests // args.connections
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(args, per_client, waves) for _ in range(args.connections)))
+    elapsed = time.perf_counter() - t0
+    total = per_client * args.connections
+    waves.sort()
+    kind = "HTTP" if args.http else "JSON γραμμές"
+    what = f"batch x{args.batch}" if args.batch else "roll"
+    print(f"{kind}, {what}, {args.connections} συνδέσεις, pipeline {args.pipeline}: "
+          f"{total} requests σε {elapsed:.2f} s -> {total / elapsed:,.0f} requests/δευτ."
+          + (f" ({total * args.batch / elapsed:,.0f} ρίψεις/δευτ.)" if args.batch else ""))
+    print(f"latency ανά κύμα {args.pipeline} requests: p50 {waves[len(waves) // 2]:.2f} ms, "
+          f"p99 {waves[int(len(waves) * 0.99)]:.2f} ms")
+
+
+async def wait_for_server(host, port, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator για το dice_server.py")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--spawn", action="store_true", help="ξεκινάει τον server σε subprocess")
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=400_000)
+    parser.add_argument("--pipeline", type=int, default=256, help="requests ανά κύμα σε κάθε σύνδεση")
+    parser.add_argument("--dice", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=0, help="batch requests με τόσες ρίψεις")
+    parser.add_argument("--http", action="store_true")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, "dice_server.py"),
+                                   "--host", args.host, "--port", str(args.port)],
+                                  stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_for_server(args.host, args.port))
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from dice_engine import FACES, RollEngine
+
+# ------------------------------
+# ΥΠΗΡΕΣΙΑ ΡΙΨΕΩΝ ΣΤΟ ΔΙΚΤΥΟ (asyncio)
+# ------------------------------
+# Ένα process που ρίχνει ζάρια για πολλούς clients (kiosks, bots), με την ίδια μηχανή
+# (dice_engine.RollEngine) που χρησιμοποιεί το DiceRoller. Στην ίδια θύρα μιλάει:
+#
+# 1) JSON ανά γραμμή (TCP). Ο client μπορεί να στείλει πολλές γραμμές χωρίς να περιμένει
+#    (pipelining)· οι απαντήσεις έρχονται με την ίδια σειρά.
+#      {"id": 1, "op": "roll", "dice": 2}                -> {"id": 1, "faces": [3, 5], "sum": 8}
+#      {"op": "roll", "dice": 2, "timing": true}         -> + "durations", "intervals" (όπως στο start_roll)
+#      {"op": "batch", "dice": 2, "rolls": 1000}         -> {"faces": [[..], ...], "sums": [...]}
+#      {"op": "batch", "dice": 2, "rolls": 1000, "sums_only": true}
+#      {"op": "seed", "seed": 42}                        -> οι επόμενες ρίψεις της σύνδεσης από seed 42
+#      {"op": "stats"}                                   -> μετρητές του server
+# 2) HTTP/1.1 (keep-alive, pipelining):
+#      GET /roll?dice=2&seed=42     GET /batch?dice=2&rolls=100&sums_only=1     GET /stats
+#      POST /roll με σώμα ένα JSON request όπως παραπάνω
+#
+#   python dice_server.py --port 8765
+#   python dice_loadgen.py --spawn          # μέτρηση requests/δευτ.
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_DICE = 10000              # ανά ρίψη
+MAX_BATCH_DICE = 2_000_000    # rolls * dice ανά batch request
+MAX_LINE = 1 << 16            # bytes: μεγαλύτερη γραμμή/HTTP header -> κλείνει η σύνδεση
+FACE_BUFFER = 1 << 16         # όψεις που βγαίνουν μαζί από το rng κάθε session
+HTTP_METHODS = (b"GET ", b"POST", b"HEAD")
+
+
+class RequestError(Exception):
+    pass
+
+
+class Session:
+    """
+    Οι ρίψεις μίας σύνδεσης. Χωρίς seed παίρνει τυχαίο (από το SeedSequence του server).
+    Οι απλές ρίψεις βγαίνουν από ένα buffer με FACE_BUFFER όψεις (μία κλήση NumPy για
+    χιλιάδες requests)· με timing=true καλείται το engine.roll(1, dice) όπως στο start_roll.
+    """
+
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed):
+        self.seed = seed
+        self.engine = RollEngine(seed)
+        self._faces = np.zeros(0, dtype=np.uint8)
+        self._pos = 0
+
+    def faces(self, count):
+        if self._pos + count > len(self._faces):
+            size = max(FACE_BUFFER, count)
+            rest = self._faces[self._pos:]
+            fresh = self.engine.rng.integers(1, FACES + 1, size=size, dtype=np.uint8)
+            self._faces = np.concatenate((rest, fresh)) if len(rest) else fresh
+            self._pos = 0
+        out = self._faces[self._pos:self._pos + count]
+        self._pos += count
+        return out
+
+
+QUERY_INTS = ("dice", "rolls", "seed")
+QUERY_FLAGS = {"1": True, "true": True, "0": False, "false": False, "": False}
+
+
+def _int(req, name, default, lo, hi):
+    # μόνο JSON ακέραιος: όχι 2.9, true ή "3" (το query string μετατρέπεται στο _http_request)
+    value = req.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RequestError(f"{name} must be an integer")
+    if not lo <= value <= hi:
+        raise RequestError(f"{name} must be between {lo} and {hi}")
+    return value
+
+
+def _flag(req, name):
+    value = req.get(name, False)
+    if not isinstance(value, bool):
+        raise RequestError(f"{name} must be true or false")
+    return value
+
+
+def _seed(value):
+    """Το seed ενός request: ακέραιος >= 0 (όχι bool) ή None."""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise RequestError("seed must be a non-negative integer or null")
+    return value
+
+
+class DiceService:
+    """Η λογική των requests, ανεξάρτητη από το πρωτόκολλο (line JSON ή HTTP)."""
+
+    def __init__(self, seed=None):
+        self._seeds = np.random.SeedSequence(seed)
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rolls = 0
+        self.connections = 0
+        self.errors = 0
+
+    def new_session(self, seed=None):
+        if seed is None:
+            # ανεξάρτητη ροή για κάθε σύνδεση (spawn από κοινό SeedSequence)
+            seed = self._seeds.spawn(1)[0]
+        return Session(seed)
+
+    def handle(self, req, session):
+        """Ένα request (dict) -> απάντηση (dict)."""
+        self.requests += 1
+        try:
+            if not isinstance(req, dict):
+                raise RequestError("request must be a JSON object")
+            op = req.get("op", "roll")
+            if op == "roll":
+                resp = self._roll(req, session)
+            elif op == "batch":
+                resp = self._batch(req, session)
+            elif op == "seed":
+                seed = _seed(req.get("seed"))
+                session.reseed(seed if seed is not None else self._seeds.spawn(1)[0])
+                resp = {"seed": seed}
+            elif op == "stats":
+                resp = self.stats()
+            else:
+                raise RequestError(f"unknown op {op!r}")
+        except RequestError as e:
+            self.errors += 1
+            resp = {"error": str(e)}
+        if isinstance(req, dict) and "id" in req:
+            resp["id"] = req["id"]
+        return resp
+
+    def _roll(self, req, session):
+        dice = _int(req, "dice", 2, 1, MAX_DICE)
+        timing = _flag(req, "timing")
+        self.rolls += 1
+        if timing:
+            batch = session.engine.roll(1, dice)
+            faces = batch.faces[0]
+            return {"faces": faces.tolist(), "sum": int(faces.sum()),
+                    "durations": np.round(batch.durations[0].astype(np.float64), 4).tolist(),
+                    "intervals": np.round(batch.intervals[0].astype(np.float64), 4).tolist()}
+        faces = session.faces(dice).tolist()
+        return {"faces": faces, "sum": sum(faces)}
+
+    def _batch(self, req, session):
+        dice = _int(req, "dice", 2, 1, MAX_DICE)
+        rolls = _int(req, "rolls", 1, 1, MAX_BATCH_DICE // dice)
+        sums_only = _flag(req, "sums_only")
+        faces = session.engine.roll(rolls, dice, timing=False).faces
+        self.rolls += rolls
+        resp = {"sums": faces.sum(axis=1, dtype=np.int32).tolist()}
+        if not sums_only:
+            resp["faces"] = faces.tolist()
+        return resp
+
+    def stats(self):
+        elapsed = time.perf_counter() - self.started
+        return {"requests": self.requests, "rolls": self.rolls, "errors": self.errors,
+                "connections": self.connections, "uptime_s": round(elapsed, 3),
+                "requests_per_s": round(self.requests / elapsed, 1) if elapsed else 0.0}
+
+
+def _dumps(obj):
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _http_response(status, payload, close=False, head_only=False):
+    """head_only (HEAD): ίδια headers με το GET, με το Content-Length του σώματος, χωρίς σώμα."""
+    return (f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n{'Connection: close' if close else 'Connection: keep-alive'}\r\n\r\n"
+            .encode() + (b"" if head_only else payload))
+
+
+class DiceProtocol(asyncio.Protocol):
+    """
+    Μία σύνδεση. Διαβάζει ό,τι έφτασε, απαντάει σε όλα τα πλήρη requests με τη σειρά
+    και τα γράφει με ένα transport.write (ένα syscall για όλο το pipeline).
+    Το πρωτόκολλο (γραμμές JSON ή HTTP) αποφασίζεται από τα πρώτα bytes.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.session = None
+        self.transport = None
+        self.buffer = b""
+        self.http = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.session = self.service.new_session()
+        self.service.connections += 1
+
+    def connection_lost(self, exc):
+        self.service.connections -= 1
+
+    def data_received(self, data):
+        self.buffer += data
+        if self.http is None:
+            # όσο τα πρώτα bytes μπορεί να είναι αρχή μεθόδου HTTP και δεν ήρθε γραμμή, περιμένουμε
+            head = self.buffer[:4]
+            if len(head) < 4 and b"\n" not in head and any(m.startswith(head) for m in HTTP_METHODS):
+                return
+            self.http = head in HTTP_METHODS
+        out = self._http() if self.http else self._lines()
+        if out:
+            self.transport.write(b"".join(out))
+        if len(self.buffer) > MAX_LINE:
+            self.transport.close()
+
+    def _lines(self):
+        *lines, self.buffer = self.buffer.split(b"\n")
+        out = []
+        handle = self.service.handle
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                req = json.loads(line)
+            except (ValueError, RecursionError):
+                self.service.errors += 1
+                resp = {"error": "invalid JSON"}
+            else:
+                resp = handle(req, self.session)
+            out.append(_dumps(resp).encode() + b"\n")
+        return out
+
+    def _http(self):
+        out = []
+        while True:
+            end = self.buffer.find(b"\r\n\r\n")
+            if end < 0:
+                return out
+            head = self.buffer[:end].decode("latin-1").split("\r\n")
+            headers = {}
+            for h in head[1:]:
+                name, _, value = h.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get("content-length", "0") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # χωρίς έγκυρο μήκος σώματος δεν ξέρουμε πού αρχίζει το επόμενο request
+                self.service.errors += 1
+                out.append(_http_response("400 Bad Request", _dumps({"error": "invalid Content-Length"}).encode(),
+                                          close=True))
+                self.buffer = b""
+                self.transport.write(b"".join(out))
+                self.transport.close()
+                return []
+            if len(self.buffer) < end + 4 + length:
+                return out   # το σώμα δεν έφτασε ακόμα
+            body = self.buffer[end + 4:end + 4 + length]
+            self.buffer = self.buffer[end + 4 + length:]
+            parts = head[0].split()
+            method = parts[0] if parts else ""
+            status, payload = self._http_request(method, parts[1] if len(parts) > 1 else "/", body)
+            close = headers.get("connection", "").lower() == "close"
+            out.append(_http_response(status, payload, close, head_only=method == "HEAD"))
+            if close:
+                self.transport.write(b"".join(out))
+                self.transport.close()
+                return []
+
+    def _http_request(self, method, target, body):
+        url = urlsplit(target)
+        if url.path not in ("/roll", "/batch", "/stats"):
+            return "404 Not Found", _dumps({"error": "not found"}).encode()
+        if method == "POST":
+            try:
+                req = json.loads(body or b"{}")
+            except (ValueError, RecursionError):
+                return "400 Bad Request", _dumps({"error": "invalid JSON"}).encode()
+        else:
+            req = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+            # το query string έχει μόνο strings: ό,τι δεν μετατρέπεται μένει string και το
+            # _int/_seed/_flag απαντάει με error
+            for name in QUERY_INTS:
+                if name in req:
+                    try:
+                        req[name] = int(req[name])
+                    except ValueError:
+                        pass
+            for flag in ("timing", "sums_only"):
+                if flag in req:
+                    req[flag] = QUERY_FLAGS.get(req[flag].lower(), req[flag])
+        if isinstance(req, dict):
+            req.setdefault("op", url.path[1:])
+        session = self.session
+        if isinstance(req, dict) and req.get("seed") is not None and req.get("op") != "seed":
+            try:
+                session = Session(_seed(req["seed"]))   # ίδιο seed -> ίδια ρίψη, χωρίς κατάσταση
+            except RequestError as e:
+                self.service.errors += 1
+                return "400 Bad Request", _dumps({"error": str(e)}).encode()
+        resp = self.service.handle(req, session)
+        status = "400 Bad Request" if "error" in resp else "200 OK"
+        return status, _dumps(resp).encode()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, seed=None, ready=None):
+    service = DiceService(seed)
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: DiceProtocol(service), host, port)
+    addr = server.sockets[0].getsockname()
+    print(f"dice server στο {addr[0]}:{addr[1]}", flush=True)
+    if ready is not None:
+        ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Υπηρεσία ρίψεων ζαριών (JSON γραμμές / HTTP)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, help="seed για τα seeds των sessions (αναπαραγώγιμος server)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,52 @@
+# first import: starts the startup timer (import/init/assets/first_frame breakdown)
+from startup import STARTUP, find_file, get_font, init_pygame
 import os
 import sys
-import random
 import pygame
 
+from assets import ASSETS
+from atlas import DICE_FILES
+from die_state import CyclingDieState as DieState
+from sim_clock import RealClock, make_rng
+from sound_loader import SOUND_LOADED, SoundLoader
+from sprite_cache import SPRITE_CACHE
+from text_cache import render_text
+
 # main.py
 
-pygame.init()
-pygame.mixer.init()
+STARTUP.mark("import")
+
+# only the subsystems we use: display, font, and the mixer only if there is a sound file
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SOUND_NAMES = ("dice-sound.mp3", "dice-sound.wav")
+sound_path = find_file(SOUND_NAMES, base_dir=SCRIPT_DIR)
+mixer_ok = init_pygame(font=True, sound=sound_path is not None)
+# optional sound, decoded on a background thread while the images load (mp3, then wav)
+sound_loader = SoundLoader(SOUND_NAMES, base_dir=SCRIPT_DIR) if mixer_ok else None
 
 # Window
 W, H = 900, 600
 screen = pygame.display.set_mode((W, H), pygame.RESIZABLE)
 pygame.display.set_caption("")
 
-# Load dice images 1..6
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-dice_imgs_orig = []
-for i in range(1, 7):
-    path = os.path.join(SCRIPT_DIR, f"dice-{i}.png")
-    if not os.path.isfile(path):
-        raise FileNotFoundError(f"Missing image: {path}")
-    dice_imgs_orig.append(pygame.image.load(path).convert_alpha())
-
-# Try to load sound (optional)
-sound = None
-for sname in ("dice-sound.mp3", "dice-sound.wav"):
-    spath = os.path.join(SCRIPT_DIR, sname)
-    if os.path.isfile(spath):
-        try:
-            sound = pygame.mixer.Sound(spath)
-        except Exception:
-            sound = None
-        break
-
-font = pygame.font.Font(None, 36)
+STARTUP.mark("init")
+
+# Load dice images 1..6 (one atlas surface, faces are subsurface views)
+def load_faces():
+    global dice_imgs_orig
+    dice_imgs_orig = ASSETS.atlas(DICE_FILES, name="dice").faces()
+    SPRITE_CACHE.set_faces(dice_imgs_orig)
+
+load_faces()
+# a new display pixel format (e.g. another depth or fullscreen) re-converts the atlas
+ASSETS.on_reconvert(load_faces)
+
+font = get_font(36)
 BUTTON_LABEL = "Ρίξε"
 
-clock = pygame.time.Clock()
+clock = RealClock()
+# all dice randomness comes from one seeded rng (DICE_SEED=... replays a session)
+rng = make_rng()
 
 # Layout parameters (will be recalculated)
 button_rect = pygame.Rect(0, 0, 160, 64)
@@ -44,7 +54,13 @@ left_rect = pygame.Rect(0, 0, 100, 100)
 right_rect = pygame.Rect(0, 0, 100, 100)
 scaled_images = []  # list of lists for faces 1..6 (index 0..5)
 
-def recompute_layout(win_w, win_h):
+# Resize debounce: while the window edge is being dragged we only do a cheap
+# nearest-neighbour scale from the mip chain; the smoothscale happens once the
+# size has not changed for RESIZE_SETTLE seconds.
+RESIZE_SETTLE = 0.15
+resize_settle_at = None  # time when the pending high-quality rescale is due
+
+def recompute_layout(win_w, win_h, fast=False):
     global button_rect, left_rect, right_rect, scaled_images
     button_h = max(48, int(win_h * 0.11))
     button_w = max(120, int(win_w * 0.18))
@@ -64,59 +80,34 @@ def recompute_layout(win_w, win_h):
     right_rect.center = (3 * win_w // 4, (win_h - button_h) // 2)
 
     # Scale images preserving aspect ratio to square bounding box
+    # (shared cache: sizes seen before are reused instead of re-scaled;
+    # fast=True uses the nearest mip level and nearest-neighbour scaling)
     scaled_images = []
-    for surf in dice_imgs_orig:
+    for face, surf in enumerate(dice_imgs_orig, start=1):
         img_w, img_h = surf.get_size()
         scale = min(size / img_w, size / img_h)
-        new_surf = pygame.transform.smoothscale(surf, (max(1, int(img_w*scale)), max(1, int(img_h*scale))))
-        scaled_images.append(new_surf)
-
+        target = (img_w*scale, img_h*scale)
+        if fast:
+            scaled_images.append(SPRITE_CACHE.quick(face, target))
+        else:
+            scaled_images.append(SPRITE_CACHE.get(face, target))
+
+# precompute the power-of-two mip levels used while resizing
+for face in range(1, 7):
+    SPRITE_CACHE.mip_levels(face)
 recompute_layout(W, H)
+STARTUP.mark("assets")
 
-# Die state
-class DieState:
-    def __init__(self):
-        self.animating = False
-        self.final_face = 1
-        self.duration = 0.0
-        self.change_interval = 0.1
-        self.start_time = 0.0
-        self.last_change = 0.0
-        self.current_face = 1
-        self.initial_phase = 0.0
-
-    def start(self, now):
-        self.final_face = random.randint(1, 6)
-        self.duration = random.uniform(0.8, 1.6)
-        self.change_interval = random.uniform(0.06, 0.12)
-        self.initial_phase = random.uniform(0, self.change_interval)
-        self.start_time = now
-        self.last_change = now - self.initial_phase
-        # Start from face 1 so animation cycles 1..6 (no extra randomness during cycling)
-        self.current_face = 1
-        self.animating = True
-
-    def update(self, now):
-        if not self.animating:
-            return
-        # advance faces cyclically based on change_interval
-        if now - self.last_change >= self.change_interval:
-            steps = int((now - self.last_change) / self.change_interval)
-            self.last_change += steps * self.change_interval
-            # advance steps times through 1..6
-            self.current_face = ((self.current_face - 1 + steps) % 6) + 1
-        # stop if duration elapsed
-        if now - self.start_time >= self.duration:
-            self.animating = False
-            self.current_face = self.final_face
-
-left_die = DieState()
-right_die = DieState()
+# Die state (shared state machine, see die_state.py)
+left_die = DieState(rng)
+right_die = DieState(rng)
 
 # Sound control
 sound_channel = None
 def ensure_sound_playing():
     global sound_channel
+    # None until the background loader has finished
+    sound = sound_loader.sound if sound_loader else None
     if sound and sound_channel is None:
         sound_channel = sound.play(loops=-1)
     elif sound and sound_channel and not sound_channel.get_busy():
@@ -131,14 +122,14 @@ def stop_sound():
 running = True
 while running:
     dt = clock.tick(60) / 1000.0
-    now = pygame.time.get_ticks() / 1000.0
+    now = clock.get_ticks() / 1000.0
+    new_size = None
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.VIDEORESIZE:
-            W, H = event.w, event.h
-            screen = pygame.display.set_mode((W, H), pygame.RESIZABLE)
-            recompute_layout(W, H)
+            # a drag sends many of these per frame: only the last one matters
+            new_size = (event.w, event.h)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if button_rect.collidepoint(event.pos):
                 # start new throw only if neither die animating
@@ -146,8 +137,20 @@ while running:
                     left_die.start(now)
                     right_die.start(now)
                     # ensure they have different initial phases (already random)
-                    if sound:
-                        ensure_sound_playing()
+                    ensure_sound_playing()
+        elif event.type == SOUND_LOADED and (left_die.animating or right_die.animating):
+            ensure_sound_playing()  # sound arrived in the middle of a throw
+
+    if new_size is not None:
+        W, H = new_size
+        screen = pygame.display.set_mode((W, H), pygame.RESIZABLE)
+        ASSETS.check_display()
+        recompute_layout(W, H, fast=True)
+        resize_settle_at = now + RESIZE_SETTLE
+    elif resize_settle_at is not None and now >= resize_settle_at:
+        # the drag has settled: one high-quality smoothscale
+        recompute_layout(W, H)
+        resize_settle_at = None
 
     # update dice
     left_die.update(now)
@@ -175,11 +178,12 @@ while running:
     # border subtle
     pygame.draw.rect(screen, (80, 80, 80), button_rect, 2, border_radius=8)
     # label
-    label_surf = font.render(BUTTON_LABEL, True, (230, 230, 230))
+    label_surf = render_text(font, BUTTON_LABEL, True, (230, 230, 230))
     label_rect = label_surf.get_rect(center=button_rect.center)
     screen.blit(label_surf, label_rect)
 
     pygame.display.flip()
+    STARTUP.first_frame()
 
 pygame.quit()
 sys.exit()
\ No newline at end of file
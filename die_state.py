@@ -0,0 +1,157 @@
+import random
+
+# Die state machines shared by the two-dice scripts.
+# Time always comes in as an argument and randomness from an injectable rng
+# (anything with randint/uniform, e.g. random.Random(seed)), so the same seed and
+# the same clock give the same face sequence, with or without a window.
+
+
+class DieState:
+    """main_alternative_chatgpt.py: time in ms, faces 0..5, final face chosen at start."""
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self.rolling = False
+        self.final_face = 0  # index 0..5
+        self.duration = 1.0
+        self.interval = 0.08
+        self.start_time = 0.0
+        self.next_change = 0.0
+        self.current_face = 0  # index 0..5
+
+    def start(self, now_ms):
+        self.final_face = self.rng.randint(0, 5)
+        self.duration = self.rng.uniform(0.8, 1.6)
+        self.interval = self.rng.uniform(0.06, 0.12)
+        self.start_time = now_ms
+        self.next_change = now_ms + int(self.interval * 1000)
+        self.current_face = self.rng.randint(0, 5)  # random initial phase
+        self.rolling = True
+
+    def update(self, now_ms):
+        if not self.rolling:
+            return
+        elapsed = (now_ms - self.start_time) / 1000.0
+        if elapsed >= self.duration:
+            # lock to final face
+            self.current_face = self.final_face
+            self.rolling = False
+            return
+        # advance in cycle 1->2->3->4->5->6->1...
+        if now_ms >= self.next_change:
+            # advance by however many intervals passed to stay consistent
+            passed = now_ms - self.next_change
+            steps = 1 + int(passed / int(self.interval * 1000)) if self.interval > 0 else 1
+            self.current_face = (self.current_face + steps) % 6
+            self.next_change += int(steps * self.interval * 1000)
+
+    @property
+    def active(self):
+        return self.rolling
+
+    @property
+    def face(self):
+        """Current face as 1..6."""
+        return self.current_face + 1
+
+
+class CyclingDieState:
+    """dice_thrown_from_chatgpt_prompt.py: time in seconds, faces 1..6 cycling in order."""
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self.animating = False
+        self.final_face = 1
+        self.duration = 0.0
+        self.change_interval = 0.1
+        self.start_time = 0.0
+        self.last_change = 0.0
+        self.current_face = 1
+        self.initial_phase = 0.0
+
+    def start(self, now):
+        self.final_face = self.rng.randint(1, 6)
+        self.duration = self.rng.uniform(0.8, 1.6)
+        self.change_interval = self.rng.uniform(0.06, 0.12)
+        self.initial_phase = self.rng.uniform(0, self.change_interval)
+        self.start_time = now
+        self.last_change = now - self.initial_phase
+        # Start from face 1 so animation cycles 1..6 (no extra randomness during cycling)
+        self.current_face = 1
+        self.animating = True
+
+    def update(self, now):
+        if not self.animating:
+            return
+        # advance faces cyclically based on change_interval
+        if now - self.last_change >= self.change_interval:
+            steps = int((now - self.last_change) / self.change_interval)
+            self.last_change += steps * self.change_interval
+            # advance steps times through 1..6
+            self.current_face = ((self.current_face - 1 + steps) % 6) + 1
+        # stop if duration elapsed
+        if now - self.start_time >= self.duration:
+            self.animating = False
+            self.current_face = self.final_face
+
+    @property
+    def active(self):
+        return self.animating
+
+    @property
+    def face(self):
+        return self.current_face
+
+
+class RandomDieState:
+    """main.py: time in seconds, a new random face 1..6 every interval until end_time."""
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self.rolling = False
+        self.face = 1
+        self.interval = 0.1
+        self.next_change = 0.0
+        self.end_time = 0.0
+
+    def start(self, now):
+        self.face = self.rng.randint(1, 6)               # face shown right now
+        self.interval = self.rng.uniform(0.06, 0.12)     # how often it changes
+        self.next_change = now                           # when the next change happens
+        self.end_time = now + self.rng.uniform(0.8, 1.6)  # when it stops changing
+        self.rolling = True
+
+    def update(self, now):
+        if not self.rolling:
+            return
+        if now < self.end_time:
+            if now >= self.next_change:
+                self.face = self.rng.randint(1, 6)
+                self.next_change = now + self.interval
+        else:
+            self.rolling = False
+
+    @property
+    def active(self):
+        return self.rolling
+
+
+def run_session(dice, clock, fps=60, max_frames=100000):
+    """
+    Rolls the given dice once, driven by clock (normally a SimClock), and returns
+    the face shown on every frame: a list of tuples with faces 1..6.
+    DieState takes time in ms, CyclingDieState and RandomDieState in seconds.
+    """
+    def now_for(die):
+        ms = clock.get_ticks()
+        return ms if isinstance(die, DieState) else ms / 1000.0
+
+    for die in dice:
+        die.start(now_for(die))
+    frames = []
+    while any(die.active for die in dice) and len(frames) < max_frames:
+        clock.tick(fps)
+        for die in dice:
+            die.update(now_for(die))
+        frames.append(tuple(die.face for die in dice))
+    return frames
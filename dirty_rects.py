@@ -0,0 +1,66 @@
+import pygame
+
+
+class DirtyRects:
+    """
+    Dirty-rectangle rendering: θυμάται τι ζωγραφίστηκε σε κάθε περιοχή της οθόνης
+    και στέλνει στην οθόνη (pygame.display.update) μόνο όσες περιοχές άλλαξαν.
+
+    Χρήση ανά frame:
+        full = dirty.full                            # True -> ζωγραφίζουμε τα πάντα
+        if dirty.changed("cell0", rect, face): ...   # ζωγραφίζουμε μόνο αν άλλαξε
+        dirty.present()                              # flip ή update(rects)
+    """
+
+    def __init__(self, surface, bg_color, enabled=True):
+        self.surface = surface
+        self.bg_color = bg_color
+        self.enabled = enabled
+        self.full = True       # το πρώτο frame ζωγραφίζεται ολόκληρο
+        self._last = {}        # key -> (rect, state) που ζωγραφίστηκε τελευταίο
+        self._rects = []       # περιοχές που άλλαξαν σε αυτό το frame
+
+    def invalidate(self):
+        """Ζητάει ολόκληρη οθόνη στο επόμενο frame (π.χ. αλλαγή κατάστασης ή layout)."""
+        self.full = True
+        self._last.clear()
+
+    def changed(self, key, rect, state):
+        """
+        Επιστρέφει True αν το στοιχείο key πρέπει να ξαναζωγραφιστεί.
+        Σε μερική ανανέωση καθαρίζει πρώτα το φόντο κάτω από το rect.
+        """
+        rect = pygame.Rect(rect)
+        entry = (tuple(rect), state)
+        if not self.enabled or self.full:
+            self._last[key] = entry
+            return True
+        prev = self._last.get(key)
+        if prev == entry:
+            return False
+        if prev is not None and prev[0] != entry[0]:
+            # μετακινήθηκε: καθαρίζουμε και την παλιά θέση
+            old = pygame.Rect(prev[0])
+            self.surface.fill(self.bg_color, old)
+            self._rects.append(old)
+        self.surface.fill(self.bg_color, rect)
+        self._rects.append(rect)
+        self._last[key] = entry
+        return True
+
+    def add(self, rects):
+        """
+        Δηλώνει περιοχές που ο caller ξαναζωγράφισε μόνος του (π.χ. χιλιάδες κελιά
+        που συγκρίνονται με numpy αντί για changed() ένα-ένα).
+        """
+        if self.enabled and not self.full:
+            self._rects.extend(rects)
+
+    def present(self):
+        """Στέλνει στην οθόνη είτε όλο το παράθυρο είτε μόνο τις περιοχές που άλλαξαν."""
+        if not self.enabled or self.full:
+            pygame.display.flip()
+        elif self._rects:
+            pygame.display.update(self._rects)
+        self.full = not self.enabled
+        self._rects = []
@@ -0,0 +1,53 @@
+TICK_RATE = 60          # ticks φυσικής ανά δευτερόλεπτο (όσο ήταν τα frames πριν)
+MAX_TICKS = 8           # ticks ανά frame το πολύ· αν η μηχανή δεν προλαβαίνει, πετάμε χρόνο
+
+
+class FixedStep:
+    """
+    Σταθερό βήμα φυσικής με accumulator: ο πραγματικός χρόνος κάθε frame μπαίνει σε έναν
+    «κουμπαρά» και η φυσική τρέχει όσα ολόκληρα ticks των 1000/tick_rate ms χωράνε.
+    Έτσι η κίνηση έχει την ίδια ταχύτητα και τα ίδια αποτελέσματα σε 30, 60 ή 144 FPS·
+    ένα αργό frame απλώς τρέχει 2-3 ticks μαζί.
+
+    Ό,τι περισσεύει (alpha, 0..1) δείχνει πόσο μέσα στο επόμενο tick είμαστε: η σχεδίαση
+    κάνει interpolation ανάμεσα στην προηγούμενη και την τρέχουσα κατάσταση.
+
+        step = FixedStep()
+        frame_ms = 0
+        while running:
+            for _ in range(step.advance(frame_ms)):
+                player.step(keys)
+            draw(player.position(step.alpha))
+            frame_ms = clock.tick(60)
+    """
+
+    def __init__(self, tick_rate=TICK_RATE, max_ticks=MAX_TICKS):
+        self.tick_rate = tick_rate
+        self.dt_ms = 1000.0 / tick_rate
+        self.max_ticks = max_ticks
+        self.acc = 0.0
+        self.ticks = 0
+        self.dropped_ms = 0.0
+
+    def advance(self, frame_ms):
+        """Προσθέτει τον χρόνο του frame και επιστρέφει πόσα ticks πρέπει να τρέξουν τώρα."""
+        self.acc += frame_ms
+        n = int(self.acc // self.dt_ms)
+        if n > self.max_ticks:
+            # «spiral of death»: αν κάθε frame χρωστάει όλο και περισσότερα ticks, η
+            # προσομοίωση επιβραδύνεται αντί να παγώσει το παιχνίδι
+            self.dropped_ms += (n - self.max_ticks) * self.dt_ms
+            self.acc -= (n - self.max_ticks) * self.dt_ms
+            n = self.max_ticks
+        self.acc -= n * self.dt_ms
+        self.ticks += n
+        return n
+
+    @property
+    def alpha(self):
+        return self.acc / self.dt_ms
+
+    def stats(self):
+        """Για το perf overlay (FrameStats.add_source)."""
+        return {"ticks": f"{self.ticks} ticks @{self.tick_rate}Hz", "alpha": self.alpha,
+                "dropped": self.dropped_ms}
@@ -0,0 +1,24 @@
+import pygame
+
+
+def next_events(clock, active, fps=60, idle_timeout=None):
+    """
+    Περιμένει το επόμενο frame και επιστρέφει τα events του.
+
+    active=True  -> κάτι κινείται: σταθερό FPS με clock.tick(fps).
+    active=False -> idle: μπλοκάρει στο pygame.event.wait() μέχρι να έρθει input
+                    (ή μέχρι idle_timeout ms, αν δοθεί), ώστε η CPU να μένει ελεύθερη.
+    """
+    if active:
+        clock.tick(fps)
+        return pygame.event.get()
+
+    if idle_timeout:
+        event = pygame.event.wait(idle_timeout)
+    else:
+        event = pygame.event.wait()
+    # μηδενίζουμε το clock, ώστε το επόμενο tick να μη μετρήσει όλο τον χρόνο αναμονής
+    clock.tick()
+    events = [] if event.type == pygame.NOEVENT else [event]
+    events.extend(pygame.event.get())
+    return events
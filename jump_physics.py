@@ -0,0 +1,199 @@
+import argparse
+import random
+import time
+
+import pygame
+
+from fixed_step import TICK_RATE, FixedStep
+
+# ------------------------------
+# ΚΙΝΗΣΗ ΚΑΙ ΑΛΜΑ ΤΟΥ ΤΕΤΡΑΓΩΝΟΥ (simple_movable_rectangle_with_jump*.py)
+# ------------------------------
+# Η λογική που έτρεχε μία φορά ανά frame, τώρα μία φορά ανά tick φυσικής (fixed_step.py).
+# Δεν χρειάζεται οθόνη, οπότε τρέχει και headless:
+#   python jump_physics.py --ticks 1000000          # ticks/δευτ. χωρίς σχεδίαση
+#   python jump_physics.py --check                   # input ανά frame σε 20/60/144 FPS, replay ανά tick
+
+SIZE = 50
+
+
+class HeldKeys:
+    """Πλήκτρα πατημένα σε ένα tick, με το ίδιο indexing όπως το pygame.key.get_pressed()."""
+
+    def __init__(self, held=()):
+        self.held = set(held)
+
+    def __getitem__(self, k):
+        return k in self.held
+
+
+class JumpPlayer:
+    """
+    Το τετράγωνο των 50x50: x, y είναι το κέντρο του. Το step() είναι ακριβώς η παλιά
+    ενημέρωση ανά frame· το prev_x/prev_y κρατάει την κατάσταση του προηγούμενου tick
+    για το interpolation της σχεδίασης.
+    """
+
+    def __init__(self, x, y, screen_width, screen_height, vel=5):
+        self.x, self.y = x, y
+        self.prev_x, self.prev_y = x, y
+        self.screen_width, self.screen_height = screen_width, screen_height
+        self.vel = vel
+        self.is_jumping = False
+        self.jump_count = 10   # Initial jump count
+
+    def step(self, keys):
+        self.prev_x, self.prev_y = self.x, self.y
+        if keys[pygame.K_LEFT]:
+            self.x -= self.vel
+        if keys[pygame.K_RIGHT]:
+            self.x += self.vel
+
+        if self.is_jumping:
+            if self.jump_count >= -10:
+                neg = 1
+                if self.jump_count < 0:
+                    neg = -1
+                self.y -= abs(self.jump_count ** 2) * neg
+                self.jump_count -= 1
+            else:
+                self.is_jumping = False
+                self.jump_count = 10
+        else:
+            if keys[pygame.K_UP]:
+                self.y -= self.vel
+            if keys[pygame.K_DOWN]:
+                self.y += self.vel
+
+        if keys[pygame.K_PLUS]:
+            self.vel += 1
+        if keys[pygame.K_MINUS]:
+            self.vel -= 1
+        if keys[pygame.K_q]:
+            self.x -= self.vel
+            self.y -= self.vel
+
+        if keys[pygame.K_SPACE]:
+            if not self.is_jumping:
+                self.is_jumping = True
+
+        half = SIZE // 2
+        if self.x - half < 0:
+            self.x = half
+        if self.x > self.screen_width - half:
+            self.x = self.screen_width - half
+        if self.y - half < 0:
+            self.y = half
+        if self.y > self.screen_height - half:
+            self.y = self.screen_height - half
+
+    def position(self, alpha=1.0):
+        """Το κέντρο για τη σχεδίαση, alpha μέσα στο διάστημα από το προηγούμενο tick."""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def topleft(self, alpha=1.0):
+        x, y = self.position(alpha)
+        return x - SIZE // 2, y - SIZE // 2
+
+    def state(self):
+        return self.x, self.y, self.vel, self.is_jumping, self.jump_count
+
+
+# ---- headless ----
+def scripted_keys(seed=0, hold=30):
+    """
+    Ο «παίκτης»: κάθε hold ticks (hold/60 δευτ.) ένας νέος τυχαίος συνδυασμός
+    βελάκια/SPACE. keys_at(tick) δίνει τι είναι πατημένο στο τέλος εκείνου του tick
+    (όταν τρέχει το step του), με όποια σειρά κι αν ρωτηθεί.
+    """
+    rng = random.Random(seed)
+    choices = [(), (pygame.K_LEFT,), (pygame.K_RIGHT,), (pygame.K_UP,), (pygame.K_DOWN,),
+               (pygame.K_SPACE,), (pygame.K_LEFT, pygame.K_SPACE), (pygame.K_RIGHT, pygame.K_SPACE)]
+    segments = []
+
+    def keys_at(tick):
+        segment = tick // hold
+        while len(segments) <= segment:
+            segments.append(HeldKeys(rng.choice(choices)))
+        return segments[segment]
+    return keys_at
+
+
+def keys_at_time(keys_at, ms, dt_ms=1000.0 / TICK_RATE):
+    """Τα πλήκτρα τη στιγμή ms: του tick που τελειώνει εκεί (το 1e-9 για τα στρογγυλέματα)."""
+    return keys_at(max(0, int(ms / dt_ms + 1e-9) - 1))
+
+
+def simulate(ticks, keys_at, player=None, width=700, height=500):
+    """Τρέχει ticks βήματα χωρίς οθόνη· keys_at(tick) δίνει τα πλήκτρα κάθε tick."""
+    player = player or JumpPlayer(width / 2, height / 2, width, height)
+    for t in range(ticks):
+        player.step(keys_at(t))
+    return player
+
+
+def simulate_frames(ticks, keys_at, frame_ms, width=700, height=500):
+    """
+    Όπως ο βρόχος των scripts, με frames διάρκειας frame_ms() (σταθερής ή τυχαίας): στην
+    αρχή κάθε frame διαβάζονται τα πλήκτρα μία φορά (get_pressed) και ισχύουν για όλα
+    τα ticks του frame. Επιστρέφει τον player, τα frames και τα πλήκτρα κάθε tick.
+    """
+    player = JumpPlayer(width / 2, height / 2, width, height)
+    step = FixedStep(max_ticks=10 ** 9)
+    applied = []
+    frames = 0
+    now_ms = last_ms = 0.0
+    while len(applied) < ticks:
+        keys = keys_at_time(keys_at, now_ms, step.dt_ms)
+        for _ in range(min(step.advance(last_ms), ticks - len(applied))):
+            player.step(keys)
+            applied.append(keys)
+        last_ms = frame_ms()      # clock.tick() στο τέλος του frame
+        now_ms += last_ms
+        frames += 1
+    return player, frames, applied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless προσομοίωση κίνησης/άλματος")
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", action="store_true",
+                        help="input ανά frame σε διάφορα FPS: replay ανά tick, διαφορές από το input των 60 Hz")
+    args = parser.parse_args()
+
+    if args.check:
+        # Για κάθε FPS: (1) τα ίδια πλήκτρα ανά tick πρέπει να δίνουν ακριβώς την ίδια κατάσταση
+        # (αυτό εγγυάται το σταθερό βήμα· αποτυχία -> exit 1), (2) πόσα ticks είδαν άλλα πλήκτρα
+        # από το input των 60 Hz επειδή τα πλήκτρα διαβάζονται μία φορά ανά frame.
+        ticks = min(args.ticks, 100_000)
+        keys_at = scripted_keys(args.seed)
+        reference = simulate(ticks, keys_at).state()
+        jitter = random.Random(1)
+        failed = False
+        for name, frame_ms in (("20 FPS", lambda: 50.0), ("60 FPS", lambda: 1000 / 60),
+                               ("144 FPS", lambda: 1000 / 144),
+                               ("τυχαία 5-80 ms", lambda: jitter.uniform(5, 80))):
+            player, frames, applied = simulate_frames(ticks, keys_at, frame_ms)
+            replayed = simulate(ticks, applied.__getitem__).state()
+            late = sum(1 for t, keys in enumerate(applied) if keys.held != keys_at(t).held)
+            ok = replayed == player.state()
+            failed |= not ok
+            same = "ίδια" if player.state() == reference else "άλλη"
+            print(f"{name:>15}: {frames:7d} frames, {ticks} ticks, replay {'ίδιο' if ok else 'ΔΙΑΦΟΡΕΤΙΚΟ'}; "
+                  f"{late} ticks με πλήκτρα άλλου frame -> {same} κατάσταση από τα 60 Hz {player.state()}")
+        if failed:
+            raise SystemExit(1)
+        return
+
+    keys_at = scripted_keys(args.seed)
+    t0 = time.perf_counter()
+    player = simulate(args.ticks, keys_at)
+    elapsed = time.perf_counter() - t0
+    print(f"{args.ticks} ticks σε {elapsed:.2f} s -> {args.ticks / elapsed:,.0f} ticks/δευτ. "
+          f"({args.ticks / elapsed / TICK_RATE:,.0f}x πραγματικός χρόνος), τελική κατάσταση {player.state()}")
+
+
+if __name__ == "__main__":
+    main()
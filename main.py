@@ -1,52 +1,59 @@
+# πρώτο import: ξεκινάει το ρολόι που μετράει τους χρόνους εκκίνησης
+from startup import STARTUP, find_file, get_font, init_pygame
 import pygame
 import sys
-import random
-import os
+
+from dirty_rects import DirtyRects
+from assets import ASSETS
+from atlas import DICE_FILES
+from die_state import RandomDieState
+from frame_pacing import next_events
+from sim_clock import RealClock, make_rng
+from sound_loader import SOUND_LOADED, SoundLoader
+from sprite_cache import SPRITE_CACHE
+from text_cache import render_text
+
+STARTUP.mark("import")
 
 # ---- ΡΥΘΜΙΣΕΙΣ ΠΑΡΑΘΥΡΟΥ ----
 WIDTH, HEIGHT = 800, 500
 BG = (30, 30, 30)
 FPS = 60
+DIRTY_RECTS = True  # ανανεώνουμε μόνο τις περιοχές της οθόνης που άλλαξαν
+IDLE_MODE = True    # όταν τα ζάρια είναι ακίνητα, περιμένουμε input αντί για 60 FPS
+IDLE_TIMEOUT_MS = None
 
 # ---- ΒΟΗΘΗΤΙΚΑ ----
 def load_dice_images():
-    imgs = []
-    for i in range(1, 7):
-        path = f"dice-{i}.png"
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Λείπει το {path}")
-        img = pygame.image.load(path).convert_alpha()
-        imgs.append(img)
-    return imgs
+    # οι 6 όψεις είναι κομμάτια (subsurface) ενός atlas
+    return ASSETS.atlas(DICE_FILES, name="dice").faces()
 
 def scale_images(base_images, size):
-    scaled = []
-    for img in base_images:
-        s = pygame.transform.smoothscale(img, (size, size))
-        scaled.append(s)
-    return scaled
+    # κοινό cache: κάθε (όψη, μέγεθος) κλιμακώνεται μόνο μία φορά
+    SPRITE_CACHE.set_faces(base_images)
+    return SPRITE_CACHE.faces(size)
 
 # ---- ΚΥΡΙΟ ΠΡΟΓΡΑΜΜΑ ----
 def main():
-    pygame.init()
+    # ψάχνουμε mp3 ή wav· ο mixer ξεκινάει μόνο αν υπάρχει ήχος
+    sound_names = ("dice-sound.mp3", "dice-sound.wav")
+    sound_path = find_file(sound_names)
+    mixer_ok = init_pygame(font=True, sound=sound_path is not None)
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Δύο Ζάρια")
-    clock = pygame.time.Clock()
+    # ρολόι και rng μέσα από το sim_clock: με DICE_SEED=... οι ρίψεις ξαναπαίζονται ίδιες
+    # (python replay.py --target main)
+    clock = RealClock()
+    rng = make_rng()
+    dirty = DirtyRects(screen, BG, enabled=DIRTY_RECTS)
 
     # Γραμματοσειρά default μόνο για το κείμενο στο κουμπί
-    font = pygame.font.SysFont(None, 32)
-
-    # Προσπάθεια για ήχο (προαιρετικό)
-    sound = None
-    try:
-        pygame.mixer.init()
-        # ψάχνουμε mp3 ή wav
-        for name in ("dice-sound.mp3", "dice-sound.wav"):
-            if os.path.exists(name):
-                sound = pygame.mixer.Sound(name)
-                break
-    except Exception:
-        sound = None
+    font = get_font(32)
+    STARTUP.mark("init")
+
+    # Ήχος (προαιρετικό): αποκωδικοποιείται σε background thread, πρώτα mp3 και μετά wav,
+    # ώστε το πρώτο frame να μην τον περιμένει· το sound_loader.sound είναι None μέχρι να είναι έτοιμος
+    sound_loader = SoundLoader(sound_names) if mixer_ok else None
 
     # Φόρτωμα εικόνων ζαριών (1..6)
     base_images = load_dice_images()
@@ -67,35 +74,34 @@ def main():
 
     # Κάνουμε scale ΜΙΑ φορά στις σωστές διαστάσεις
     dice_images = scale_images(base_images, die_size)
+    STARTUP.mark("assets")
 
     # Κουμπί «Ρίξε»
     button_w, button_h = 150, 48
     button_rect = pygame.Rect(0, 0, button_w, button_h)
     button_rect.center = (WIDTH//2, HEIGHT - 60)
+    left_rect = pygame.Rect(left_x, dice_y, die_size, die_size)
+    right_rect = pygame.Rect(right_x, dice_y, die_size, die_size)
 
     # Κατάσταση ρίψης
     rolling = False
     # Για κάθε ζάρι κρατάμε το current face, πότε τελειώνει, και κάθε πότε αλλάζει | διαφορετικό για το καθένα
-    dice_state = [
-        # 1ο ζάρι: τρέχουσα πλευρά, διάρκεια, ρυθμός αλλαγής
-        {"face": 1, "end_time": 0.0, "interval": 0.1, "next_change": 0.0}, 
-        # 2ο ζάρι: ίδιες πληροφορίες
-        {"face": 1, "end_time": 0.0, "interval": 0.1, "next_change": 0.0},
-    ]
+    # (die_state.RandomDieState: ο χρόνος έρχεται από το clock και η τύχη από το rng)
+    dice_state = [RandomDieState(rng), RandomDieState(rng)]
 
     def start_roll():
         # “Μην φτιάξεις καινούργια μεταβλητή με αυτό το όνομα — χρησιμοποίησε εκείνη που υπάρχει στην εξωτερική συνάρτηση.”
         nonlocal rolling
         # ορίζουμε διαφορετικούς τυχαίους χρόνους για καθένα σε seconds
-        now = pygame.time.get_ticks() / 1000.0
+        now = clock.get_ticks() / 1000.0
         for d in dice_state:
-            #Η συνάρτηση random.uniform(a, b) επιστρέφει έναν τυχαίο δεκαδικό αριθμό (float) μέσα στο διάστημα [a, b].
-            d["face"] = random.randint(1, 6)                # ποια πλευρά δείχνει τώρα
-            d["interval"] = random.uniform(0.06, 0.12)      # κάθε πότε αλλάζει (π.χ. κάθε 0.08 δευτ.)
-            d["next_change"] = now                          # πότε θα γίνει η επόμενη αλλαγή
-            d["end_time"] = now + random.uniform(0.8, 1.6)  # πότε σταματάει να αλλάζει
+            d.start(now)
         rolling = True
+        play_sound()
+
+    def play_sound():
         # παίζουμε ήχο όσο «γυρίζουν» (loop) - never ending
+        sound = sound_loader.sound if sound_loader else None
         if sound:
             try:
                 sound.play(loops=-1)
@@ -104,50 +110,55 @@ def main():
 
     # αρχική εμφάνιση: σταθερές τυχαίες πλευρές
     for d in dice_state:
-        d["face"] = random.randint(1, 6)
+        d.face = rng.randint(1, 6)
 
     # Βρόχος παιχνιδιού
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:   #σριστερό κουμπί mouse
-                if button_rect.collidepoint(event.pos): #επιστρέφει True αν το σημείο (x, y) είναι μέσα στο ορθογώνιο
-                    start_roll()
-
         # Ενημέρωση animation
         if rolling:
-            now = pygame.time.get_ticks() / 1000.0
-            any_anim = False
+            now = clock.get_ticks() / 1000.0
             for d in dice_state:
-                if now < d["end_time"]:
-                    any_anim = True
-                    if now >= d["next_change"]:
-                        d["face"] = random.randint(1, 6)
-                        d["next_change"] = now + d["interval"]
-            if not any_anim:
+                d.update(now)
+            if not any(d.active for d in dice_state):
                 rolling = False
+                sound = sound_loader.sound if sound_loader else None
                 if sound:
                     try:
                         sound.stop()
                     except Exception:
                         pass
 
-        # Ζωγραφίζουμε
-        screen.fill(BG)
+        # Ζωγραφίζουμε (μόνο ό,τι άλλαξε από το προηγούμενο frame)
+        if dirty.full:
+            screen.fill(BG)
 
         # 2 ζάρια (αριστερά και δεξιά)
-        screen.blit(dice_images[dice_state[0]["face"] - 1], (left_x, dice_y))
-        screen.blit(dice_images[dice_state[1]["face"] - 1], (right_x, dice_y))
+        if dirty.changed("left", left_rect, dice_state[0].face):
+            screen.blit(dice_images[dice_state[0].face - 1], left_rect.topleft)
+        if dirty.changed("right", right_rect, dice_state[1].face):
+            screen.blit(dice_images[dice_state[1].face - 1], right_rect.topleft)
 
         # Κουμπί «Ρίξε»
-        pygame.draw.rect(screen, (220, 220, 220), button_rect, border_radius=10)
-        txt = font.render("Ρίξε", True, (30, 30, 30))
-        txt_rect = txt.get_rect(center=button_rect.center)
-        screen.blit(txt, txt_rect)
+        if dirty.changed("button", button_rect, "Ρίξε"):
+            pygame.draw.rect(screen, (220, 220, 220), button_rect, border_radius=10)
+            txt = render_text(font, "Ρίξε", True, (30, 30, 30))
+            txt_rect = txt.get_rect(center=button_rect.center)
+            screen.blit(txt, txt_rect)
 
-        pygame.display.flip()
-        clock.tick(FPS)
+        dirty.present()
+        STARTUP.first_frame()
+
+        # όσο γυρίζουν τα ζάρια: σταθερό FPS, αλλιώς περιμένουμε το επόμενο input (idle)
+        for event in next_events(clock, rolling or not IDLE_MODE, FPS, IDLE_TIMEOUT_MS):
+            if event.type == pygame.QUIT:
+                pygame.quit(); sys.exit()
+            if event.type == pygame.WINDOWEXPOSED:
+                dirty.invalidate()
+            if event.type == SOUND_LOADED and rolling:
+                play_sound()   # ο ήχος ήρθε στη μέση της ρίψης
+            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:   #σριστερό κουμπί mouse
+                if button_rect.collidepoint(event.pos): #επιστρέφει True αν το σημείο (x, y) είναι μέσα στο ορθογώνιο
+                    start_roll()
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,19 @@
+# first import: starts the startup timer (import/init/assets/first_frame breakdown)
+from startup import STARTUP, find_file, get_font, init_pygame
 import os
 import sys
-import random
 import pygame
 
+from assets import ASSETS
+from die_state import DieState
+from frame_pacing import next_events
+from sim_clock import RealClock, make_rng
+from sound_loader import SOUND_LOADED, SoundLoader
+from sprite_cache import SPRITE_CACHE
+from text_cache import render_text
+
+STARTUP.mark("import")
+
 # main.py
 # GitHub Copilot
 # Simple Pygame dice roller with two dice, images dice-1.png ... dice-6.png in same folder,
@@ -19,40 +30,39 @@ BUTTON_TEXT_COLOR = (10, 10, 10)
 BUTTON_HEIGHT = 64
 BUTTON_WIDTH = 160
 BUTTON_LABEL = "Ρίξε"  # Greek "Roll"
+FPS = 60
+IDLE_MODE = True        # block on pygame.event.wait() while the dice are still
+IDLE_TIMEOUT_MS = None  # optional wake-up interval while idle
 
 IMAGE_NAMES = [f"dice-{i}.png" for i in range(1, 7)]
 SOUND_NAMES = ["dice-sound.mp3", "dice-sound.wav"]
 
-pygame.init()
-pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+# only the subsystems we use: display, font, and the mixer only if there is a sound file
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sound_path = find_file(SOUND_NAMES, base_dir=SCRIPT_DIR)
+mixer_ok = init_pygame(font=True, sound=sound_path is not None,
+                       frequency=44100, size=-16, channels=2, buffer=512)
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Dice Roller")
-clock = pygame.time.Clock()
-
-# Load images
-dice_images = []
-for name in IMAGE_NAMES:
-    path = os.path.join(os.path.dirname(__file__), name)
-    if not os.path.isfile(path):
-        print(f"Missing image: {path}", file=sys.stderr)
-        pygame.quit()
-        sys.exit(1)
-    img = pygame.image.load(path).convert_alpha()
-    dice_images.append(img)
-
-# Attempt to load sound (optional)
-sound = None
-for sname in SOUND_NAMES:
-    spath = os.path.join(os.path.dirname(__file__), sname)
-    if os.path.isfile(spath):
-        try:
-            sound = pygame.mixer.Sound(spath)
-            break
-        except Exception:
-            sound = None
-            break
-
-font = pygame.font.SysFont(None, 40)
+clock = RealClock()
+# all dice randomness comes from one seeded rng (DICE_SEED=... replays a session)
+rng = make_rng()
+font = get_font(40)
+# optional sound, decoded on a background thread (mp3, falling back to wav);
+# sound_loader.sound stays None until it is ready
+sound_loader = SoundLoader(SOUND_NAMES, base_dir=SCRIPT_DIR) if mixer_ok else None
+STARTUP.mark("init")
+
+# Load images (packed into one atlas surface; each face is a subsurface view)
+try:
+    dice_atlas = ASSETS.atlas(IMAGE_NAMES, name="dice")
+except FileNotFoundError as e:
+    print(f"Missing image: {e}", file=sys.stderr)
+    pygame.quit()
+    sys.exit(1)
+dice_images = [dice_atlas.get(name) for name in IMAGE_NAMES]
+SPRITE_CACHE.set_faces(dice_images)
+STARTUP.mark("assets")
 
 # Compute dice display size to fit nicely left/right centered
 def compute_dice_rects():
@@ -81,54 +91,25 @@ button_rect = pygame.Rect(0, 0, BUTTON_WIDTH, BUTTON_HEIGHT)
 button_rect.centerx = WIDTH // 2
 button_rect.bottom = HEIGHT - 16
 
-# Die state
-class DieState:
-    def __init__(self):
-        self.rolling = False
-        self.final_face = 0  # index 0..5
-        self.duration = 1.0
-        self.interval = 0.08
-        self.start_time = 0.0
-        self.next_change = 0.0
-        self.current_face = 0  # index 0..5
-
-    def start(self, now_ms):
-        self.final_face = random.randint(0, 5)
-        self.duration = random.uniform(0.8, 1.6)
-        self.interval = random.uniform(0.06, 0.12)
-        self.start_time = now_ms
-        self.next_change = now_ms + int(self.interval * 1000)
-        self.current_face = random.randint(0, 5)  # random initial phase
-        self.rolling = True
-
-    def update(self, now_ms):
-        if not self.rolling:
-            return
-        elapsed = (now_ms - self.start_time) / 1000.0
-        if elapsed >= self.duration:
-            # lock to final face
-            self.current_face = self.final_face
-            self.rolling = False
-            return
-        # advance in cycle 1->2->3->4->5->6->1...
-        if now_ms >= self.next_change:
-            # advance by however many intervals passed to stay consistent
-            passed = now_ms - self.next_change
-            steps = 1 + int(passed / int(self.interval * 1000)) if self.interval > 0 else 1
-            self.current_face = (self.current_face + steps) % 6
-            self.next_change += int(steps * self.interval * 1000)
-
-die_left = DieState()
-die_right = DieState()
+# Die state (shared state machine, see die_state.py)
+die_left = DieState(rng)
+die_right = DieState(rng)
 
 def any_rolling():
     return die_left.rolling or die_right.rolling
 
 def start_roll():
-    now_ms = pygame.time.get_ticks()
+    now_ms = clock.get_ticks()
     die_left.start(now_ms)
     die_right.start(now_ms)
+    play_sound()
+
+def current_sound():
+    return sound_loader.sound if sound_loader else None
+
+def play_sound():
     # start sound if available
+    sound = current_sound()
     if sound:
         try:
             sound.play(loops=-1)
@@ -136,6 +117,7 @@ def start_roll():
             pass
 
 def stop_sound():
+    sound = current_sound()
     if sound:
         try:
             sound.stop()
@@ -143,22 +125,12 @@ def stop_sound():
             pass
 
 # initial faces
-die_left.current_face = random.randint(0, 5)
-die_right.current_face = random.randint(0, 5)
+die_left.current_face = rng.randint(0, 5)
+die_right.current_face = rng.randint(0, 5)
 
 running = True
 while running:
-    dt = clock.tick(60)
-    now = pygame.time.get_ticks()
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if button_rect.collidepoint(event.pos):
-                start_roll()
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                running = False
+    now = clock.get_ticks()
 
     # update dice
     die_left.update(now)
@@ -171,10 +143,9 @@ while running:
     # draw
     screen.fill(BG_COLOR)
     # draw dice images
-    img_left = dice_images[die_left.current_face]
-    img_right = dice_images[die_right.current_face]
-    img_left_s = pygame.transform.smoothscale(img_left, (left_rect.width, left_rect.height))
-    img_right_s = pygame.transform.smoothscale(img_right, (right_rect.width, right_rect.height))
+    # scaled faces come from the shared cache (faces are 1..6, current_face is 0..5)
+    img_left_s = SPRITE_CACHE.get(die_left.current_face + 1, left_rect.size)
+    img_right_s = SPRITE_CACHE.get(die_right.current_face + 1, right_rect.size)
     screen.blit(img_left_s, left_rect.topleft)
     screen.blit(img_right_s, right_rect.topleft)
 
@@ -183,10 +154,24 @@ while running:
     bc = BUTTON_HOVER if button_rect.collidepoint((mx, my)) else BUTTON_COLOR
     pygame.draw.rect(screen, bc, button_rect, border_radius=8)
     # button text
-    txt = font.render(BUTTON_LABEL, True, BUTTON_TEXT_COLOR)
+    txt = render_text(font, BUTTON_LABEL, True, BUTTON_TEXT_COLOR)
     txt_rect = txt.get_rect(center=button_rect.center)
     screen.blit(txt, txt_rect)
 
     pygame.display.flip()
+    STARTUP.first_frame()
+
+    # fixed FPS while rolling, otherwise sleep until the next input (idle mode)
+    for event in next_events(clock, any_rolling() or not IDLE_MODE, FPS, IDLE_TIMEOUT_MS):
+        if event.type == pygame.QUIT:
+            running = False
+        elif event.type == SOUND_LOADED and any_rolling():
+            play_sound()  # sound arrived in the middle of a roll
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if button_rect.collidepoint(event.pos):
+                start_roll()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                running = False
 
 pygame.quit()
\ No newline at end of file
@@ -1,10 +1,29 @@
+# πρώτο import: ξεκινάει το ρολόι που μετράει τους χρόνους εκκίνησης
+from startup import STARTUP, find_file, get_font, init_pygame
 import pygame
 import sys
-import random
 import math
 import os
 from typing import List, Tuple
 
+import numpy as np
+
+from assets import ASSETS
+from atlas import DICE_FILES
+from dice_engine import RollEngine
+from dice_stats import sum_distribution
+from dirty_rects import DirtyRects
+from frame_pacing import next_events
+from perf_overlay import FrameStats, PerfOverlay
+from roll_log import DEFAULT_LOG, RollLog
+from sim_clock import RealClock, make_rng
+from sound_loader import SOUND_LOADED, SoundLoader
+from sound_manager import MIXER_ARGS, SoundManager
+from sprite_cache import SPRITE_CACHE
+from text_cache import render_text
+
+STARTUP.mark("import")
+
 # ------------------------------
 # ΡΥΘΜΙΣΕΙΣ ΠΑΡΑΘΥΡΟΥ / FPS
 # ------------------------------
@@ -18,31 +37,67 @@ BANNER_H = 110
 BANNER_MARGIN = 16
 BANNER_BG = (35, 35, 35, 230)  # με άλφα για ημιδιαφάνεια 230/255 = 90% opacity RED-GREEN-BLUE-ALPHA
 BANNER_TEXT = (245, 245, 245)
+BANNER_RECT = pygame.Rect(BANNER_MARGIN, BANNER_MARGIN, WIDTH - 2*BANNER_MARGIN, BANNER_H)
+# ---- Dirty rects ----
+# True: στέλνουμε στην οθόνη μόνο ό,τι άλλαξε (pygame.display.update(rects)) αντί για flip ολόκληρου παραθύρου
+DIRTY_RECTS = True
+# ---- Idle mode ----
+# Όταν τίποτα δεν κινείται, περιμένουμε input (pygame.event.wait) αντί να ζωγραφίζουμε με 60 FPS
+IDLE_MODE = True
+IDLE_TIMEOUT_MS = None  # π.χ. 1000 για να «ξυπνάει» μία φορά το δευτερόλεπτο
+# ---- Πλήθος ζαριών ----
+MAX_DICE = 20000        # +/- αλλάζουν το πλήθος ×10 / ÷10 μέχρι εδώ
+LIST_RESULT_MAX = 6     # μέχρι τόσα ζάρια το αποτέλεσμα γράφει κάθε ζάρι ξεχωριστά
+# ---- Perf overlay (F3) ----
+OVERLAY_RECT = pygame.Rect(WIDTH - 308, HEIGHT - 158, 300, 150)
+
+class Banner:
+    """
+    Ημιδιάφανο banner στην κορυφή με το μήνυμα (retained widget).
+    Συνθέτει την εικόνα του banner μία φορά για κάθε διαφορετικό μήνυμα
+    και μετά απλώς την ξανακάνει blit μέχρι να αλλάξει το κείμενο.
+    """
 
-def draw_banner(surface, text, font_title, font_body):
-    """Ζωγραφίζει ένα ημιδιάφανο banner στην κορυφή και γράφει μέσα το μήνυμα."""
-    # φτιάχνουμε ένα surface με alpha για να έχουμε στρογγυλεμένες γωνίες + διαφάνεια
-
-    #Το pygame.SRCALPHA λέει στον pygame ότι η επιφάνεια θα υποστηρίζει RGBA (όχι μόνο RGB).
-    #Είναι όπως να έχεις ένα μικρό παράθυρο μέσα στο μεγάλο με το Surface.
-    #border_radius - Αν βάλεις 0, είναι τελείως τετράγωνο· αν βάλεις 30, είναι πιο «μαλακό».
-    banner_surf = pygame.Surface((WIDTH - 2*BANNER_MARGIN, BANNER_H), pygame.SRCALPHA)
-    pygame.draw.rect(banner_surf, BANNER_BG, banner_surf.get_rect(), border_radius=14)
-
-    # τίτλος
-    title = font_title.render("Αποτέλεσμα", True, BANNER_TEXT)
-    banner_surf.blit(title, (16, 10))
-
-    # wrap του κειμένου ώστε να χωράει (για το αντίστοιχο font μέσα στο τετράγωνο. τη δηλώνουμε παρακάτω)
-    body_lines = wrap_text(text, font_body, banner_surf.get_width() - 32)
-    y = 12 + title.get_height()
-    for ln in body_lines:
-        img = font_body.render(ln, True, BANNER_TEXT)
-        banner_surf.blit(img, (16, y))
-        y += img.get_height() + 2
-
-    # blit επάνω αριστερά με το margin
-    surface.blit(banner_surf, (BANNER_MARGIN, BANNER_MARGIN))
+    MAX_MESSAGES = 8  # πόσα διαφορετικά μηνύματα κρατάμε έτοιμα
+
+    def __init__(self, font_title, font_body):
+        self.font_title = font_title
+        self.font_body = font_body
+        self._surfaces = {}  # κείμενο -> έτοιμο surface
+
+    def compose(self, text):
+        """Φτιάχνει το surface του banner για ένα μήνυμα."""
+        # φτιάχνουμε ένα surface με alpha για να έχουμε στρογγυλεμένες γωνίες + διαφάνεια
+
+        #Το pygame.SRCALPHA λέει στον pygame ότι η επιφάνεια θα υποστηρίζει RGBA (όχι μόνο RGB).
+        #Είναι όπως να έχεις ένα μικρό παράθυρο μέσα στο μεγάλο με το Surface.
+        #border_radius - Αν βάλεις 0, είναι τελείως τετράγωνο· αν βάλεις 30, είναι πιο «μαλακό».
+        banner_surf = pygame.Surface(BANNER_RECT.size, pygame.SRCALPHA)
+        pygame.draw.rect(banner_surf, BANNER_BG, banner_surf.get_rect(), border_radius=14)
+
+        # τίτλος
+        title = render_text(self.font_title, "Αποτέλεσμα", True, BANNER_TEXT)
+        banner_surf.blit(title, (16, 10))
+
+        # wrap του κειμένου ώστε να χωράει (για το αντίστοιχο font μέσα στο τετράγωνο. τη δηλώνουμε παρακάτω)
+        body_lines = wrap_text(text, self.font_body, banner_surf.get_width() - 32)
+        y = 12 + title.get_height()
+        for ln in body_lines:
+            img = render_text(self.font_body, ln, True, BANNER_TEXT)
+            banner_surf.blit(img, (16, y))
+            y += img.get_height() + 2
+
+        # ίδιο pixel format με την οθόνη -> γρηγορότερο alpha blit
+        return banner_surf.convert_alpha()
+
+    def draw(self, surface, text):
+        banner_surf = self._surfaces.get(text)
+        if banner_surf is None:
+            if len(self._surfaces) >= self.MAX_MESSAGES:
+                self._surfaces.clear()
+            banner_surf = self._surfaces[text] = self.compose(text)
+        # blit επάνω αριστερά με το margin
+        surface.blit(banner_surf, BANNER_RECT.topleft)
 
 def wrap_text(text, font, max_w):
     """Επιστρέφει λίστα από γραμμές που χωρούν στο max_w."""
@@ -62,62 +117,51 @@ def wrap_text(text, font, max_w):
 # ΒΟΗΘΗΤΙΚΑ
 # ------------------------------
 def load_dice_images():
-    imgs = []
-    for i in range(1, 7):
-        path = f"dice-{i}.png"
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Λείπει το αρχείο {path}")
-        img = pygame.image.load(path).convert_alpha()
-        imgs.append(img)
-    return imgs
-
-def best_grid(n: int):
     """
-    Επιλέγει grid για 1..4 ζάρια.
-    1 -> 1x1
-    2 -> 1x2 (οριζόντια)
-    3 -> 2x2 (με 1 κενό)
-    4 -> 2x2
+    Οι 6 όψεις από ένα atlas: ένα surface με όλες τις εικόνες και κάθε όψη ως subsurface
+    (χωρίς αντιγραφή). Από το 2ο άνοιγμα φορτώνεται έτοιμο από το .asset_cache.
     """
-    if n == 1: return (1, 1)
-    if n == 2: return (2, 1)
-    return (2, 2)
-
-def scale_images(base_images, target_size):
-    """Επιστρέφει μια νέα λίστα με τις εικόνες των ζαριών σε νέο μέγεθος (target_size x target_size)."""
-    scaled_images = []  # εδώ θα μαζεύουμε τις καινούργιες εικόνες
+    return ASSETS.atlas(DICE_FILES, name="dice").faces()
 
-    # για κάθε εικόνα στη λίστα base_images
-    for img in base_images:
-        # αλλάζουμε το μέγεθος με λείανση (ώστε να μη «πιξελιάζει»)
-        scaled_img = pygame.transform.smoothscale(img, (target_size, target_size))
+def best_grid(n: int, area_w: int, area_h: int):
+    """
+    Επιλέγει (cols, rows) ώστε n τετράγωνα κελιά να χωράνε στο area_w x area_h
+    όσο πιο μεγάλα γίνεται. Δοκιμάζει όλα τα πλήθη στηλών μαζί (numpy).
+    Π.χ. 2 -> 2x1, 4 -> 4x1 ή 2x2 ανάλογα με το σχήμα της περιοχής.
+    """
+    cols = np.arange(1, n + 1)
+    rows = -(-n // cols)   # ceil
+    cell = np.minimum(area_w / cols, area_h / rows)
+    best = int(np.argmax(cell))
+    return int(cols[best]), int(rows[best])
 
-        # προσθέτουμε την καινούργια εικόνα στη λίστα
-        scaled_images.append(scaled_img)
+def scale_images(base_images, target_size):
+    """
+    Επιστρέφει λίστα με τις εικόνες των ζαριών σε νέο μέγεθος (target_size x target_size).
+    Περνάει από το κοινό SPRITE_CACHE: κάθε μέγεθος κλιμακώνεται (smoothscale) μόνο μία φορά,
+    οπότε ξαναρίξε ή αλλαγή πλήθους ζαριών δεν ξανακάνει scale.
+    Οι εικόνες επιστρέφονται αδιαφανείς (πάνω στο BG_COLOR), ώστε ένα κελί να
+    ξαναζωγραφίζεται με ένα σκέτο blit χωρίς να καθαριστεί πρώτα το φόντο.
+    """
+    SPRITE_CACHE.set_faces(base_images)
+    out = []
+    for img in SPRITE_CACHE.faces(target_size):
+        cell = pygame.Surface(img.get_size()).convert()
+        cell.fill(BG_COLOR)
+        cell.blit(img, (0, 0))
+        out.append(cell)
+    return out
 
-    # στο τέλος επιστρέφουμε τη λίστα με τις κλιμακωμένες εικόνες
-    return scaled_images
 
+SOUND_CANDIDATES = ["dice-sound.mp3", "dice-sound.wav", "dice_sound.mp3", "dice_sound.wav"]
+SOUND_WARN = "ΠΡΟΕΙΔΟΠ.: Δεν βρέθηκε/φορτώθηκε ήχος. Αν χρειαστεί, μετέτρεψε με: ffmpeg -i dice-sound.mp3 -ar 44100 -ac 2 dice-sound.wav"
 
-def try_load_sound():
-    """
-    Προσπαθεί πρώτα mp3, μετά wav. Αν αποτύχει, επιστρέφει (None, μήνυμα).
-    """
-    candidates = ["dice-sound.mp3", "dice-sound.wav", "dice_sound.mp3", "dice_sound.wav"]
-    for c in candidates:
-        if os.path.exists(c):
-            try:
-                return pygame.mixer.Sound(c), ""
-            except Exception as e:
-                # προχωρά στον επόμενο τύπο
-                last_err = str(e)
-                continue
-    return None, "ΠΡΟΕΙΔΟΠ.: Δεν βρέθηκε/φορτώθηκε ήχος. Αν χρειαστεί, μετέτρεψε με: ffmpeg -i dice-sound.mp3 -ar 44100 -ac 2 dice-sound.wav"
+SOUND_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 def draw_centered_text(surface, text, y, font, color=TEXT_COLOR):
     # Δημιουργούμε εικόνα με το κείμενο
-    text_surface = font.render(text, True, color)
+    text_surface = render_text(font, text, True, color)
 
     # Παίρνουμε το ορθογώνιο της εικόνας
     text_rect = text_surface.get_rect()
@@ -133,35 +177,64 @@ def draw_centered_text(surface, text, y, font, color=TEXT_COLOR):
 # ΚΥΡΙΟ ΠΡΟΓΡΑΜΜΑ
 # ------------------------------
 class DiceRoller:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, dirty_rects=DIRTY_RECTS, idle=IDLE_MODE, idle_timeout=IDLE_TIMEOUT_MS,
+                 clock=None, seed=None, roll_log=DEFAULT_LOG):
+        # μόνο display + font, και mixer μόνο αν υπάρχει αρχείο ήχου (όχι όλο το pygame.init())
+        has_sound = find_file(SOUND_CANDIDATES) is not None
+        mixer_ok = init_pygame(font=True, sound=has_sound, **MIXER_ARGS)
         pygame.display.set_caption("Ζάρια")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        self.clock = pygame.time.Clock()
-        self.font_big = pygame.font.SysFont(None, 48)
-        self.font = pygame.font.SysFont(None, 30)
-        self.font_small = pygame.font.SysFont(None, 24)
-
-        # mixer (ήχος)
-        mixer_ok = True
-        try:
-            pygame.mixer.init()
-        except Exception:
-            mixer_ok = False
-
-        self.base_images = load_dice_images()
+        # ρολόι και rng μπορούν να δοθούν απ' έξω (π.χ. SimClock + seed για headless replay)
+        self.clock = clock if clock is not None else RealClock()
+        self.rng = make_rng(seed)
+        self.dirty = DirtyRects(self.screen, BG_COLOR, enabled=dirty_rects)
+        self.idle = idle
+        self.idle_timeout = idle_timeout
+        # fonts από cache, χωρίς το σκανάρισμα fonts του SysFont
+        self.font_big = get_font(48)
+        self.font = get_font(30)
+        self.font_small = get_font(24)
+        self.banner = Banner(self.font_big, self.font)
+        # χρόνοι ανά φάση του frame· F3 δείχνει/κρύβει το overlay
+        self.stats = FrameStats()
+        self.overlay = PerfOverlay(self.stats, pos=OVERLAY_RECT.topleft, size=OVERLAY_RECT.size)
+        STARTUP.mark("init")
+
+        # ο ήχος αποκωδικοποιείται σε background thread (πρώτα mp3, μετά wav):
+        # η οθόνη δεν τον περιμένει και ο ήχος «κουμπώνει» μόλις είναι έτοιμος (attach_sound)
         self.sound = None
+        self.sound_loader = None
+        self.sounds = None   # pool από channels (sound_manager.py)
         self.sound_warn = ""
         if mixer_ok:
-            self.sound, self.sound_warn = try_load_sound()
+            self.sound_loader = SoundLoader(SOUND_CANDIDATES, base_dir=SOUND_DIR)
+            self.sounds = SoundManager()
+            self.stats.add_source("sound", self.sound_loader.stats)
+            self.stats.add_source("mixer", self.sounds.stats)
+        elif not has_sound:
+            self.sound_warn = SOUND_WARN
+        self.base_images = load_dice_images()
+        STARTUP.mark("assets")
 
         # καταστάσεις: "ASK", "ROLLING", "RESULT"
         self.state = "ASK"
         self.dice_count = None
 
-        # για animation
-        self.anim_data = []  # list από dict ανά ζάρι
-        self.result_values = []
+        # για animation: ένας numpy πίνακας ανά πεδίο, μία θέση ανά ζάρι (γεμίζουν στο start_roll)
+        self.end_time = self.next_change = self.interval = None
+        self.current_face = self.final_face = self.drawn_faces = None
+        self.result_values = None  # τελικές όψεις, όταν σταματήσουν όλα τα ζάρια
+        self.result_line = None    # κείμενο αποτελέσματος (υπολογίζεται μία φορά ανά ρίψη)
+        self.shown_faces = np.zeros(0, dtype=np.uint8)  # όψη (1..6) που φαίνεται τώρα σε κάθε ζάρι
+        # ίδια μηχανή με τις headless προσομοιώσεις (dice_engine.py), με seed από το ίδιο rng
+        self.engine = RollEngine(self.rng.getrandbits(64))
+        # κάθε ολοκληρωμένη ρίψη γράφεται στο ιστορικό (roll_log.py) για ελέγχους δικαιοσύνης
+        self.roll_log = None
+        if roll_log:
+            try:
+                self.roll_log = RollLog(roll_log)
+            except (OSError, ValueError) as e:
+                print(f"Χωρίς ιστορικό ρίψεων: {e}", file=sys.stderr)
 
         # Κουμπί "Ξαναρίξε"
         self.button_rect = pygame.Rect(0, 0, 220, 54)
@@ -173,143 +246,239 @@ class DiceRoller:
         if self.sound_warn:
             draw_centered_text(self.screen, self.sound_warn, HEIGHT//2 + 30, self.font_small, (255, 170, 0))
         pygame.display.flip()
+        STARTUP.first_frame()
 
         waiting = True
         while waiting:
-            for event in pygame.event.get():
+            # στατική οθόνη: σε idle mode απλώς περιμένουμε το επόμενο πλήκτρο
+            for event in next_events(self.clock, not self.idle, 30, self.idle_timeout):
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
+                if event.type == pygame.WINDOWEXPOSED:
+                    pygame.display.flip()
+                if event.type == SOUND_LOADED and not self.attach_sound():
+                    # κανένα αρχείο ήχου δεν φορτώθηκε: δείχνουμε την προειδοποίηση
+                    self.sound_warn = SOUND_WARN
+                    draw_centered_text(self.screen, self.sound_warn, HEIGHT//2 + 30, self.font_small, (255, 170, 0))
+                    pygame.display.flip()
                 if event.type == pygame.KEYDOWN:
                     if event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
                         self.dice_count = int(event.unicode)
                         waiting = False
-            self.clock.tick(30)
 
     def start_roll(self):
-        # ορισμός grid & scaling
-        cols, rows = best_grid(self.dice_count)
-        padding = 20    #απόσταση ζάρι με ζάρι και ζάρι με περιθώριο
-        grid_w = WIDTH - padding*(cols+1)
-        grid_h = HEIGHT - 230  # αφήνουμε χώρο για κείμενα/κουμπί
-        grid_y = BANNER_H + BANNER_MARGIN*2  # αφήνουμε χώρο για το banner
-
+        # ορισμός grid & scaling για οποιοδήποτε πλήθος ζαριών
+        grid_x, grid_y = 0, BANNER_H + BANNER_MARGIN*2  # αφήνουμε χώρο για το banner
+        grid_w, grid_h = WIDTH, HEIGHT - 230            # και για κείμενα/κουμπί
+        cols, rows = best_grid(self.dice_count, grid_w, grid_h)
 
-        # Υπολογίζει το πλάτος κάθε "κελιού" στο πλέγμα (μοιράζει το συνολικό πλάτος grid_w στις στήλες)
-        cell_w = grid_w // cols      
-
-        # Υπολογίζει το ύψος κάθε "κελιού" στο πλέγμα (μοιράζει το συνολικό ύψος grid_h στις γραμμές)
-        cell_h = grid_h // rows      
-
-         # Επιλέγει το μικρότερο από τα δύο ώστε τα ζάρια να είναι τετράγωνα και να χωρούν σωστά
-        cell_size = int(min(cell_w, cell_h)) 
+        # βήμα πλέγματος = κελί + κενό· το κενό μικραίνει μαζί με τα ζάρια (έως 20px)
+        pitch = min(grid_w // cols, grid_h // rows)
+        padding = min(20, pitch // 8)
+        cell_size = max(1, pitch - padding)
 
         # προετοιμάζουμε scaled images μία φορά
         self.scaled_images = scale_images(self.base_images, cell_size)
 
-        # τοποθετήσεις κελιών
-        self.cells = []
-        for r in range(rows):
-            for c in range(cols):
-                x = padding + c*(cell_w) + (cell_w - cell_size)//2 + padding*c
-                y = grid_y + r*(cell_h) + (cell_h - cell_size)//2 + padding*r
-                self.cells.append(pygame.Rect(x, y, cell_size, cell_size))
-
-        # κρατάμε μόνο όσα χρειαζόμαστε
-        self.cells = self.cells[:self.dice_count]
-
-        # animation data ανά ζάρι
-        self.anim_data = []
-        now = pygame.time.get_ticks()/1000.0
-        # duration ανά ζάρι (διαφορετικός τυχαίος χρόνος)
-        for i in range(self.dice_count):
-            dur = random.uniform(0.8, 1.8)  # από 0.8s έως 1.8s
-            change_interval = random.uniform(0.05, 0.12)  # πόσο συχνά αλλάζει face
-            self.anim_data.append({
-                "end_time": now + dur,
-                "next_change": now,       # άμεσα να αλλάξει
-                "interval": change_interval,
-                "current_face": random.randint(1, 6),
-                "final_face": None
-            })
-
-        self.result_values = [None]*self.dice_count
+        # θέσεις κελιών σε πίνακες (x, y πάνω-αριστερά), κεντραρισμένο πλέγμα
+        idx = np.arange(self.dice_count)
+        x0 = grid_x + (grid_w - cols*pitch + padding)//2
+        y0 = grid_y + (grid_h - rows*pitch + padding)//2
+        self.cell_x = x0 + (idx % cols)*pitch
+        self.cell_y = y0 + (idx // cols)*pitch
+        self.cell_size = cell_size
+
+        # animation state ανά ζάρι σε συνεχόμενους πίνακες (structure of arrays):
+        # διάρκεια, ρυθμός αλλαγής και τελική όψη βγαίνουν από τη μηχανή (dice_engine.py),
+        # ώστε το UI και οι headless προσομοιώσεις να ακολουθούν τους ίδιους κανόνες
+        batch = self.engine.roll(1, self.dice_count)
+        now = self.clock.get_ticks()/1000.0
+        self.end_time = now + batch.durations[0].astype(np.float64)   # από 0.8s έως 1.8s
+        self.next_change = np.full(self.dice_count, now)                # άμεσα να αλλάξει
+        self.interval = batch.intervals[0].astype(np.float64)          # πόσο συχνά αλλάζει face
+        self.current_face = self.engine.rng.integers(1, 7, self.dice_count, dtype=np.uint8)
+        self.final_face = batch.faces[0]
+        # όψη που ζωγραφίστηκε τελευταία σε κάθε κελί (0 = τίποτα)
+        self.drawn_faces = np.zeros(self.dice_count, dtype=np.uint8)
+        self.shown_faces = self.current_face
+
+        self.result_values = None
+        self.result_line = None
+        # νέο layout -> ολόκληρη οθόνη στο επόμενο frame
+        self.dirty.invalidate()
 
         # ήχος: παίζει ενώ κάποιο ζάρι «γυρίζει»
-        if self.sound is not None:
-            try:
-                # ξεκινάει/ξαναξεκινάει (όχι loop, θα το σταματήσουμε όταν τελειώσουν όλα)
-                self.sound.play(loops=-1)
-            except Exception:
-                pass
+        self.attach_sound()
+        self.play_sound()
 
         self.state = "ROLLING"
 
-    def update_rolling(self):
-        self.screen.fill(BG_COLOR)
+    def attach_sound(self):
+        """Παίρνει τον ήχο από τον loader μόλις είναι έτοιμος. True αν υπάρχει (ή ίσως έρθει) ήχος."""
+        loader = self.sound_loader
+        if self.sound is None and loader is not None and loader.ready:
+            self.sound = loader.sound
+            # μία φωνή: νέα ρίψη πριν τελειώσει η προηγούμενη ξαναξεκινάει τον ίδιο ήχο
+            self.sounds.add("dice", self.sound, max_voices=1)
+            if self.state == "ROLLING":
+                self.play_sound()   # ήρθε στη μέση της ρίψης
+        return self.sound is not None or (loader is not None and not loader.done)
 
-        # update & draw dice
-        any_animating = False
-        t = pygame.time.get_ticks()/1000.0
-        for i, cell in enumerate(self.cells):
-            d = self.anim_data[i]
-            if t < d["end_time"]:
-                any_animating = True
-                if t >= d["next_change"]:
-                    d["current_face"] = random.randint(1, 6)
-                    d["next_change"] = t + d["interval"]
-                face_idx = d["current_face"] - 1
-            else:
-                if d["final_face"] is None:
-                    d["final_face"] = d["current_face"]
-                    self.result_values[i] = d["final_face"]
-                face_idx = (d["final_face"] or d["current_face"]) - 1
-
-            self.screen.blit(self.scaled_images[face_idx], cell.topleft)
-
-        # τίτλοι/βοήθεια
-        rolling_msg = "Ρίχνεις τα ζάρια..."
-        draw_banner(self.screen, rolling_msg, self.font_big, self.font)
-        draw_centered_text(self.screen, "Πάτα 1–4 για να αλλάξεις πλήθος ζαριών ανά πάσα στιγμή",
-                   HEIGHT-28, self.font_small)
+    def play_sound(self):
+        if self.sound is not None:
+            try:
+                # ξεκινάει/ξαναξεκινάει (loop, θα το σταματήσουμε όταν τελειώσουν όλα)
+                self.sounds.play("dice", loops=-1)
+            except Exception:
+                pass
 
-        pygame.display.flip()
+    def advance_dice(self, t):
+        """
+        Ενημερώνει την κατάσταση των ζαριών για τη στιγμή t (δευτερόλεπτα), όλα μαζί με numpy.
+        Γεμίζει το self.shown_faces και επιστρέφει True αν κάποιο ζάρι γυρίζει ακόμα.
+        """
+        rolling = t < self.end_time
+        due = rolling & (t >= self.next_change)
+        n_due = int(np.count_nonzero(due))
+        if n_due:
+            self.current_face[due] = self.engine.rng.integers(1, 7, n_due, dtype=np.uint8)
+            self.next_change[due] = t + self.interval[due]
+        self.shown_faces = np.where(rolling, self.current_face, self.final_face)
+        if rolling.any():
+            return True
+        self.result_values = self.final_face
+        return False
+
+    def draw_cells(self, faces):
+        """
+        Ζωγραφίζει μόνο τα κελιά που η όψη τους άλλαξε από το προηγούμενο frame
+        (σύγκριση πινάκων αντί για ένα changed() ανά ζάρι) με ένα Surface.blits.
+        """
+        if self.dirty.full:
+            changed = np.arange(len(faces))
+        else:
+            changed = np.flatnonzero(faces != self.drawn_faces)
+        if not len(changed):
+            return
+        imgs = self.scaled_images
+        xs = self.cell_x[changed].tolist()
+        ys = self.cell_y[changed].tolist()
+        fs = faces[changed].tolist()
+        self.screen.blits([(imgs[f - 1], (x, y)) for f, x, y in zip(fs, xs, ys)], doreturn=False)
+        size = self.cell_size
+        self.dirty.add([pygame.Rect(x, y, size, size) for x, y in zip(xs, ys)])
+        self.drawn_faces[changed] = faces[changed]
+
+    def update_rolling(self, draw=True):
+        any_animating = self.advance_dice(self.clock.get_ticks()/1000.0)
+        self.stats.mark("update")
+
+        if draw:
+            if self.dirty.full:
+                self.screen.fill(BG_COLOR)
+
+            # ζωγραφίζουμε μόνο τα κελιά που άλλαξαν όψη
+            self.draw_cells(self.shown_faces)
+
+            # τίτλοι/βοήθεια
+            rolling_msg = "Ρίχνεις τα ζάρια..."
+            if self.dirty.changed("banner", BANNER_RECT, rolling_msg):
+                self.banner.draw(self.screen, rolling_msg)
+            if self.dirty.full:
+                draw_centered_text(self.screen, "Πάτα 1–4 ή +/- (×10) για να αλλάξεις πλήθος ζαριών ανά πάσα στιγμή",
+                           HEIGHT-28, self.font_small)
+
+            self.present()
 
         if not any_animating:
+            if self.roll_log is not None:
+                self.roll_log.append(self.result_values)
             # σταματάμε τον ήχο
             if self.sound is not None:
                 try:
-                    self.sound.stop()
+                    self.sounds.stop("dice")
                 except Exception:
                     pass
             self.state = "RESULT"
+            self.dirty.invalidate()
 
     def draw_result(self):
-        self.screen.fill(BG_COLOR)
+        if self.dirty.full:
+            self.screen.fill(BG_COLOR)
         # σχεδιάζουμε τα ζάρια στη θέση τους
-        for i, cell in enumerate(self.cells):
-            v = self.result_values[i]
-            self.screen.blit(self.scaled_images[v-1], cell.topleft)
+        self.draw_cells(self.result_values)
 
         # κείμενα αποτελέσματος
-        total = sum(self.result_values)
-        parts = [f"στο Zάρι{i+1}->{self.result_values[i]}" for i in range(self.dice_count)]
-        line = "Έφερες " + ", ".join(parts) + f". Συνολικό άθροισμα {total}."
-        draw_centered_text(self.screen, "Αποτέλεσμα", 30, self.font_big)
-        draw_centered_text(self.screen, line, 70, self.font)
+        if self.result_line is None:
+            self.result_line = self.result_text()
+        line = self.result_line
+        if self.dirty.changed("banner", BANNER_RECT, line):
+            draw_centered_text(self.screen, "Αποτέλεσμα", 30, self.font_big)
+            draw_centered_text(self.screen, line, 70, self.font)
 
-        # banner κορυφής με το μήνυμα
-        draw_banner(self.screen, line, self.font_big, self.font)
+            # banner κορυφής με το μήνυμα
+            self.banner.draw(self.screen, line)
 
         # κουμπί Ξαναρίξε
-        pygame.draw.rect(self.screen, ACCENT, self.button_rect, border_radius=10)
-        btn_text = self.font.render("Ξαναρίξε", True, (30, 30, 30))
-        btn_rect = btn_text.get_rect(center=self.button_rect.center)
-        self.screen.blit(btn_text, btn_rect)
+        if self.dirty.changed("button", self.button_rect, "Ξαναρίξε"):
+            pygame.draw.rect(self.screen, ACCENT, self.button_rect, border_radius=10)
+            btn_text = render_text(self.font, "Ξαναρίξε", True, (30, 30, 30))
+            btn_rect = btn_text.get_rect(center=self.button_rect.center)
+            self.screen.blit(btn_text, btn_rect)
 
         # υπόμνημα
-        draw_centered_text(self.screen, "Ή πάτα 1–4 για να αλλάξεις πόσα ζάρια ρίχνεις", HEIGHT-28, self.font_small)
-
-        pygame.display.flip()
+        if self.dirty.full:
+            draw_centered_text(self.screen, "Ή πάτα 1–4 ή +/- (×10) για να αλλάξεις πόσα ζάρια ρίχνεις", HEIGHT-28, self.font_small)
+
+        self.present()
+
+    def result_text(self):
+        """
+        Λίγα ζάρια: κάθε ζάρι ξεχωριστά. Πολλά: άθροισμα, μέσος όρος και πόσες φορές βγήκε κάθε όψη.
+        Και στις δύο περιπτώσεις: πόσο πιθανό ήταν το άθροισμα και σε ποιο εκατοστημόριο πέφτει.
+        """
+        values = self.result_values
+        total = int(values.sum(dtype=np.int64))
+        dist = sum_distribution(self.dice_count)
+        odds = (f" Πιθανότητα {dist.probability(total)*100:.3g}%, "
+                f"εκατοστημόριο {dist.percentile(total):.0f}.")
+        if self.dice_count <= LIST_RESULT_MAX:
+            parts = [f"στο Zάρι{i+1}->{v}" for i, v in enumerate(values.tolist())]
+            return "Έφερες " + ", ".join(parts) + f". Συνολικό άθροισμα {total}." + odds
+        counts = np.bincount(values, minlength=7)[1:]
+        faces = ", ".join(f"{face}: {c}" for face, c in enumerate(counts.tolist(), start=1))
+        return (f"Έριξες {self.dice_count} ζάρια. Συνολικό άθροισμα {total} "
+                f"(μέσος όρος {total / self.dice_count:.2f}). Όψεις {faces}." + odds)
+
+    def set_dice_count(self, n):
+        self.dice_count = max(1, min(MAX_DICE, n))
+        self.start_roll()
+
+    def present(self):
+        """Overlay (αν φαίνεται) πάνω από όλα και μετά στην οθόνη."""
+        if self.overlay.visible:
+            self.dirty.changed("overlay", self.overlay.rect, self.stats.frames)
+            self.overlay.draw(self.screen, self.clock)
+        self.stats.mark("draw")
+        self.dirty.present()
+        self.stats.mark("flip")
+
+    def play_headless(self, dice_count, fps=FPS, draw=False):
+        """
+        Μία ολόκληρη ρίψη χωρίς input (για replay/benchmark, π.χ. με SDL_VIDEODRIVER=dummy).
+        Με SimClock ο χρόνος προχωράει χωρίς αναμονή, άρα τρέχει πιο γρήγορα από τον
+        πραγματικό. Επιστρέφει τις όψεις (1..6) κάθε frame· ίδιο seed -> ίδια λίστα.
+        """
+        self.dice_count = dice_count
+        self.start_roll()
+        frames = []
+        while self.state == "ROLLING":
+            self.clock.tick(fps)
+            self.update_rolling(draw=draw)
+            frames.append(tuple(self.shown_faces.tolist()))
+        if draw:
+            self.draw_result()
+        return frames
 
     def run(self):
         while True:
@@ -317,23 +486,50 @@ class DiceRoller:
                 self.ask_screen()
                 self.start_roll()
 
-            for event in pygame.event.get():
+            self.stats.begin_frame()
+            state = self.state
+            if self.state == "ROLLING":
+                self.update_rolling()
+            elif self.state == "RESULT":
+                self.draw_result()
+
+            # όσο γυρίζουν τα ζάρια (ή φαίνεται το overlay): σταθερό FPS, αλλιώς idle μέχρι το επόμενο input.
+            # Αν η κατάσταση άλλαξε σε αυτό το frame (ROLLING -> RESULT), ένα ακόμη frame
+            # χωρίς αναμονή, για να σχεδιαστεί η νέα οθόνη πριν μπλοκάρουμε.
+            active = (self.state == "ROLLING" or self.state != state or not self.idle
+                      or self.overlay.visible)
+            events = next_events(self.clock, active, FPS, self.idle_timeout)
+            self.stats.skip()
+            if self.sounds is not None:
+                self.sounds.events_polled()
+            for event in events:
+                if self.overlay.handle_event(event):
+                    if not self.overlay.visible:
+                        self.dirty.invalidate()   # σβήνουμε το overlay
+                    continue
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
+                if event.type == SOUND_LOADED:
+                    self.attach_sound()
+                if event.type == pygame.WINDOWEXPOSED:
+                    # το παράθυρο ξαναφάνηκε: χρειάζεται ολόκληρη οθόνη
+                    self.dirty.invalidate()
                 if event.type == pygame.KEYDOWN:
                     if event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
-                        self.dice_count = int(event.unicode)
-                        self.start_roll()
+                        self.set_dice_count(int(event.unicode))
+                    elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                        self.set_dice_count(self.dice_count * 10)
+                    elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                        self.set_dice_count(self.dice_count // 10)
                 if self.state == "RESULT" and event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                     if self.button_rect.collidepoint(event.pos):
                         self.start_roll()
-
-            if self.state == "ROLLING":
-                self.update_rolling()
-            elif self.state == "RESULT":
-                self.draw_result()
-
-            self.clock.tick(FPS)
+            self.stats.mark("event")
+            self.stats.end_frame()
 
 if __name__ == "__main__":
-    DiceRoller().run()
+    roller = DiceRoller()
+    # python main_enhanced.py 5000 -> ξεκινάει κατευθείαν με 5000 ζάρια
+    if len(sys.argv) > 1 and sys.argv[1].isdigit():
+        roller.set_dice_count(int(sys.argv[1]))
+    roller.run()
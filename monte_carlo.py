@@ -0,0 +1,187 @@
+import argparse
+import math
+import os
+import time
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from dice_engine import FACES, RollEngine
+from dice_stats import sum_distribution
+
+# ------------------------------
+# MONTE CARLO ΣΕ ΟΛΟΥΣ ΤΟΥΣ ΠΥΡΗΝΕΣ
+# ------------------------------
+# Η δουλειά χωρίζεται σε tasks σταθερού μεγέθους (TASK_TRIALS δοκιμές). Κάθε task παίρνει
+# δικό του seed από το SeedSequence(seed).spawn(), άρα:
+#   - οι ροές τυχαίων αριθμών είναι ανεξάρτητες μεταξύ τους
+#   - το αποτέλεσμα είναι ίδιο με όσους workers κι αν τρέξει (ίδιο seed -> ίδιοι αριθμοί)
+# Οι workers γράφουν τα αποτελέσματά τους σε έναν πίνακα multiprocessing.shared_memory
+# (μία γραμμή ανά task), οπότε τίποτα δεν γυρίζει πίσω με pickle.
+#   python monte_carlo.py exceed --dice 10 --threshold 40 --trials 20000000
+#   python monte_carlo.py doubles --trials 5000000
+#   python monte_carlo.py --scaling                 # ρίψεις/δευτ. για 1, 2, 4, ... workers
+
+TASK_TRIALS = 500_000     # δοκιμές ανά task
+BLOCK_DICE = 1 << 21      # ζάρια ανά κομμάτι μέσα σε ένα task (όριο μνήμης)
+DOUBLES_ROUND = 16        # ρίψεις ανά γύρο στην προσομοίωση «μέχρι να φέρεις διπλές»
+
+
+def _blocks(trials, per_block):
+    while trials > 0:
+        n = min(trials, per_block)
+        yield n
+        trials -= n
+
+
+# ---- Εργασίες: (engine, δοκιμές, παράμετροι) -> πίνακας int64 σταθερού πλάτους ----
+def _exceed_task(engine, trials, dice, threshold):
+    """[πόσες φορές άθροισμα > threshold, δοκιμές]."""
+    hits = 0
+    for n in _blocks(trials, max(1, BLOCK_DICE // dice)):
+        totals = engine.roll(n, dice, timing=False).sums()
+        hits += int(np.count_nonzero(totals > threshold))
+    return np.array([hits, trials], dtype=np.int64)
+
+
+def _sums_task(engine, trials, dice):
+    """Ιστόγραμμα αθροισμάτων (index 0 -> άθροισμα dice)."""
+    hist = np.zeros(dice * (FACES - 1) + 1, dtype=np.int64)
+    for n in _blocks(trials, max(1, BLOCK_DICE // dice)):
+        sums = engine.roll(n, dice, timing=False).sums()
+        hist += np.bincount(sums - dice, minlength=len(hist))
+    return hist
+
+
+def _doubles_task(engine, trials):
+    """[άθροισμα ρίψεων μέχρι διπλές, άθροισμα τετραγώνων, δοκιμές] με 2 ζάρια."""
+    out = np.zeros(3, dtype=np.int64)
+    for n in _blocks(trials, max(1, BLOCK_DICE // (2 * DOUBLES_ROUND))):
+        rolls = np.zeros(n, dtype=np.int64)
+        active = np.arange(n)
+        offset = 0
+        while len(active):
+            faces = engine.rng.integers(1, FACES + 1, size=(len(active), DOUBLES_ROUND, 2), dtype=np.uint8)
+            doubles = faces[:, :, 0] == faces[:, :, 1]
+            hit = doubles.any(axis=1)
+            rolls[active[hit]] = offset + doubles[hit].argmax(axis=1) + 1
+            active = active[~hit]
+            offset += DOUBLES_ROUND
+        out += (rolls.sum(), (rolls * rolls).sum(), n)
+    return out
+
+
+JOBS = {
+    "exceed": (_exceed_task, lambda p: 2),
+    "sums": (_sums_task, lambda p: p["dice"] * (FACES - 1) + 1),
+    "doubles": (_doubles_task, lambda p: 3),
+}
+
+
+def _worker(job, shm_name, width, row, trials, seed, params):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((width,), dtype=np.int64, buffer=shm.buf, offset=row * width * 8)
+        out[:] = JOBS[job][0](RollEngine(seed), trials, **params)
+        del out   # αλλιώς το close() αποτυγχάνει (υπάρχει ακόμα view στο buffer)
+    finally:
+        shm.close()
+
+
+def run(job, trials, workers=None, seed=None, task_trials=TASK_TRIALS, **params):
+    """
+    Τρέχει trials δοκιμές της εργασίας job σε workers processes (default: όλοι οι πυρήνες)
+    και επιστρέφει το άθροισμα των αποτελεσμάτων όλων των tasks.
+    """
+    if trials < 1:
+        raise ValueError(f"trials πρέπει να είναι >= 1 (δόθηκε {trials})")
+    workers = workers or os.cpu_count() or 1
+    n_tasks = max(1, math.ceil(trials / task_trials))
+    seeds = np.random.SeedSequence(seed).spawn(n_tasks)
+    width = JOBS[job][1](params)
+    shm = shared_memory.SharedMemory(create=True, size=n_tasks * width * 8)
+    try:
+        results = np.ndarray((n_tasks, width), dtype=np.int64, buffer=shm.buf)
+        results[:] = 0
+        tasks = [(job, shm.name, width, i, min(task_trials, trials - i * task_trials), seeds[i], params)
+                 for i in range(n_tasks)]
+        if workers == 1:
+            for task in tasks:
+                _worker(*task)
+        else:
+            with Pool(workers) as pool:
+                pool.starmap(_worker, tasks, chunksize=1)
+        totals = results.sum(axis=0)
+        del results
+    finally:
+        shm.close()
+        shm.unlink()
+    return totals
+
+
+# ---- Ερωτήσεις ----
+def prob_total_exceeds(dice, threshold, trials, workers=None, seed=None):
+    """P(άθροισμα dice ζαριών > threshold): (εκτίμηση, τυπικό σφάλμα, ακριβής τιμή)."""
+    hits, n = run("exceed", trials, workers, seed, dice=dice, threshold=threshold)
+    p = hits / n
+    exact = 1.0 - sum_distribution(dice).cumulative(threshold)
+    return p, math.sqrt(p * (1 - p) / n), exact
+
+
+def expected_rolls_until_doubles(trials, workers=None, seed=None):
+    """Μέσος αριθμός ρίψεων 2 ζαριών μέχρι να έρθουν διπλές: (εκτίμηση, τυπικό σφάλμα, ακριβής = 6)."""
+    total, total_sq, n = run("doubles", trials, workers, seed)
+    mean = total / n
+    var = total_sq / n - mean * mean
+    return mean, math.sqrt(var / n), float(FACES)
+
+
+def sum_histogram(dice, trials, workers=None, seed=None):
+    """Ιστόγραμμα αθροισμάτων από trials ρίψεις (για σύγκριση με dice_stats)."""
+    return run("sums", trials, workers, seed, dice=dice)
+
+
+def scaling(trials, dice, max_workers=None):
+    """Ρίψεις/δευτ. για 1, 2, 4, ... workers μέχρι τους πυρήνες του μηχανήματος."""
+    max_workers = max_workers or os.cpu_count() or 1
+    counts = sorted({1 << i for i in range(max_workers.bit_length()) if 1 << i <= max_workers} | {max_workers})
+    base = None
+    for w in counts:
+        t0 = time.perf_counter()
+        run("exceed", trials, w, seed=1, dice=dice, threshold=dice * 4)
+        rate = trials * dice / (time.perf_counter() - t0)
+        base = base or rate
+        print(f"{w:3d} workers: {rate / 1e6:8.1f}M ζάρια/δευτ.  x{rate / base:5.2f}  "
+              f"(απόδοση {rate / base / w * 100:5.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo ρίψεων σε όλους τους πυρήνες")
+    parser.add_argument("question", nargs="?", choices=["exceed", "doubles"], default="exceed")
+    parser.add_argument("--dice", type=int, default=10)
+    parser.add_argument("--threshold", type=int, default=40)
+    parser.add_argument("--trials", type=float, default=10_000_000)
+    parser.add_argument("--workers", type=int, default=0, help="default: όλοι οι πυρήνες")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--scaling", action="store_true", help="benchmark κλιμάκωσης με τους workers")
+    args = parser.parse_args()
+    trials = int(args.trials)
+    if trials < 1:
+        parser.error(f"--trials πρέπει να είναι >= 1 (δόθηκε {args.trials:g})")
+
+    if args.scaling:
+        scaling(trials, args.dice)
+        return
+
+    t0 = time.perf_counter()
+    if args.question == "exceed":
+        p, err, exact = prob_total_exceeds(args.dice, args.threshold, trials, args.workers or None, args.seed)
+        print(f"P(άθροισμα {args.dice} ζαριών > {args.threshold}) ≈ {p:.6f} ± {err:.6f} (ακριβής {exact:.6f})")
+    else:
+        mean, err, exact = expected_rolls_until_doubles(trials, args.workers or None, args.seed)
+        print(f"Ρίψεις μέχρι διπλές ≈ {mean:.4f} ± {err:.4f} (ακριβής {exact:.0f})")
+    print(f"{trials} δοκιμές σε {time.perf_counter() - t0:.2f} s με {args.workers or os.cpu_count()} workers")
+
+
+if __name__ == "__main__":
+    main()
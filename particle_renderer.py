@@ -0,0 +1,189 @@
+import time
+
+import numpy as np
+import pygame
+
+# ------------------------------
+# ΣΧΕΔΙΑΣΗ ΠΟΛΛΩΝ ΙΔΙΩΝ ΣΩΜΑΤΙΔΙΩΝ (νιφάδες κ.λπ.)
+# ------------------------------
+# Δύο τρόποι, και οι δύο χωρίς μία κλήση Python ανά σωματίδιο:
+#   "blits":     ένα έτοιμο sprite (draw.circle με colorkey) και ένα Surface.blits για όλα
+#   "surfarray": τα pixels του κύκλου γράφονται κατευθείαν στη μνήμη της επιφάνειας,
+#                με ένα vectorized assignment NumPy για όλα τα σωματίδια μαζί
+# Το blits έχει μικρό σταθερό κόστος αλλά ~0.7 μs ανά σωματίδιο· το surfarray ~0.15 ms
+# σταθερά και ~0.09 μs ανά σωματίδιο. Με mode="auto" διαλέγεται το blits μέχρι blits_max
+# σωματίδια και το surfarray πάνω από αυτό. Όταν τα σωματίδια καλύπτουν μεγάλο μέρος της
+# οθόνης, το surfarray βάφει μέσω ενός bitmap όλης της οθόνης (~2 ms στα 700x500 είτε για
+# 20.000 είτε για 1.000.000 σωματίδια). Το αποτέλεσμα είναι ίδιο pixel προς pixel.
+#   python particle_renderer.py        # μετράει και τους δύο τρόπους και το σημείο που αλλάζει
+
+RENDER_MODES = ("auto", "blits", "surfarray")
+BLITS_MAX = 600          # μετρημένο στα 700x500 (βλ. calibrate)
+DILATE_FILL = 0.5        # surfarray: πάνω από τόσα pixels σχήματος / pixels οθόνης -> bitmap
+
+
+class ParticleRenderer:
+
+    def __init__(self, radius=2, color=(255, 255, 255), mode="auto", blits_max=BLITS_MAX):
+        if mode not in RENDER_MODES:
+            raise ValueError(f"mode πρέπει να είναι ένα από {RENDER_MODES}")
+        self.radius = radius
+        self.color = color
+        self.mode = mode
+        self.blits_max = blits_max
+        self.last_mode = None
+        self._sprite = None
+        self._stamp = None
+
+    # ---- τα δύο «σχήματα» του σωματιδίου ----
+    def _circle(self):
+        size = self.radius * 2 + 3
+        c = size // 2
+        key = tuple(255 - v for v in self.color[:3])
+        tmp = pygame.Surface((size, size))
+        tmp.fill(key)
+        pygame.draw.circle(tmp, self.color, (c, c), self.radius)
+        return tmp, key, c
+
+    def sprite(self):
+        """Το sprite για το blits και η μετατόπιση από το κέντρο στην πάνω-αριστερή γωνία."""
+        if self._sprite is None:
+            tmp, key, c = self._circle()
+            if pygame.display.get_surface() is not None:
+                tmp = tmp.convert()
+            tmp.set_colorkey(key, pygame.RLEACCEL)
+            self._sprite = (tmp, c)
+        return self._sprite
+
+    def stamp(self):
+        """Τα pixels (dx, dy) που βάφει το pygame.draw.circle(radius) γύρω από το κέντρο."""
+        if self._stamp is None:
+            tmp, key, c = self._circle()
+            mask = pygame.surfarray.array2d(tmp) != tmp.map_rgb(key)
+            dx, dy = np.nonzero(mask)
+            self._stamp = (dx - c, dy - c)
+        return self._stamp
+
+    # ---- σχεδίαση ----
+    def mode_for(self, surface, count):
+        if surface.get_bytesize() != 4:
+            return "blits"
+        if self.mode != "auto":
+            return self.mode
+        return "blits" if count <= self.blits_max else "surfarray"
+
+    def draw(self, surface, x, y):
+        """x, y: πίνακες με τα κέντρα (το κέντρο στρογγυλεύεται προς τα κάτω, όπως στο draw.circle)."""
+        ix = np.asarray(x).astype(np.int32)
+        iy = np.asarray(y).astype(np.int32)
+        self.last_mode = self.mode_for(surface, len(ix))
+        if self.last_mode == "blits":
+            self._draw_blits(surface, ix, iy)
+        else:
+            self._draw_surfarray(surface, ix, iy)
+
+    def _draw_blits(self, surface, ix, iy):
+        sprite, c = self.sprite()
+        surface.blits([(sprite, p) for p in zip((ix - c).tolist(), (iy - c).tolist())], doreturn=0)
+
+    def _draw_surfarray(self, surface, ix, iy):
+        w, h = surface.get_size()
+        dx, dy = self.stamp()
+        color = surface.map_rgb(self.color)
+        # ίδια μνήμη με το surfarray.pixels2d, αλλά σε σειρά γραμμών (y, x)
+        pitch = surface.get_pitch() // 4
+        pixels = np.frombuffer(surface.get_buffer(), dtype=np.uint32)
+        if len(ix) * len(dx) > w * h * DILATE_FILL:
+            self._fill_dilated(pixels.reshape(h, pitch)[:, :w], ix, iy, dx, dy, color)
+        else:
+            self._scatter(pixels, pitch, w, h, ix, iy, dx, dy, color)
+        del pixels   # ξεκλειδώνει την επιφάνεια
+
+    def _scatter(self, pixels, pitch, w, h, ix, iy, dx, dy, color):
+        """Ένα index ανά pixel του σχήματος ανά σωματίδιο (επίπεδα indices: ~2x από ζεύγη (x, y))."""
+        r = self.radius + 1
+        offsets = (dy * pitch + dx).astype(np.int64)
+
+        # σωματίδια μακριά από τις άκρες: όλο το σχήμα χωράει, κανένας έλεγχος ανά pixel
+        inner = (ix >= r) & (ix < w - r) & (iy >= r) & (iy < h - r)
+        base = iy[inner].astype(np.int64) * pitch + ix[inner]
+        pixels[(base[:, None] + offsets[None, :]).ravel()] = color
+
+        # σωματίδια στις άκρες (λίγα): κόβουμε ό,τι βγαίνει έξω
+        edge = ~inner
+        if edge.any():
+            ex, ey = ix[edge], iy[edge]
+            for ox, oy in zip(dx.tolist(), dy.tolist()):
+                px, py = ex + ox, ey + oy
+                ok = (px >= 0) & (px < w) & (py >= 0) & (py < h)
+                pixels[py[ok].astype(np.int64) * pitch + px[ok]] = color
+
+    def _fill_dilated(self, view, ix, iy, dx, dy, color):
+        """
+        Πολλά σωματίδια: τα κέντρα σημειώνονται σε ένα bitmap της οθόνης (με περιθώριο r),
+        το bitmap «φουσκώνει» με ένα OR ανά pixel του σχήματος (μετατοπισμένο αντίγραφο
+        όλου του bitmap) και βάφεται με ένα copyto. Κόστος ~ εμβαδόν οθόνης, όχι πλήθος.
+        Το περιθώριο r κρατάει ό,τι «αναδιπλώνεται» από γραμμή σε γραμμή έξω από την οθόνη.
+        """
+        h, w = view.shape
+        r = self.radius + 1
+        W, H = w + 2 * r, h + 2 * r
+        ok = (ix >= -r) & (ix < w + r) & (iy >= -r) & (iy < h + r)
+        centers = np.zeros(H * W, dtype=bool)
+        centers[(iy[ok] + r) * W + (ix[ok] + r)] = True
+        cover = np.zeros_like(centers)
+        for o in (dy * W + dx).tolist():
+            if o > 0:
+                cover[o:] |= centers[:-o]
+            elif o < 0:
+                cover[:o] |= centers[-o:]
+            else:
+                cover |= centers
+        np.copyto(view, np.uint32(color), where=cover.reshape(H, W)[r:r + h, r:r + w])
+
+    # ---- μέτρηση ----
+    def time_mode(self, surface, mode, count, repeat=5, seed=0):
+        """ms ανά draw με count τυχαία σωματίδια (σε αντίγραφο της surface)."""
+        target = surface.copy()
+        rng = np.random.default_rng(seed)
+        w, h = surface.get_size()
+        x, y = rng.integers(0, w, count), rng.integers(0, h, count)
+        saved, self.mode = self.mode, mode
+        try:
+            self.draw(target, x, y)          # ζέσταμα (sprite/stamp)
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                self.draw(target, x, y)
+            return (time.perf_counter() - t0) / repeat * 1000.0
+        finally:
+            self.mode = saved
+
+    def calibrate(self, surface, small=256, large=4096):
+        """
+        Μετράει τους δύο τρόπους σε small και large σωματίδια, βρίσκει πού τέμνονται οι
+        (σχεδόν γραμμικοί) χρόνοι τους και το κρατάει ως blits_max.
+        """
+        cost = {}
+        for mode in ("blits", "surfarray"):
+            t_small = self.time_mode(surface, mode, small)
+            t_large = self.time_mode(surface, mode, large)
+            per = (t_large - t_small) / (large - small)
+            cost[mode] = (t_small - per * small, per)
+        (b0, b1), (s0, s1) = cost["blits"], cost["surfarray"]
+        if b1 > s1:
+            self.blits_max = max(0, int((s0 - b0) / (b1 - s1)))
+        return self.blits_max
+
+
+if __name__ == "__main__":
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((700, 500))
+    renderer = ParticleRenderer()
+    print(f"{'σωματίδια':>10} {'blits ms':>10} {'surfarray ms':>13}")
+    for count in (50, 200, 1000, 5000, 20000, 100000):
+        t_b = renderer.time_mode(screen, "blits", count, repeat=3)
+        t_s = renderer.time_mode(screen, "surfarray", count, repeat=3)
+        print(f"{count:10d} {t_b:10.3f} {t_s:13.3f}")
+    print(f"auto: blits μέχρι {renderer.calibrate(screen)} σωματίδια (default {BLITS_MAX})")
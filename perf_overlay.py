@@ -0,0 +1,201 @@
+import time
+from collections import deque
+
+import pygame
+
+from sprite_cache import SPRITE_CACHE
+from text_cache import TEXT_CACHE
+
+PHASES = ("event", "update", "draw", "flip")
+PHASE_COLORS = {"event": (90, 170, 255), "update": (120, 220, 120),
+                "draw": (255, 200, 80), "flip": (230, 100, 100)}
+OVERLAY_BG = (10, 10, 10)
+OVERLAY_TEXT = (230, 230, 230)
+CACHE_SOURCES = ("text_cache", "sprite_cache")   # έχουν δική τους γραμμή στο overlay
+GRAPH_MAX_MS = 33.3       # ύψος γραφήματος = 2 frames των 60 FPS
+FRAME_BUDGET_MS = 1000.0 / 60
+
+
+class FrameStats:
+    """
+    Μετράει πόσο κρατάει κάθε φάση του frame (event, update, draw, flip).
+
+    Χρήση στο loop:
+        stats.begin_frame()
+        ... update ...;  stats.mark("update")
+        ... draw ...;    stats.mark("draw")
+        flip();          stats.mark("flip")
+        wait/tick();     stats.skip()          # η αναμονή δεν μετράει
+        ... events ...;  stats.mark("event")
+        stats.end_frame()
+
+    Hook API: stats.add_hook(fn) -> fn(frame_ms, phases) σε κάθε end_frame,
+    stats.add_source(name, fn) -> extra μετρήσεις στο snapshot() (fn επιστρέφει dict).
+    """
+
+    def __init__(self, history=120):
+        self.history = deque(maxlen=history)   # (frame_ms, {φάση: ms})
+        self.frames = 0
+        self.phases = {}
+        self._t = None
+        self._hooks = []
+        self._sources = {
+            "text_cache": TEXT_CACHE.stats,
+            "sprite_cache": SPRITE_CACHE.stats,
+        }
+
+    def begin_frame(self):
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self._t = time.perf_counter()
+
+    def mark(self, phase):
+        """Ο χρόνος από το προηγούμενο mark πάει στη φάση phase (μόνο μέσα σε frame)."""
+        if self._t is None:
+            return
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._t) * 1000.0
+        self._t = now
+
+    def skip(self):
+        """Ο χρόνος από το προηγούμενο mark δεν μετράει (π.χ. clock.tick / event.wait)."""
+        if self._t is not None:
+            self._t = time.perf_counter()
+
+    def end_frame(self):
+        if self._t is None:
+            return
+        frame_ms = sum(self.phases.values())
+        self.history.append((frame_ms, self.phases))
+        self.frames += 1
+        self._t = None
+        for hook in self._hooks:
+            hook(frame_ms, self.phases)
+
+    def add_hook(self, fn):
+        self._hooks.append(fn)
+
+    def remove_hook(self, fn):
+        self._hooks.remove(fn)
+
+    def add_source(self, name, fn):
+        self._sources[name] = fn
+
+    def averages(self):
+        """Μέσος χρόνος ανά φάση στο ιστορικό (ms)."""
+        if not self.history:
+            return dict.fromkeys(PHASES, 0.0)
+        out = {}
+        for _, phases in self.history:
+            for name, ms in phases.items():
+                out[name] = out.get(name, 0.0) + ms
+        return {name: ms / len(self.history) for name, ms in out.items()}
+
+    def snapshot(self, clock=None):
+        """Όλες οι μετρήσεις σε ένα dict (για logs ή εξωτερικά εργαλεία)."""
+        times = [ms for ms, _ in self.history]
+        data = {
+            "frames": self.frames,
+            "fps": clock.get_fps() if clock is not None else None,
+            "frame_ms_avg": sum(times) / len(times) if times else 0.0,
+            "frame_ms_max": max(times) if times else 0.0,
+            "phases_ms": self.averages(),
+        }
+        for name, fn in self._sources.items():
+            data[name] = fn()
+        return data
+
+
+def _format_value(key, value):
+    # οι αριθμοί (int και float) χρειάζονται όνομα· τα strings (status, αρχείο) εξηγούνται μόνα τους
+    if isinstance(value, float):
+        return f"{key} {value:.1f}"
+    if isinstance(value, int) and not isinstance(value, bool):
+        return f"{key} {value}"
+    return str(value)
+
+
+def _wrap(font, head, parts, width):
+    """head και οι parts σε όσες γραμμές χρειάζεται για να χωράνε σε width pixels."""
+    lines, line = [], head
+    for part in parts:
+        candidate = line + part if line == head else f"{line}  {part}"
+        if line != head and font.size(candidate)[0] > width:
+            lines.append(line)
+            line = "  " + part
+        else:
+            line = candidate
+    lines.append(line)
+    return lines
+
+
+class PerfOverlay:
+    """Πάνελ με τις μετρήσεις του FrameStats· εμφανίζεται/κρύβεται με F3."""
+
+    def __init__(self, stats, toggle_key=pygame.K_F3, pos=(8, 8), size=(300, 150)):
+        self.stats = stats
+        self.toggle_key = toggle_key
+        self.visible = False
+        self.rect = pygame.Rect(pos, size)
+        self._font = None
+
+    def handle_event(self, event):
+        """True αν το event ήταν το πλήκτρο εναλλαγής."""
+        if event.type == pygame.KEYDOWN and event.key == self.toggle_key:
+            self.visible = not self.visible
+            return True
+        return False
+
+    def font(self):
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            from startup import get_font
+            self._font = get_font(18)
+        return self._font
+
+    def draw(self, surface, clock=None):
+        """Ζωγραφίζει το πάνελ (αν φαίνεται) και επιστρέφει το rect του, αλλιώς None."""
+        if not self.visible:
+            return None
+        font = self.font()
+        pygame.draw.rect(surface, OVERLAY_BG, self.rect)
+        x, y = self.rect.x + 6, self.rect.y + 4
+
+        data = self.stats.snapshot(clock)
+        phases = data["phases_ms"]
+        fps = data["fps"]
+        lines = [
+            f"FPS {fps:.1f}   frame {data['frame_ms_avg']:.2f} ms (max {data['frame_ms_max']:.1f})"
+            if fps is not None else f"frame {data['frame_ms_avg']:.2f} ms",
+            "  ".join(f"{name} {phases.get(name, 0.0):.2f}" for name in PHASES),
+            f"text cache {data['text_cache']['hit_rate']*100:.0f}%   "
+            f"sprite cache {data['sprite_cache']['hit_rate']*100:.0f}%",
+        ]
+        # οι υπόλοιπες πηγές (add_source), μία γραμμή η καθεμία
+        for name, values in data.items():
+            if name in CACHE_SOURCES or not isinstance(values, dict) or name == "phases_ms":
+                continue
+            parts = [_format_value(k, v) for k, v in values.items() if v not in (None, "")]
+            lines.extend(_wrap(font, f"{name}: ", parts, self.rect.width - 12))
+        # font.render κατευθείαν: οι γραμμές αλλάζουν σε κάθε frame και στο TEXT_CACHE απλώς θα
+        # έδιωχναν τα κείμενα του παιχνιδιού και θα χαλούσαν το hit rate που δείχνουμε
+        for ln in lines:
+            img = font.render(ln, True, OVERLAY_TEXT)
+            surface.blit(img, (x, y))
+            y += img.get_height() + 1
+
+        # γράφημα: μία στήλη ανά frame, χρωματισμένη ανά φάση
+        graph = pygame.Rect(x, y + 4, self.rect.width - 12, self.rect.bottom - y - 10)
+        history = list(self.stats.history)[-graph.width:]
+        scale = graph.height / GRAPH_MAX_MS
+        for i, (_, frame_phases) in enumerate(history):
+            bottom = graph.bottom
+            for name in PHASES:
+                h = int(frame_phases.get(name, 0.0) * scale)
+                if h > 0:
+                    top = max(graph.top, bottom - h)
+                    pygame.draw.line(surface, PHASE_COLORS[name], (graph.x + i, bottom), (graph.x + i, top))
+                    bottom = top
+        budget_y = graph.bottom - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surface, (120, 120, 120), (graph.x, budget_y), (graph.right, budget_y))
+        return self.rect
@@ -0,0 +1,76 @@
+import argparse
+import hashlib
+import os
+import time
+
+# headless: χωρίς παράθυρο και χωρίς κάρτα ήχου (αν δεν έχει οριστεί κάτι άλλο)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from die_state import CyclingDieState, DieState, RandomDieState, run_session
+from sim_clock import SimClock, make_rng
+
+# ------------------------------
+# REPLAY / BENCHMARK ΡΙΨΕΩΝ
+# ------------------------------
+# Τρέχει ολόκληρες ρίψεις με εικονικό ρολόι (SimClock) και seeded rng, χωρίς αναμονή.
+# Ίδιο --seed -> ίδια ακολουθία όψεων (το digest στο τέλος πρέπει να βγαίνει ίδιο).
+#   python replay.py --seed 42 --sessions 5000
+#   python replay.py --seed 42 --sessions 5000 --target main
+#   python replay.py --seed 42 --sessions 200 --target roller --dice 4
+
+
+def replay_die_states(die_cls, sessions, seed, dice=2, fps=60):
+    """Sessions με τις κλάσεις του die_state.py (καμία σχέση με pygame)."""
+    rng = make_rng(seed)
+    clock = SimClock()
+    dice_list = [die_cls(rng) for _ in range(dice)]
+    for _ in range(sessions):
+        yield run_session(dice_list, clock, fps)
+        clock.advance(500)   # μικρή παύση ανάμεσα στις ρίψεις
+
+
+def replay_roller(sessions, seed, dice=2, fps=60, draw=False):
+    """Sessions με ολόκληρο τον DiceRoller του main_enhanced.py (με dummy οθόνη)."""
+    from main_enhanced import DiceRoller
+    roller = DiceRoller(idle=False, clock=SimClock(), seed=seed, roll_log=None)
+    for _ in range(sessions):
+        yield roller.play_headless(dice, fps=fps, draw=draw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless replay/benchmark των ρίψεων")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--dice", type=int, default=2)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--target", choices=["alternative", "cycling", "main", "roller"], default="alternative",
+                        help="alternative=DieState, cycling=CyclingDieState, main=RandomDieState, "
+                             "roller=DiceRoller")
+    parser.add_argument("--draw", action="store_true", help="roller: ζωγραφίζει και κάθε frame")
+    parser.add_argument("--show", type=int, default=0, help="τυπώνει τα frames των πρώτων N sessions")
+    args = parser.parse_args()
+
+    if args.target == "roller":
+        runs = replay_roller(args.sessions, args.seed, args.dice, args.fps, args.draw)
+    else:
+        die_cls = {"alternative": DieState, "cycling": CyclingDieState, "main": RandomDieState}[args.target]
+        runs = replay_die_states(die_cls, args.sessions, args.seed, args.dice, args.fps)
+
+    digest = hashlib.sha1()
+    frames_total = 0
+    t0 = time.perf_counter()
+    for i, frames in enumerate(runs):
+        frames_total += len(frames)
+        digest.update(repr(frames).encode())
+        if i < args.show:
+            print(f"session {i}: {frames}")
+    elapsed = time.perf_counter() - t0
+
+    print(f"{args.target}: {args.sessions} sessions, {frames_total} frames σε {elapsed:.3f} s "
+          f"-> {args.sessions / elapsed:.0f} sessions/δευτ.")
+    print(f"seed {args.seed} digest {digest.hexdigest()[:16]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from dice_engine import FACES, RollEngine
+from dice_stats import check_faces, chi_square, sum_distribution
+
+# ------------------------------
+# ΙΣΤΟΡΙΚΟ ΡΙΨΕΩΝ (append-only, memory-mapped)
+# ------------------------------
+# Δύο αρχεία που μόνο μεγαλώνουν:
+#   <path>        header + μία εγγραφή σταθερού μεγέθους ανά ρίψη (INDEX_DTYPE, 24 bytes)
+#   <path>.faces  οι όψεις όλων των ρίψεων στη σειρά, 1 byte η καθεμία
+# Οι ερωτήσεις διαβάζουν τα αρχεία με np.memmap σε κομμάτια (CHUNK), οπότε δουλεύουν
+# και για εκατοντάδες εκατομμύρια ρίψεις χωρίς να φτιαχτεί ένα Python object ανά ρίψη.
+#   python roll_log.py                      # σύνοψη + έλεγχος δικαιοσύνης του rolls.log
+#   python roll_log.py --window 3600        # στατιστικά ανά ώρα
+#   python roll_log.py /tmp/big.log --generate 50000000 --dice 2   # συνθετικό log για benchmark
+#   python roll_log.py --check              # ανάκαμψη μετά από crash στη μέση ενός append
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LOG = os.environ.get("DICE_ROLL_LOG", os.path.join(BASE_DIR, "rolls.log"))
+
+MAGIC = b"DICELOG1"
+HEADER_SIZE = 16   # magic + μέγεθος εγγραφής + padding
+INDEX_DTYPE = np.dtype([
+    ("t_us", "<i8"),     # χρόνος (unix, μικροδευτερόλεπτα)· δεν μικραίνει ποτέ μέσα στο log
+    ("dice", "<u4"),     # πλήθος ζαριών
+    ("total", "<u4"),    # άθροισμα (για ιστογράμματα χωρίς να διαβαστούν οι όψεις)
+    ("offset", "<u8"),   # θέση της πρώτης όψης στο .faces
+])
+CHUNK = 1 << 22    # εγγραφές (ή όψεις x16) ανά κομμάτι επεξεργασίας
+
+
+class RollLog:
+    """
+    Append-only log ρίψεων. append() για μία ρίψη, append_many() για πολλές με
+    ίδιο πλήθος ζαριών. Οι ερωτήσεις (total_histogram, face_frequencies,
+    window_stats, audit) δέχονται προαιρετικά χρονικό παράθυρο [t0, t1) σε
+    δευτερόλεπτα unix.
+    """
+
+    def __init__(self, path=DEFAULT_LOG, readonly=False):
+        self.path = path
+        self.faces_path = path + ".faces"
+        self.readonly = readonly
+        self._index = self._faces = None
+        self._last_t = 0
+        self._next_offset = 0
+        if readonly:
+            if not os.path.exists(path):
+                raise FileNotFoundError(path)
+        else:
+            self._open_for_append()
+        self._check_header()
+        if not readonly:
+            self._repair()
+        count = len(self)
+        if count:
+            last = self.records()[count - 1]
+            self._last_t = int(last["t_us"])
+            self._next_offset = int(last["offset"]) + int(last["dice"])
+
+    # ---- εγγραφή ----
+    def _open_for_append(self):
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) < HEADER_SIZE
+        self._index = open(self.path, "ab")
+        self._faces = open(self.faces_path, "ab")
+        if new:
+            self._index.truncate(0)
+            self._index.write(MAGIC + INDEX_DTYPE.itemsize.to_bytes(4, "little") + bytes(4))
+            self._index.flush()
+
+    def _repair(self):
+        """
+        Μετά από crash στη μέση ενός append: κόβει τη μισογραμμένη τελευταία εγγραφή,
+        τις εγγραφές που δείχνουν σε όψεις που δεν γράφτηκαν ολόκληρες και τις όψεις
+        που γράφτηκαν χωρίς εγγραφή. Αλλιώς το επόμενο append θα έπεφτε μετά τα
+        σκουπίδια και όλες οι επόμενες εγγραφές θα ήταν λάθος.
+        """
+        faces_size = os.path.getsize(self.faces_path)
+        count = len(self)
+        if count:
+            records = self.records()
+            ends = records["offset"] + records["dice"]
+            count = int(np.searchsorted(ends, faces_size, "right"))
+            del records, ends
+        index_size = HEADER_SIZE + count * INDEX_DTYPE.itemsize
+        if os.path.getsize(self.path) != index_size:
+            self._index.truncate(index_size)
+        next_offset = 0
+        if count:
+            last = self.records()[count - 1]
+            next_offset = int(last["offset"]) + int(last["dice"])
+        if faces_size != next_offset:
+            self._faces.truncate(next_offset)
+
+    def _check_header(self):
+        with open(self.path, "rb") as f:
+            head = f.read(HEADER_SIZE)
+        if head[:8] != MAGIC or int.from_bytes(head[8:12], "little") != INDEX_DTYPE.itemsize:
+            raise ValueError(f"{self.path}: δεν είναι log ρίψεων (ή άλλη έκδοση)")
+
+    def append(self, faces, t=None):
+        """Μία ρίψη: faces = όψεις 1..6 (λίστα ή numpy πίνακας)."""
+        self.append_many(np.asarray(faces, dtype=np.uint8).reshape(1, -1), t)
+
+    def append_many(self, faces, t=None):
+        """Πολλές ρίψεις με ίδιο πλήθος ζαριών: faces σε σχήμα (ρίψεις, ζάρια)."""
+        if self.readonly:
+            raise IOError("το log άνοιξε μόνο για ανάγνωση")
+        faces = np.ascontiguousarray(faces, dtype=np.uint8)
+        rolls, dice = faces.shape
+        t_us = int((time.time() if t is None else t) * 1_000_000)
+        t_us = max(t_us, self._last_t)   # μονότονος χρόνος -> αναζήτηση με searchsorted
+        records = np.empty(rolls, dtype=INDEX_DTYPE)
+        records["t_us"] = t_us
+        records["dice"] = dice
+        records["total"] = faces.sum(axis=1, dtype=np.uint32)
+        records["offset"] = self._next_offset + np.arange(rolls, dtype=np.uint64) * dice
+        # πρώτα οι όψεις, μετά η εγγραφή που δείχνει σε αυτές
+        self._faces.write(faces.tobytes())
+        self._faces.flush()
+        self._index.write(records.tobytes())
+        self._index.flush()
+        self._last_t = t_us
+        self._next_offset += rolls * dice
+
+    def close(self):
+        for f in (self._index, self._faces):
+            if f is not None:
+                f.close()
+        self._index = self._faces = None
+
+    # ---- ανάγνωση ----
+    def __len__(self):
+        size = os.path.getsize(self.path) - HEADER_SIZE
+        return max(0, size // INDEX_DTYPE.itemsize)   # μισογραμμένη τελευταία εγγραφή αγνοείται
+
+    def records(self):
+        """Όλες οι εγγραφές ως np.memmap (τίποτα δεν διαβάζεται μέχρι να χρειαστεί)."""
+        count = len(self)
+        if not count:
+            return np.zeros(0, dtype=INDEX_DTYPE)
+        return np.memmap(self.path, dtype=INDEX_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+    def faces(self):
+        size = os.path.getsize(self.faces_path) if os.path.exists(self.faces_path) else 0
+        if not size:
+            return np.zeros(0, dtype=np.uint8)
+        return np.memmap(self.faces_path, dtype=np.uint8, mode="r")
+
+    def window(self, t0=None, t1=None):
+        """(start, stop) των εγγραφών με t0 <= χρόνος < t1 (δευτερόλεπτα unix)."""
+        t = self.records()["t_us"]
+        start = 0 if t0 is None else int(np.searchsorted(t, int(t0 * 1_000_000), "left"))
+        stop = len(t) if t1 is None else int(np.searchsorted(t, int(t1 * 1_000_000), "left"))
+        return start, stop
+
+    def _chunks(self, t0, t1):
+        records = self.records()
+        start, stop = self.window(t0, t1)
+        for lo in range(start, stop, CHUNK):
+            yield records[lo:min(stop, lo + CHUNK)]
+
+    def dice_counts(self, t0=None, t1=None):
+        """{πλήθος ζαριών: πόσες ρίψεις}."""
+        counts = {}
+        for chunk in self._chunks(t0, t1):
+            values, n = np.unique(chunk["dice"], return_counts=True)
+            for v, c in zip(values.tolist(), n.tolist()):
+                counts[v] = counts.get(v, 0) + c
+        return counts
+
+    def total_histogram(self, dice, t0=None, t1=None):
+        """Συχνότητες αθροισμάτων για ρίψεις με dice ζάρια (index 0 -> άθροισμα dice)."""
+        hist = np.zeros(dice * (FACES - 1) + 1, dtype=np.int64)
+        for chunk in self._chunks(t0, t1):
+            totals = chunk["total"][chunk["dice"] == dice]
+            hist += np.bincount(totals - dice, minlength=len(hist))[:len(hist)]
+        return hist
+
+    def face_frequencies(self, t0=None, t1=None):
+        """Πόσες φορές βγήκε κάθε όψη 1..6 στο παράθυρο."""
+        records = self.records()
+        start, stop = self.window(t0, t1)
+        counts = np.zeros(FACES, dtype=np.int64)
+        if start >= stop:
+            return counts
+        first = int(records[start]["offset"])
+        last = int(records[stop - 1]["offset"]) + int(records[stop - 1]["dice"])
+        faces = self.faces()
+        step = CHUNK * 16
+        for lo in range(first, last, step):
+            counts += np.bincount(faces[lo:min(last, lo + step)], minlength=FACES + 1)[1:FACES + 1]
+        return counts
+
+    def window_stats(self, bucket_s, t0=None, t1=None):
+        """
+        Στατιστικά ανά χρονικό διάστημα bucket_s δευτερολέπτων: λίστα από dict με
+        αρχή του διαστήματος, ρίψεις, ζάρια, μέσο όρο ανά ζάρι και συχνότητες όψεων.
+        """
+        records = self.records()
+        start, stop = self.window(t0, t1)
+        if start >= stop:
+            return []
+        step = int(bucket_s * 1_000_000)
+        t = records["t_us"]
+        first = int(t[start]) // step * step
+        edges = np.arange(first, int(t[stop - 1]) + step, step)
+        bounds = np.searchsorted(t[start:stop], edges, "left") + start
+        out = []
+        for i in range(len(edges)):
+            lo, hi = int(bounds[i]), int(bounds[i + 1]) if i + 1 < len(bounds) else stop
+            if lo >= hi:
+                continue
+            seg = records[lo:hi]
+            dice = int(seg["dice"].sum(dtype=np.int64))
+            faces = self.face_frequencies(edges[i] / 1e6, (edges[i] + step) / 1e6)
+            out.append({
+                "t": edges[i] / 1e6,
+                "rolls": hi - lo,
+                "dice": dice,
+                "mean_face": float(seg["total"].sum(dtype=np.int64)) / dice if dice else 0.0,
+                "faces": faces.tolist(),
+            })
+        return out
+
+    def audit(self, t0=None, t1=None):
+        """
+        Έλεγχος δικαιοσύνης: chi-square για τις όψεις και για τα αθροίσματα κάθε
+        πλήθους ζαριών απέναντι στην ακριβή κατανομή (dice_stats.py).
+        """
+        stat, dof, p = check_faces(self.face_frequencies(t0, t1))
+        report = {"faces": {"chi2": stat, "dof": dof, "p": p}, "totals": {}}
+        for dice, rolls in sorted(self.dice_counts(t0, t1).items()):
+            hist = self.total_histogram(dice, t0, t1)
+            stat, dof, p = chi_square(hist, sum_distribution(dice).pmf)
+            report["totals"][dice] = {"rolls": rolls, "chi2": stat, "dof": dof, "p": p}
+        return report
+
+
+def generate(log, rolls, dice, seed=1, chunk=1_000_000):
+    """Γεμίζει ένα log με συνθετικές ρίψεις (για benchmark των ερωτήσεων)."""
+    engine = RollEngine(seed)
+    t = time.time()
+    per_chunk = max(1, chunk // dice)
+    done = 0
+    while done < rolls:
+        n = min(per_chunk, rolls - done)
+        log.append_many(engine.roll(n, dice, timing=False).faces, t + done / 1000.0)
+        done += n
+
+
+def check_recovery(directory):
+    """
+    Προσομοιώνει crash στη μέση ενός append (όψεις χωρίς εγγραφή, μισή εγγραφή),
+    ξανανοίγει το log, γράφει κι άλλες ρίψεις και ελέγχει ότι όλες διαβάζονται σωστά.
+    Επιστρέφει [(περίπτωση, True/False)].
+    """
+    record = INDEX_DTYPE.itemsize
+    cases = (("όψεις χωρίς εγγραφή", b"\x06\x06", b""),
+             ("μισή εγγραφή", b"\x06\x06", bytes(record // 2)),
+             ("μισές όψεις", b"\x06", b""))
+    results = []
+    for i, (name, torn_faces, torn_index) in enumerate(cases):
+        path = os.path.join(directory, f"torn{i}.log")
+        log = RollLog(path)
+        log.append([1, 2], t=1.0)
+        log.close()
+        with open(path + ".faces", "ab") as f:
+            f.write(torn_faces)
+        with open(path, "ab") as f:
+            f.write(torn_index)
+        log = RollLog(path)
+        log.append([3, 4], t=2.0)
+        log.append([5, 1], t=3.0)
+        log.close()
+        log = RollLog(path, readonly=True)
+        records = log.records()
+        faces = log.faces()
+        rolls = [faces[int(r["offset"]):int(r["offset"]) + int(r["dice"])].tolist() for r in records]
+        ok = (rolls == [[1, 2], [3, 4], [5, 1]] and records["total"].tolist() == [3, 7, 6]
+              and log.face_frequencies().tolist() == [2, 1, 1, 1, 1, 0])
+        results.append((name, ok))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Σύνοψη και έλεγχος του ιστορικού ρίψεων")
+    parser.add_argument("path", nargs="?", default=DEFAULT_LOG)
+    parser.add_argument("--window", type=float, help="στατιστικά ανά τόσα δευτερόλεπτα")
+    parser.add_argument("--generate", type=int, default=0, help="προσθέτει τόσες συνθετικές ρίψεις")
+    parser.add_argument("--dice", type=int, default=2, help="ζάρια ανά συνθετική ρίψη")
+    parser.add_argument("--check", action="store_true",
+                        help="έλεγχος ανάκαμψης μετά από μισογραμμένο append (σε προσωρινό φάκελο)")
+    args = parser.parse_args()
+
+    if args.check:
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            for name, ok in check_recovery(directory):
+                print(f"{name:>22}: {'σωστό' if ok else 'ΛΑΘΟΣ'}")
+        return
+
+    if args.generate:
+        log = RollLog(args.path)
+        t0 = time.perf_counter()
+        generate(log, args.generate, args.dice)
+        log.close()
+        print(f"+{args.generate} ρίψεις σε {time.perf_counter() - t0:.2f} s")
+
+    log = RollLog(args.path, readonly=True)
+    print(f"{args.path}: {len(log)} ρίψεις, "
+          f"{(os.path.getsize(log.path) + os.path.getsize(log.faces_path)) / 1e6:.1f} MB")
+    t0 = time.perf_counter()
+    faces = log.face_frequencies()
+    print(f"όψεις 1..6: {faces.tolist()} ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+    t0 = time.perf_counter()
+    report = log.audit()
+    print(f"έλεγχος ({(time.perf_counter() - t0) * 1000:.0f} ms): όψεις χ²={report['faces']['chi2']:.1f} "
+          f"p={report['faces']['p']:.3f}")
+    for dice, r in report["totals"].items():
+        print(f"  {dice} ζάρια: {r['rolls']} ρίψεις, αθροίσματα χ²={r['chi2']:.1f} "
+              f"(β.ε. {r['dof']}) p={r['p']:.3f}")
+    if args.window:
+        for row in log.window_stats(args.window):
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row["t"]))
+            print(f"  {when}: {row['rolls']} ρίψεις, μέση όψη {row['mean_face']:.3f}, όψεις {row['faces']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+import random
+
+import pygame
+
+
+class RealClock:
+    """
+    Το κανονικό ρολόι: pygame.time.Clock για το FPS και pygame.time.get_ticks()
+    για την ώρα, σε ένα αντικείμενο ώστε να μπορεί να αντικατασταθεί από SimClock.
+    """
+
+    def __init__(self):
+        self._clock = pygame.time.Clock()
+
+    def tick(self, fps=0):
+        return self._clock.tick(fps)
+
+    def get_fps(self):
+        return self._clock.get_fps()
+
+    def get_time(self):
+        return self._clock.get_time()
+
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+
+class SimClock:
+    """
+    Εικονικό ρολόι για headless τρεξίματα: το tick(fps) προχωράει τον χρόνο κατά
+    1000/fps ms χωρίς να περιμένει, οπότε η προσομοίωση τρέχει όσο γρήγορα μπορεί
+    και βγάζει πάντα τα ίδια αποτελέσματα.
+    """
+
+    def __init__(self, start_ms=0, step_ms=None):
+        self.ms = float(start_ms)
+        self.step_ms = step_ms   # σταθερό βήμα ανά tick (αλλιώς 1000/fps)
+        self._last = 0.0
+
+    def tick(self, fps=0):
+        if self.step_ms is not None:
+            dt = self.step_ms
+        else:
+            dt = 1000.0 / fps if fps else 1000.0 / 60
+        self.advance(dt)
+        return int(dt)
+
+    def advance(self, ms):
+        self.ms += ms
+        self._last = ms
+
+    def get_fps(self):
+        return 1000.0 / self._last if self._last else 0.0
+
+    def get_time(self):
+        return int(self._last)
+
+    def get_ticks(self):
+        return int(self.ms)
+
+
+def make_rng(seed=None):
+    """
+    random.Random για τα ζάρια. Χωρίς seed διαβάζει το DICE_SEED από το περιβάλλον,
+    αλλιώς διαλέγει τυχαίο. Το seed που χρησιμοποιήθηκε μένει στο rng.seed_value,
+    ώστε μια ρίψη να μπορεί να ξαναπαιχτεί ακριβώς ίδια.
+    """
+    if seed is None:
+        env = os.environ.get("DICE_SEED")
+        seed = int(env) if env else random.SystemRandom().getrandbits(32)
+    rng = random.Random(seed)
+    rng.seed_value = seed
+    return rng
@@ -1,8 +1,11 @@
 import pygame
 import sys
 
-# Initialize Pygame
-pygame.init()
+from perf_overlay import FrameStats, PerfOverlay
+from startup import init_pygame
+
+# Initialize Pygame (μόνο το display, όχι όλα τα modules)
+init_pygame(font=False)
 
 BLACK=(0, 0, 0)
 WHITE=(255, 255, 255)
@@ -26,10 +29,16 @@ vel=5
 
 done=False
 clock=pygame.time.Clock()
+stats=FrameStats()          # χρόνοι ανά φάση του frame
+overlay=PerfOverlay(stats)  # F3: δείχνει/κρύβει τις μετρήσεις
 while not done:
+    stats.begin_frame()
     for event in pygame.event.get():
+        overlay.handle_event(event)
         if event.type==pygame.QUIT:
             done=True
+    stats.mark("event")
+
     keys=pygame.key.get_pressed()
     if keys[pygame.K_LEFT]:
         x-=vel
@@ -56,10 +65,17 @@ while not done:
     if y>screen_height-25:
         y=screen_height-25
 
+    stats.mark("update")
+
     screen.fill(WHITE)
 
     pygame.draw.rect(screen, RED, [x-25, y-25, 50, 50])
 
+    overlay.draw(screen, clock)
+    stats.mark("draw")
+
     pygame.display.flip()
+    stats.mark("flip")
+    stats.end_frame()
     clock.tick(60)
 
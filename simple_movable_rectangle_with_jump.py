@@ -1,8 +1,13 @@
 import pygame
 import sys
 
-# Initialize Pygame
-pygame.init()
+from fixed_step import FixedStep
+from jump_physics import JumpPlayer
+from perf_overlay import FrameStats, PerfOverlay
+from startup import init_pygame
+
+# Initialize Pygame (μόνο το display, όχι όλα τα modules)
+init_pygame(font=False)
 
 BLACK=(0, 0, 0)
 WHITE=(255, 255, 255)
@@ -16,11 +21,10 @@ size=(screen_width, screen_height)
 screen=pygame.display.set_mode(size)
 pygame.display.set_caption("My first game")
 
-x=screen_width/2
-y=screen_height/2
-vel=5
-isJumping=False
-jumpCount=10 # Initial jump count
+# κίνηση/άλμα σε σταθερά ticks φυσικής (60/δευτ.), ανεξάρτητα από τα FPS της σχεδίασης
+player=JumpPlayer(screen_width/2, screen_height/2, screen_width, screen_height)
+physics=FixedStep()
+frame_ms=0
 
 
 
@@ -28,61 +32,35 @@ jumpCount=10 # Initial jump count
 
 done=False
 clock=pygame.time.Clock()
+stats=FrameStats()          # χρόνοι ανά φάση του frame
+overlay=PerfOverlay(stats)  # F3: δείχνει/κρύβει τις μετρήσεις
+stats.add_source("physics", physics.stats)
 while not done:
+    stats.begin_frame()
     for event in pygame.event.get():
+        overlay.handle_event(event)
         if event.type==pygame.QUIT:
             done=True
+    stats.mark("event")
+
     keys=pygame.key.get_pressed()
-    if keys[pygame.K_LEFT]:
-        x-=vel
-    if keys[pygame.K_RIGHT]:
-        x+=vel
-
-    if isJumping:
-        if jumpCount>=-10:
-            neg=1
-            if jumpCount<0:
-                neg=-1
-            #y-=(jumpCount**2)*0.5*neg
-            y-=abs(jumpCount**2)*(neg)
-            jumpCount-=1
-        else:
-            isJumping=False
-            jumpCount=10
-    else:
-        if keys[pygame.K_UP]:
-            y-=vel      
-        if keys[pygame.K_DOWN]:
-            y+=vel
-
-
-    if keys[pygame.K_PLUS]:
-        vel+=1
-    if keys[pygame.K_MINUS]:
-        vel-=1
-    if keys[pygame.K_q]:
-        x-=vel
-        y-=vel
-
-    if keys[pygame.K_SPACE]:
-        if not isJumping:
-            isJumping=True
-        
-
-    
-    if x-25<0:
-        x=25
-    if x>screen_width-25:
-        x=screen_width-25
-    if y-25<0:
-        y=25 
-    if y>screen_height-25:
-        y=screen_height-25
+    # όσα ticks χωράνε στον χρόνο του προηγούμενου frame (0, 1 ή και περισσότερα αν άργησε)
+    for _ in range(physics.advance(frame_ms)):
+        player.step(keys)
+    # η σχεδίαση είναι ανάμεσα στα δύο τελευταία ticks (alpha), ώστε η κίνηση να είναι ομαλή
+    player_x, player_y=player.topleft(physics.alpha)
+
+    stats.mark("update")
 
     screen.fill(WHITE)
 
-    pygame.draw.rect(screen, RED, [x-25, y-25, 50, 50])
+    pygame.draw.rect(screen, RED, [player_x, player_y, 50, 50])
+
+    overlay.draw(screen, clock)
+    stats.mark("draw")
 
     pygame.display.flip()
-    clock.tick(60)
+    stats.mark("flip")
+    stats.end_frame()
+    frame_ms=clock.tick(60)
 
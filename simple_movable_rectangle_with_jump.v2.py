@@ -1,9 +1,15 @@
 import pygame
 import sys
-import random
 
-# Initialize Pygame
-pygame.init()
+from fixed_step import FixedStep
+from jump_physics import JumpPlayer
+from perf_overlay import FrameStats, PerfOverlay
+from snow import SnowField
+from spatial_hash import PointGrid, SpriteCollider
+from startup import init_pygame
+
+# Initialize Pygame (μόνο το display, όχι όλα τα modules)
+init_pygame(font=False)
 
 BLACK=(0, 0, 0)
 WHITE=(255, 255, 255)
@@ -17,18 +23,18 @@ size=(screen_width, screen_height)
 screen=pygame.display.set_mode(size)
 pygame.display.set_caption("My first game")
 
-x=screen_width/2
-y=screen_height/2
-vel=5
-isJumping=False
-jumpCount=10 # Initial jump count
+# κίνηση/άλμα σε σταθερά ticks φυσικής (60/δευτ.), ανεξάρτητα από τα FPS της σχεδίασης
+player=JumpPlayer(screen_width/2, screen_height/2, screen_width, screen_height)
+physics=FixedStep()
+frame_ms=0
 
 
-snow_list=[]
-for i in range(50):
-    x_snow=random.randrange(0, screen_width)
-    y_snow=random.randrange(0, screen_height)
-    snow_list.append([x_snow, y_snow])
+# Χιόνι: όλες οι νιφάδες σε πίνακες NumPy (snow.py)· αντέχει και 100000 νιφάδες στα 60 FPS
+SNOW_FLAKES=50
+SNOW_WIND=0.0      # pixels/frame προς τα δεξιά (αρνητικό: αριστερά)
+snow=SnowField(screen_width, screen_height, count=SNOW_FLAKES, wind=SNOW_WIND, respawn="mixed")
+snow_grid=PointGrid(screen_width, screen_height)   # ποιες νιφάδες είναι κοντά σε τι, χωρίς σάρωση όλων
+player_hit=SpriteCollider(pygame.Mask((50, 50), fill=True))   # το κόκκινο τετράγωνο
 
 
 
@@ -36,77 +42,44 @@ for i in range(50):
 
 done=False
 clock=pygame.time.Clock()
+stats=FrameStats()          # χρόνοι ανά φάση του frame
+overlay=PerfOverlay(stats)  # F3: δείχνει/κρύβει τις μετρήσεις
+stats.add_source("physics", physics.stats)
+stats.add_source("snow", snow.stats)
 while not done:
+    stats.begin_frame()
     for event in pygame.event.get():
+        overlay.handle_event(event)
         if event.type==pygame.QUIT:
             done=True
+    stats.mark("event")
+
     keys=pygame.key.get_pressed()
-    if keys[pygame.K_LEFT]:
-        x-=vel
-    if keys[pygame.K_RIGHT]:
-        x+=vel
-
-    if isJumping:
-        if jumpCount>=-10:
-            neg=1
-            if jumpCount<0:
-                neg=-1
-            #y-=(jumpCount**2)*0.5*neg
-            y-=abs(jumpCount**2)*(neg)
-            jumpCount-=1
-        else:
-            isJumping=False
-            jumpCount=10
-    else:
-        if keys[pygame.K_UP]:
-            y-=vel      
-        if keys[pygame.K_DOWN]:
-            y+=vel
-
-
-    if keys[pygame.K_PLUS]:
-        vel+=1
-    if keys[pygame.K_MINUS]:
-        vel-=1
-    if keys[pygame.K_q]:
-        x-=vel
-        y-=vel
-
-    if keys[pygame.K_SPACE]:
-        if not isJumping:
-            isJumping=True
-        
+    # όσα ticks χωράνε στον χρόνο του προηγούμενου frame (0, 1 ή και περισσότερα αν άργησε)
+    for _ in range(physics.advance(frame_ms)):
+        player.step(keys)
+        snow.update()
+        snow_grid.build(snow.x, snow.y)
+        snow.melt(player_hit.hits(snow_grid, player.topleft()))   # όσες ακουμπάνε τον παίκτη λιώνουν
+    # η σχεδίαση είναι ανάμεσα στα δύο τελευταία ticks (alpha), ώστε η κίνηση να είναι ομαλή
+    player_x, player_y=player.topleft(physics.alpha)
 
-    
-    if x-25<0:
-        x=25
-    if x>screen_width-25:
-        x=screen_width-25
-    if y-25<0:
-        y=25 
-    if y>screen_height-25:
-        y=screen_height-25
+    stats.mark("update")
 
     screen.fill(BLACK)
 
     
-    for i in range(len(snow_list)):
-        pygame.draw.circle(screen, WHITE, snow_list[i], 2)
-        snow_list[i][1]+=1
-        snow_list[i][0]+=random.randrange(-1, 3)
-        if snow_list[i][1]>screen_height:
-            a=random.randrange(0,3)
-            if (a==0 or a==1):
-                snow_list[i][1]=0
-                snow_list[i][0]=random.randrange(0, screen_width)
-            else:
-                snow_list[i][0]=0
-                snow_list[i][1]=random.randrange(0, screen_height)
+    snow.draw(screen)
 
             
 
-    pygame.draw.rect(screen, RED, [x-25, y-25, 50, 50])
+    pygame.draw.rect(screen, RED, [player_x, player_y, 50, 50])
+
+    overlay.draw(screen, clock)
+    stats.mark("draw")
 
     pygame.display.flip()
-    clock.tick(60)
+    stats.mark("flip")
+    stats.end_frame()
+    frame_ms=clock.tick(60)
 
@@ -0,0 +1,122 @@
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from particle_renderer import ParticleRenderer
+
+# ------------------------------
+# ΧΙΟΝΙ ΜΕ ΠΙΝΑΚΕΣ NUMPY
+# ------------------------------
+# Θέσεις και ταχύτητες όλων των νιφάδων σε πίνακες· κίνηση, τυχαίο «τρέμουλο» και
+# επανεμφάνιση γίνονται για όλες μαζί, οπότε 100.000 νιφάδες κοστίζουν λίγα ms.
+# Με τις default τιμές κάνει ό,τι το αρχικό snow_list:
+#   y += 1, x += randrange(-1, 3), και όταν βγει κάτω: 2/3 ξανά από πάνω, 1/3 από αριστερά.
+#   python snow.py 100000          # χρόνος update + draw ανά frame (headless)
+
+RESPAWN_POLICIES = ("mixed", "top", "wrap")
+
+
+class SnowField:
+    """
+    count/density: πόσες νιφάδες (density = νιφάδες ανά 100x100 pixels)
+    wind:          σταθερή οριζόντια ταχύτητα (pixels/frame) επιπλέον του jitter
+    fall_speed:    κατακόρυφη ταχύτητα (pixels/frame)· speed_var > 0 δίνει διαφορετική σε κάθε νιφάδα
+    jitter:        (min, max) ακέραιο τυχαίο βήμα στο x κάθε frame, όπως το randrange(min, max)
+    respawn:       "mixed" -> top_ratio από πάνω, οι υπόλοιπες από την αριστερή άκρη (το αρχικό)
+                   "top"   -> πάντα από πάνω σε τυχαίο x
+                   "wrap"  -> ξανά από πάνω στο ίδιο x
+    render_mode:   "auto" / "blits" / "surfarray" (βλ. particle_renderer.py)
+    """
+
+    def __init__(self, width, height, count=None, density=None, wind=0.0, fall_speed=1.0,
+                 speed_var=0.0, jitter=(-1, 3), respawn="mixed", top_ratio=2 / 3,
+                 radius=2, color=(255, 255, 255), render_mode="auto", seed=None):
+        if respawn not in RESPAWN_POLICIES:
+            raise ValueError(f"respawn πρέπει να είναι ένα από {RESPAWN_POLICIES}")
+        if count is None:
+            count = int(round((density if density is not None else 1.4) * width * height / 10000))
+        self.width, self.height = width, height
+        self.wind = wind
+        self.jitter = jitter
+        self.respawn = respawn
+        self.top_ratio = top_ratio
+        self.renderer = ParticleRenderer(radius, color, mode=render_mode)
+        self.melted = 0
+        self.rng = np.random.default_rng(seed)
+        self.x = self.rng.integers(0, width, count).astype(np.float32)
+        self.y = self.rng.integers(0, height, count).astype(np.float32)
+        self.vy = np.full(count, fall_speed, dtype=np.float32)
+        if speed_var:
+            self.vy += self.rng.uniform(-speed_var, speed_var, count).astype(np.float32)
+
+    def __len__(self):
+        return len(self.x)
+
+    def resize(self, width, height):
+        self.width, self.height = width, height
+
+    def update(self):
+        n = len(self.x)
+        self.y += self.vy
+        step = self.rng.integers(self.jitter[0], self.jitter[1], n, dtype=np.int8)
+        self.x += step
+        if self.wind:
+            self.x += self.wind
+        out = np.flatnonzero(self.y > self.height)
+        if len(out):
+            self._respawn(out)
+
+    def melt(self, idx):
+        """Οι νιφάδες idx (π.χ. όσες ακούμπησαν τον παίκτη) λιώνουν και ξαναβγαίνουν όπως στο respawn."""
+        if len(idx):
+            self.melted += len(idx)
+            self._respawn(idx, melted=True)
+
+    def _respawn(self, idx, melted=False):
+        if self.respawn == "wrap":
+            if melted:
+                self.y[idx] = 0
+            else:
+                self.y[idx] -= self.height + 1
+            return
+        k = len(idx)
+        if self.respawn == "top":
+            top = np.ones(k, dtype=bool)
+        else:
+            top = self.rng.random(k) < self.top_ratio
+        from_top, from_left = idx[top], idx[~top]
+        self.y[from_top] = 0
+        self.x[from_top] = self.rng.integers(0, self.width, len(from_top))
+        self.x[from_left] = 0
+        self.y[from_left] = self.rng.integers(0, self.height, len(from_left))
+
+    def draw(self, surface):
+        self.renderer.draw(surface, self.x, self.y)
+
+    def stats(self):
+        """Για το perf overlay (FrameStats.add_source)."""
+        return {"flakes": f"{len(self.x)} flakes", "melted": f"{self.melted} melted",
+                "mode": self.renderer.last_mode}
+
+if __name__ == "__main__":
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    screen = pygame.display.set_mode((700, 500))
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    snow = SnowField(700, 500, count=count, seed=1)
+    frames = 120
+    t_update = t_draw = 0.0
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        t0 = time.perf_counter()
+        snow.update()
+        t1 = time.perf_counter()
+        snow.draw(screen)
+        t2 = time.perf_counter()
+        t_update += t1 - t0
+        t_draw += t2 - t1
+    print(f"{count} νιφάδες: update {t_update / frames * 1000:.2f} ms, "
+          f"draw ({snow.renderer.last_mode}) {t_draw / frames * 1000:.2f} ms ανά frame")
@@ -0,0 +1,91 @@
+import os
+import threading
+import time
+
+import pygame
+
+from asset_cache import load_sound
+from startup import STARTUP
+
+# Event που στέλνει ο SoundLoader όταν τελειώσει (επιτυχία ή αποτυχία),
+# ώστε ένα loop σε idle mode (pygame.event.wait) να ξυπνήσει και να πάρει τον ήχο.
+SOUND_LOADED = pygame.event.custom_type()
+
+
+class SoundLoader:
+    """
+    Φορτώνει (αποκωδικοποιεί) έναν ήχο σε background thread, ώστε το πρώτο frame
+    να μην περιμένει το decode του mp3. Δοκιμάζει τα candidates με τη σειρά
+    (π.χ. mp3 και μετά wav) και κρατάει τον πρώτο που φορτώθηκε.
+
+    status: "loading" -> "ready" | "failed" | "missing" (κανένα αρχείο)
+    sound:  None μέχρι να γίνει "ready"
+    """
+
+    def __init__(self, candidates, base_dir=None, start=True):
+        self.candidates = [p if base_dir is None or os.path.isabs(p) else os.path.join(base_dir, p)
+                           for p in candidates]
+        self.sound = None
+        self.path = None
+        self.status = "loading"
+        self.error = ""
+        self.latency_ms = None      # από το start() μέχρι να είναι έτοιμος (ή να αποτύχει)
+        self.attempts = []          # (αρχείο, ms, σφάλμα ή "")
+        self._done = threading.Event()
+        self._thread = None
+        self._t0 = None
+        if start:
+            self.start()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._t0 = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sound-loader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        existing = [p for p in self.candidates if os.path.exists(p)]
+        for path in existing:
+            t = time.perf_counter()
+            try:
+                sound = load_sound(path)
+            except Exception as e:   # χαλασμένο mp3, χωρίς codec κ.λπ.: δοκιμάζουμε το επόμενο
+                self.attempts.append((path, (time.perf_counter() - t) * 1000.0, str(e)))
+                self.error = str(e)
+                continue
+            self.attempts.append((path, (time.perf_counter() - t) * 1000.0, ""))
+            self.path = path
+            self.sound = sound
+            self.status = "ready"
+            break
+        else:
+            self.status = "failed" if existing else "missing"
+        self.latency_ms = (time.perf_counter() - self._t0) * 1000.0
+        STARTUP.mark_background("sound", self.latency_ms)
+        self._done.set()
+        try:
+            pygame.event.post(pygame.event.Event(SOUND_LOADED, status=self.status, path=self.path))
+        except pygame.error:
+            pass  # χωρίς display/event queue: οι callers ελέγχουν το ready/done
+
+    @property
+    def ready(self):
+        return self.status == "ready"
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Μπλοκάρει μέχρι να τελειώσει το φόρτωμα (π.χ. σε headless runs). True αν τελείωσε."""
+        return self._done.wait(timeout)
+
+    def stats(self):
+        """Για instrumentation (perf overlay, startup report)."""
+        return {
+            "status": self.status,
+            "path": os.path.basename(self.path) if self.path else None,
+            "latency_ms": self.latency_ms,
+            "error": self.error if not self.ready else "",
+        }
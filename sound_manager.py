@@ -0,0 +1,159 @@
+import os
+import time
+from collections import deque
+
+import pygame
+
+from startup import MIXER_OPENED
+
+# ------------------------------
+# ΗΧΟΙ ΧΑΜΗΛΗΣ ΚΑΘΥΣΤΕΡΗΣΗΣ
+# ------------------------------
+# Ο mixer παίζει ήχο ανά buffer: buffer=4096 στα 44.1 kHz σημαίνει ~93 ms μέχρι να ακουστεί
+# οτιδήποτε. Με μικρό buffer και δικό μας pool από channels (όχι «όποιο βρεθεί ελεύθερο»)
+# κάθε κλικ ακούγεται αμέσως και μια ριπή από κλικ δεν «χάνει» ήχους.
+#   SOUND_BUFFER=512 python simple_movable_rectangle_with_jump.v2.withsound_images.py
+
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = int(os.environ.get("SOUND_BUFFER", "256"))   # δείγματα· 256 ≈ 5.8 ms
+# για το init_pygame(sound=True, **MIXER_ARGS)
+MIXER_ARGS = {"frequency": MIXER_FREQUENCY, "size": -16, "channels": 2, "buffer": MIXER_BUFFER}
+MIXER_CHANNELS = 24     # συνολικά channels του mixer
+POOL_CHANNELS = 16      # όσα κρατάμε (set_reserved) για τον SoundManager
+PYGAME_DEFAULT_BUFFER = 512   # pygame.mixer.init() χωρίς buffer
+# Στόχος για το άνω όριο latency. Με poll μία φορά ανά frame στα 60 FPS το άνω όριο είναι
+# ήδη ~16.7 ms + buffer, οπότε το max ξεπερνάει τα 20 ms (ο μέσος όρος μένει κάτω)·
+# το overlay το δείχνει αντί να το κρύβει.
+LATENCY_TARGET_MS = 20.0
+
+
+def opened_buffer():
+    """
+    Δείγματα ανά buffer του mixer όπως άνοιξε (startup.MIXER_OPENED, αλλιώς το default
+    του pygame). Το pygame στρογγυλεύει το buffer προς τα πάνω σε δύναμη του 2, με
+    ελάχιστο 256, άρα SOUND_BUFFER=128 δίνει στην πράξη 256.
+    """
+    requested = MIXER_OPENED.get("buffer") or PYGAME_DEFAULT_BUFFER
+    size = 1
+    while size < requested:
+        size <<= 1
+    return max(size, 256)
+
+
+def buffer_ms():
+    """Πόσα ms ήχου κρατάει ένα buffer του mixer όπως άνοιξε (None αν ο mixer δεν τρέχει)."""
+    init = pygame.mixer.get_init()
+    if not init:
+        return None
+    return opened_buffer() * 1000.0 / init[0]
+
+
+class SoundManager:
+    """
+    Pool από reserved channels για τα εφέ του παιχνιδιού.
+
+    - κάθε ήχος έχει όριο ταυτόχρονων φωνών (max_voices) και προτεραιότητα
+    - αν ο ήχος έχει ήδη max_voices, σταματάει η παλιότερη φωνή του (voice stealing)
+    - αν δεν υπάρχει ελεύθερο channel, «κλέβεται» το παλιότερο channel με προτεραιότητα
+      <= του νέου ήχου· αλλιώς ο νέος ήχος δεν παίζει (dropped)
+
+    Latency: το loop καλεί events_polled() αμέσως μετά το pygame.event.get().
+    Για κάθε play() μετράμε πόσο πέρασε από το poll μέχρι το play, και προσθέτουμε
+    το buffer του mixer και την αναμονή στην ουρά των events (κατά μέσο όρο μισό
+    διάστημα ανάμεσα σε δύο poll, το πολύ ολόκληρο).
+    """
+
+    def __init__(self, channels=POOL_CHANNELS, total_channels=MIXER_CHANNELS):
+        if pygame.mixer.get_num_channels() < total_channels:
+            pygame.mixer.set_num_channels(total_channels)
+        pygame.mixer.set_reserved(channels)
+        self.pool = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.sounds = {}     # όνομα -> (Sound, max_voices, priority)
+        self.voices = []     # (channel, όνομα, priority, χρόνος έναρξης) για ό,τι παίζει
+        self.played = self.stolen = self.dropped = 0
+        self.latencies = deque(maxlen=256)       # εκτίμηση μέσης latency ανά play (ms)
+        self.worst_latencies = deque(maxlen=256)  # άνω όριο latency ανά play (ms)
+        self._poll_t = None
+        self._poll_gap = 0.0
+
+    def add(self, name, sound, max_voices=4, priority=0, volume=None):
+        if volume is not None:
+            sound.set_volume(volume)
+        self.sounds[name] = (sound, max_voices, priority)
+
+    def events_polled(self):
+        """Καλείται αμέσως μετά το pygame.event.get() / next_events()."""
+        now = time.perf_counter()
+        if self._poll_t is not None:
+            self._poll_gap = now - self._poll_t
+        self._poll_t = now
+
+    def _active(self):
+        # πετάμε όσες φωνές τελείωσαν (ή τις έκοψε κάποιος άλλος)
+        self.voices = [v for v in self.voices
+                       if v[0].get_busy() and v[0].get_sound() is self.sounds[v[1]][0]]
+        return self.voices
+
+    def _steal(self, voice):
+        voice[0].stop()
+        self.voices.remove(voice)
+        self.stolen += 1
+        return voice[0]
+
+    def play(self, name, loops=0):
+        """Παίζει τον ήχο name σε channel του pool. Επιστρέφει το Channel ή None (dropped)."""
+        entry = self.sounds.get(name)
+        if entry is None:
+            return None
+        sound, max_voices, priority = entry
+        voices = self._active()
+
+        mine = [v for v in voices if v[1] == name]
+        channel = None
+        if len(mine) >= max_voices:
+            channel = self._steal(min(mine, key=lambda v: v[3]))
+        if channel is None:
+            busy = {id(v[0]) for v in voices}
+            channel = next((ch for ch in self.pool if id(ch) not in busy and not ch.get_busy()), None)
+        if channel is None:
+            candidates = [v for v in voices if v[2] <= priority]
+            if not candidates:
+                self.dropped += 1
+                return None
+            # η παλιότερη φωνή με τη χαμηλότερη προτεραιότητα
+            channel = self._steal(min(candidates, key=lambda v: (v[2], v[3])))
+
+        channel.play(sound, loops=loops)
+        now = time.perf_counter()
+        self.voices.append((channel, name, priority, now))
+        self.played += 1
+        buffer = buffer_ms() or 0.0
+        if self._poll_t is not None:
+            dispatch = (now - self._poll_t) * 1000.0
+            gap = self._poll_gap * 1000.0
+            self.latencies.append(dispatch + gap / 2.0 + buffer)
+            self.worst_latencies.append(dispatch + gap + buffer)
+        return channel
+
+    def stop(self, name=None):
+        """Σταματάει όλες τις φωνές του ήχου name (ή όλες αν name=None)."""
+        for v in list(self._active()):
+            if name is None or v[1] == name:
+                v[0].stop()
+                self.voices.remove(v)
+
+    def stats(self):
+        lat = sorted(self.latencies)
+        worst = sorted(self.worst_latencies)
+        worst_max = worst[-1] if worst else None
+        return {
+            "buffer_ms": buffer_ms(),
+            "voices": len(self._active()),
+            "played": self.played,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "latency_ms": sum(lat) / len(lat) if lat else None,
+            "p95_ms": worst[int(len(worst) * 0.95)] if worst else None,   # p95 του άνω ορίου
+            "max_ms": worst_max,                                           # το χειρότερο άνω όριο
+            "target": f"max>{LATENCY_TARGET_MS:.0f}ms" if worst_max and worst_max > LATENCY_TARGET_MS else "",
+        }
@@ -0,0 +1,308 @@
+import time
+from collections import defaultdict
+
+import numpy as np
+import pygame
+
+# ------------------------------
+# SPATIAL HASH (ΟΜΟΙΟΜΟΡΦΟ GRID) ΓΙΑ ΣΥΓΚΡΟΥΣΕΙΣ
+# ------------------------------
+# Η οθόνη χωρίζεται σε τετράγωνα κελιά· ένα ερώτημα «τι υπάρχει σε αυτό το rect» κοιτάει
+# μόνο τα κελιά που καλύπτει το rect, άρα κοστίζει όσο τα αντικείμενα κοντά του και όχι
+# όσο όλα τα αντικείμενα της σκηνής.
+#   PointGrid:      σημεία σε πίνακες NumPy (νιφάδες)· ξαναχτίζεται ολόκληρο κάθε frame
+#                   με ένα vectorized sort (~2 ms για 100.000)
+#   SpatialHash:    αντικείμενα με rect (παίκτης, εχθροί...)· ενημερώνεται σταδιακά,
+#                   μόνο όταν ένα αντικείμενο αλλάζει κελιά
+#   SpriteCollider: pixel-perfect σύγκρουση σωματιδίων με sprite μέσω cached mask
+#   python spatial_hash.py          # χρόνοι build/query για 100.000 σημεία
+
+DEFAULT_CELL = 16       # pixels· λίγο μεγαλύτερο από τα σωματίδια, μικρό σε σχέση με τον παίκτη
+ENTITY_CELL = 64
+
+
+class PointGrid:
+    """
+    Τα σημεία ταξινομημένα ανά κελί (counting sort): order[starts[c]:starts[c + 1]] είναι
+    τα indices των σημείων του κελιού c. Τα κελιά μιας γραμμής είναι συνεχόμενα, οπότε
+    ένα rect ζητάει ένα slice ανά γραμμή κελιών. Σημεία έξω από την οθόνη μπαίνουν στα
+    κελιά της άκρης.
+    """
+
+    def __init__(self, width, height, cell=DEFAULT_CELL):
+        self.cell = cell
+        self.cols = width // cell + 1
+        self.rows = height // cell + 1
+        n_cells = self.cols * self.rows
+        # int16 -> το numpy κάνει radix sort (stable), πολύ γρηγορότερο από quicksort
+        self._id_type = np.int16 if n_cells < 1 << 15 else np.int32
+        self.x = self.y = np.zeros(0, dtype=np.float32)
+        self.order = np.zeros(0, dtype=np.intp)
+        self.starts = np.zeros(n_cells + 1, dtype=np.intp)
+
+    def __len__(self):
+        return len(self.order)
+
+    def _cell_xy(self, x, y):
+        # int πρώτα και μετά διαίρεση: ~20x γρηγορότερο από floor_divide σε floats
+        cx = np.clip(x.astype(np.int32), 0, (self.cols - 1) * self.cell) // self.cell
+        cy = np.clip(y.astype(np.int32), 0, (self.rows - 1) * self.cell) // self.cell
+        return cx.astype(self._id_type), cy.astype(self._id_type)
+
+    def build(self, x, y):
+        """Κρατάει αναφορά στα x, y: ισχύει μέχρι να αλλάξουν (δηλαδή ως το επόμενο update)."""
+        self.x, self.y = x, y
+        cx, cy = self._cell_xy(x, y)
+        ids = cy * self._id_type(self.cols) + cx
+        self.order = np.argsort(ids, kind="stable")
+        counts = np.bincount(ids, minlength=self.cols * self.rows)
+        np.cumsum(counts, out=self.starts[1:])
+
+    def _cells_range(self, x0, y0, x1, y1):
+        cx0, cy0 = (int(min(max(v // self.cell, 0), lim - 1)) for v, lim in ((x0, self.cols), (y0, self.rows)))
+        cx1, cy1 = (int(min(max(v // self.cell, 0), lim - 1)) for v, lim in ((x1, self.cols), (y1, self.rows)))
+        return cx0, cy0, cx1, cy1
+
+    def candidates(self, rect):
+        """Τα σημεία των κελιών που ακουμπάει το rect (υπερσύνολο του query_rect)."""
+        rect = pygame.Rect(rect)
+        cx0, cy0, cx1, cy1 = self._cells_range(rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+        parts = []
+        for cy in range(cy0, cy1 + 1):
+            row = cy * self.cols
+            s, e = self.starts[row + cx0], self.starts[row + cx1 + 1]
+            if e > s:
+                parts.append(self.order[s:e])
+        if not parts:
+            return np.zeros(0, dtype=np.intp)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def query_rect(self, rect):
+        """Indices των σημείων μέσα στο rect."""
+        rect = pygame.Rect(rect)
+        idx = self.candidates(rect)
+        x, y = self.x[idx], self.y[idx]
+        inside = (x >= rect.left) & (x < rect.right) & (y >= rect.top) & (y < rect.bottom)
+        return idx[inside]
+
+    def nearest(self, px, py, n=1):
+        """
+        Indices των n πλησιέστερων σημείων στο (px, py), από το κοντινότερο. Μεγαλώνει το
+        τετράγωνο αναζήτησης ώσπου να βρει n σημεία· μετά ψάχνει σε ακτίνα ίση με την
+        απόσταση του n-οστού, ώστε να μη χαθεί κανένα πιο κοντινό σε γειτονικό κελί.
+        """
+        n = min(n, len(self))
+        if n <= 0:
+            return np.zeros(0, dtype=np.intp)
+        reach = self.cell
+        limit = max(self.cols, self.rows) * self.cell * 2
+        while True:
+            idx = self.candidates((px - reach, py - reach, 2 * reach, 2 * reach))
+            if len(idx) >= n or reach >= limit:
+                break
+            reach *= 2
+        d2 = (self.x[idx] - px) ** 2 + (self.y[idx] - py) ** 2
+        radius = float(np.sqrt(np.partition(d2, n - 1)[n - 1])) + 1
+        idx = self.candidates((px - radius, py - radius, 2 * radius + 1, 2 * radius + 1))
+        d2 = (self.x[idx] - px) ** 2 + (self.y[idx] - py) ** 2
+        best = np.argpartition(d2, n - 1)[:n] if n < len(idx) else np.arange(len(idx))
+        return idx[best[np.argsort(d2[best], kind="stable")]]
+
+
+def _solid(rect):
+    """Το rect όπως μετράει στις ερωτήσεις: μηδενικό πλάτος/ύψος -> 1 pixel."""
+    if rect.width > 0 and rect.height > 0:
+        return rect
+    return pygame.Rect(rect.left, rect.top, max(rect.width, 1), max(rect.height, 1))
+
+
+class SpatialHash:
+    """
+    Αντικείμενα με rect, κλειδί οτιδήποτε hashable. Κάθε κελί κρατάει ένα set από κλειδιά·
+    το move() αγγίζει τα κελιά μόνο όταν το αντικείμενο περάσει σε άλλα κελιά.
+    """
+
+    def __init__(self, cell=ENTITY_CELL):
+        self.cell = cell
+        self.cells = defaultdict(set)
+        self.rects = {}
+        self._span = {}
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def _span_of(self, rect):
+        # rect μηδενικού μεγέθους πιάνει το κελί της γωνίας του (βλ. _solid)
+        c = self.cell
+        return (rect.left // c, rect.top // c,
+                (rect.left + max(rect.width, 1) - 1) // c, (rect.top + max(rect.height, 1) - 1) // c)
+
+    def _cells(self, span):
+        cx0, cy0, cx1, cy1 = span
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                yield cx, cy
+
+    def insert(self, key, rect):
+        if key in self.rects:
+            self.move(key, rect)
+            return
+        rect = pygame.Rect(rect)
+        span = self._span_of(rect)
+        self.rects[key] = rect
+        self._span[key] = span
+        for c in self._cells(span):
+            self.cells[c].add(key)
+
+    def move(self, key, rect):
+        rect = pygame.Rect(rect)
+        span = self._span_of(rect)
+        self.rects[key] = rect
+        old = self._span[key]
+        if span == old:
+            return
+        self._span[key] = span
+        for c in self._cells(old):
+            bucket = self.cells[c]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[c]
+        for c in self._cells(span):
+            self.cells[c].add(key)
+
+    def remove(self, key):
+        span = self._span.pop(key)
+        del self.rects[key]
+        for c in self._cells(span):
+            bucket = self.cells[c]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[c]
+
+    def query_rect(self, rect):
+        """Τα κλειδιά των αντικειμένων που το rect τους τέμνει το rect."""
+        rect = pygame.Rect(rect)
+        found = set()
+        for c in self._cells(self._span_of(rect)):
+            bucket = self.cells.get(c)
+            if bucket:
+                found |= bucket
+        return [k for k in found if _solid(self.rects[k]).colliderect(rect)]
+
+    def nearest(self, px, py, n=1):
+        """Τα n πλησιέστερα αντικείμενα (απόσταση σημείου από το rect τους), από το κοντινότερο."""
+        n = min(n, len(self))
+        if n <= 0:
+            return []
+
+        def dist(key):
+            r = _solid(self.rects[key])
+            dx = max(r.left - px, 0, px - r.right + 1)
+            dy = max(r.top - py, 0, py - r.bottom + 1)
+            return dx * dx + dy * dy
+
+        reach = self.cell
+        while True:
+            side = 2 * reach // self.cell + 1
+            if side * side > len(self):
+                # περισσότερα κελιά από αντικείμενα (π.χ. ένα πολύ μακριά): φθηνότερο να δούμε όλα
+                return sorted(self.rects, key=dist)[:n]
+            found = self.query_rect((px - reach, py - reach, 2 * reach, 2 * reach))
+            if len(found) >= n:
+                break
+            reach *= 2
+        found.sort(key=dist)
+        radius = int(dist(found[n - 1]) ** 0.5) + 1
+        found = self.query_rect((px - radius, py - radius, 2 * radius + 1, 2 * radius + 1))
+        found.sort(key=dist)
+        return found[:n]
+
+
+def _mask_array(mask):
+    w, h = mask.get_size()
+    surf = mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0))
+    return pygame.surfarray.array_red(surf) != 0 if w and h else np.zeros((w, h), dtype=bool)
+
+
+class SpriteCollider:
+    """
+    Pixel-perfect σύγκρουση σωματιδίων (κύκλοι όπως του draw.circle(radius)) με ένα sprite.
+    Το mask του sprite γίνεται convolve με το mask του σωματιδίου μία φορά: το αποτέλεσμα
+    λέει για κάθε θέση κέντρου αν ο κύκλος ακουμπάει έστω ένα pixel του sprite. Έτσι ο
+    έλεγχος ενός σωματιδίου είναι ένα lookup σε πίνακα NumPy.
+    surface_or_mask: Surface (με colorkey ή alpha) ή έτοιμο pygame.Mask.
+    """
+
+    def __init__(self, surface_or_mask, particle_radius=2):
+        if isinstance(surface_or_mask, pygame.mask.Mask):
+            self.mask = surface_or_mask
+        else:
+            self.mask = pygame.mask.from_surface(surface_or_mask)
+        size = particle_radius * 2 + 3
+        c = size // 2
+        tmp = pygame.Surface((size, size))
+        pygame.draw.circle(tmp, (255, 255, 255), (c, c), particle_radius)
+        dot = pygame.mask.from_threshold(tmp, (255, 255, 255), (1, 1, 1, 255))
+        box = dot.get_bounding_rects()[0]
+        dot = dot.to_surface(unsetcolor=(0, 0, 0)).subsurface(box)
+        dot = pygame.mask.from_threshold(dot, (255, 255, 255), (1, 1, 1, 255))
+        # bit (i, j) του convolve: το κάτω-δεξί pixel του σωματιδίου στο (i, j) του sprite
+        self._hit = _mask_array(self.mask.convolve(dot))
+        # κέντρο (cx, cy) -> i = cx - left + self._shift[0]
+        self._shift = (box.left - c + box.width - 1, box.top - c + box.height - 1)
+
+    def area(self, topleft):
+        """Το rect όπου πρέπει να είναι ένα κέντρο για να υπάρχει περίπτωση σύγκρουσης."""
+        w, h = self._hit.shape
+        return pygame.Rect(topleft[0] - self._shift[0], topleft[1] - self._shift[1], w, h)
+
+    def hits(self, grid, topleft):
+        """Indices των σημείων του grid που ακουμπάνε το sprite με πάνω-αριστερή γωνία topleft."""
+        area = self.area(topleft)
+        idx = grid.candidates(area)
+        # το κέντρο στρογγυλεύεται όπως στη σχεδίαση (ParticleRenderer)
+        i = grid.x[idx].astype(np.int32) - area.left
+        j = grid.y[idx].astype(np.int32) - area.top
+        w, h = self._hit.shape
+        inside = (i >= 0) & (i < w) & (j >= 0) & (j < h)
+        idx, i, j = idx[inside], i[inside], j[inside]
+        return idx[self._hit[i, j]]
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(1)
+    n = 100_000
+    x = rng.uniform(0, 700, n).astype(np.float32)
+    y = rng.uniform(0, 500, n).astype(np.float32)
+    grid = PointGrid(700, 500)
+    t0 = time.perf_counter()
+    for _ in range(20):
+        grid.build(x, y)
+    t_build = (time.perf_counter() - t0) / 20 * 1000
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        grid.query_rect((325, 225, 50, 50))
+    t_query = (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        grid.nearest(350, 250, 10)
+    t_near = (time.perf_counter() - t0)
+    print(f"PointGrid {n} σημεία: build {t_build:.2f} ms, query_rect 50x50 {t_query * 1000:.1f} μs, "
+          f"nearest(10) {t_near * 1000:.1f} μs")
+
+    entities = SpatialHash()
+    for k in range(10_000):
+        entities.insert(k, (rng.integers(0, 7000), rng.integers(0, 5000), 20, 20))
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        entities.query_rect((3000, 2000, 100, 100))
+    t_query = (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    for k in range(10_000):
+        r = entities.rects[k]
+        entities.move(k, r.move(3, 0))
+    t_move = (time.perf_counter() - t0) / 10_000 * 1e6
+    print(f"SpatialHash 10000 αντικείμενα: query_rect {t_query * 1000:.1f} μs, move {t_move:.2f} μs")
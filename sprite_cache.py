@@ -0,0 +1,125 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class SpriteCache:
+    """
+    Cache για κλιμακωμένες (scaled) εικόνες, με κλειδί (όψη, μέγεθος).
+    Κάθε μέγεθος κάθε όψης κάνει smoothscale μόνο μία φορά· όταν οι εικόνες
+    ξεπεράσουν τα max_bytes πετάμε τις λιγότερο πρόσφατες (LRU).
+    Οι αρχικές εικόνες (sources) δεν πετιούνται ποτέ.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._sources = {}
+        self._items = OrderedDict()
+        self._mips = {}   # key -> [πλήρες μέγεθος, 1/2, 1/4, ...]
+
+    def set_faces(self, images):
+        """Δηλώνει τις εικόνες των όψεων 1..6 (η λίστα είναι με index 0..5)."""
+        for i, img in enumerate(images):
+            self.add_source(i + 1, img)
+
+    def add_source(self, key, surface):
+        if self._sources.get(key) is not surface:
+            # νέα αρχική εικόνα: οι παλιές κλιμακώσεις της δεν ισχύουν πια
+            for k in [k for k in self._items if k[0] == key]:
+                self._drop(k)
+            self._mips.pop(key, None)
+        self._sources[key] = surface
+
+    def get(self, key, size):
+        """Η εικόνα key σε μέγεθος size (int για τετράγωνο ή (w, h))."""
+        if isinstance(size, int):
+            size = (size, size)
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        item_key = (key, size)
+        surf = self._items.get(item_key)
+        if surf is not None:
+            self.hits += 1
+            self._items.move_to_end(item_key)
+            return surf
+
+        self.misses += 1
+        src = self._sources[key]
+        if src.get_size() == size:
+            surf = src
+        else:
+            # λείανση ώστε να μη «πιξελιάζει»
+            surf = pygame.transform.smoothscale(src, size)
+        self._items[item_key] = surf
+        self.bytes += _surface_bytes(surf)
+        self._evict()
+        return surf
+
+    def mip_levels(self, key):
+        """
+        Mip chain της εικόνας key: το αρχικό μέγεθος και μετά μισό, τέταρτο, ...
+        (κάθε επίπεδο με smoothscale από το προηγούμενο), μέχρι MIN_MIP pixels.
+        """
+        levels = self._mips.get(key)
+        if levels is None:
+            levels = [self._sources[key]]
+            w, h = levels[0].get_size()
+            while min(w, h) // 2 >= MIN_MIP:
+                w, h = w // 2, h // 2
+                levels.append(pygame.transform.smoothscale(levels[-1], (w, h)))
+            self._mips[key] = levels
+        return levels
+
+    def quick(self, key, size):
+        """
+        Γρήγορη (nearest-neighbour) κλιμάκωση για όσο αλλάζει το μέγεθος, π.χ. όταν
+        σέρνουμε την άκρη του παραθύρου. Αν το μέγεθος υπάρχει ήδη στο cache επιστρέφει
+        αυτό· αλλιώς κάνει scale από το πιο κοντινό mip level που είναι >= size.
+        """
+        if isinstance(size, int):
+            size = (size, size)
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        surf = self._items.get((key, size))
+        if surf is not None:
+            return surf
+        levels = self.mip_levels(key)
+        level = levels[0]
+        for candidate in levels:
+            if candidate.get_width() < size[0] or candidate.get_height() < size[1]:
+                break
+            level = candidate
+        return pygame.transform.scale(level, size)
+
+    def faces(self, size):
+        """Λίστα με όλες τις όψεις (index 0..5) στο ίδιο μέγεθος."""
+        return [self.get(key, size) for key in sorted(self._sources) if isinstance(key, int)]
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {"entries": len(self._items), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "hit_rate": self.hit_rate()}
+
+    def _evict(self):
+        # κρατάμε πάντα τουλάχιστον το πιο πρόσφατο
+        while self.bytes > self.max_bytes and len(self._items) > 1:
+            self._drop(next(iter(self._items)))
+
+    def _drop(self, item_key):
+        surf = self._items.pop(item_key)
+        self.bytes -= _surface_bytes(surf)
+
+
+MIN_MIP = 8  # το μικρότερο mip level (pixels)
+
+
+def _surface_bytes(surf):
+    return surf.get_pitch() * surf.get_height()
+
+
+# κοινό cache για όλα τα scripts με ζάρια
+SPRITE_CACHE = SpriteCache()
@@ -0,0 +1,119 @@
+import os
+import sys
+import time
+
+# το ρολόι ξεκινάει με το import αυτού του module (να είναι από τα πρώτα imports)
+_T0 = time.perf_counter()
+
+import pygame
+
+STARTUP_BUDGET_MS = 150  # στόχος: πρώτο frame σε < 150 ms
+# PYGAME_STARTUP_REPORT=1 -> τυπώνει την ανάλυση χρόνων μόλις φανεί το πρώτο frame
+REPORT = os.environ.get("PYGAME_STARTUP_REPORT", "") not in ("", "0")
+
+
+class StartupTimer:
+    """Μετράει πόσο κράτησε κάθε φάση εκκίνησης: import, init, assets, first_frame."""
+
+    def __init__(self, t0=None):
+        self.t0 = _T0 if t0 is None else t0
+        self._last = self.t0
+        self.phases = {}   # φάση -> ms
+        self.background = {}   # εργασίες σε thread (π.χ. ήχος) -> ms, εκτός του χρόνου μέχρι το 1ο frame
+        self.done = False
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last) * 1000.0
+        self._last = now
+
+    def mark_background(self, name, ms):
+        """Χρόνος μιας εργασίας που έτρεξε παράλληλα (δεν μπαίνει στο σύνολο ως το 1ο frame)."""
+        self.background[name] = ms
+        if self.done and REPORT:
+            print(f"Εκκίνηση (παρασκήνιο): {name} {ms:.1f} ms", file=sys.stderr)
+
+    def total_ms(self):
+        return (self._last - self.t0) * 1000.0
+
+    def first_frame(self):
+        """Καλείται μετά το πρώτο flip· μόνο η πρώτη κλήση μετράει."""
+        if self.done:
+            return
+        self.mark("first_frame")
+        self.done = True
+        if REPORT:
+            print(self.report(), file=sys.stderr)
+
+    def report(self):
+        parts = ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.phases.items())
+        total = self.total_ms()
+        flag = "" if total <= STARTUP_BUDGET_MS else f" (πάνω από τα {STARTUP_BUDGET_MS} ms!)"
+        background = ""
+        if self.background:
+            background = " | παρασκήνιο: " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.background.items())
+        return f"Εκκίνηση: {parts} | σύνολο {total:.1f} ms{flag}{background}"
+
+
+STARTUP = StartupTimer()
+
+
+# οι ρυθμίσεις με τις οποίες άνοιξε ο mixer το init_pygame (το pygame.mixer.get_init()
+# δίνει συχνότητα/format/κανάλια αλλά όχι το buffer)
+MIXER_OPENED = {}
+
+
+def init_pygame(font=True, sound=False, **mixer_args):
+    """
+    Αντί για pygame.init() (που ξεκινάει ΟΛΑ τα modules), ξεκινάει μόνο ό,τι χρειάζεται:
+    display πάντα, font αν font=True, mixer μόνο αν sound=True.
+    Επιστρέφει True αν ο mixer ξεκίνησε.
+    """
+    pygame.display.init()
+    # το pygame.time.get_ticks() θέλει το SDL timer (το pygame.init() το ανοίγει πάντα)
+    try:
+        from pygame._sdl2 import sdl2
+        sdl2.init_subsystem(sdl2.INIT_TIMER)
+    except (ImportError, AttributeError, pygame.error):
+        pygame.init()   # παλιό pygame: γυρνάμε στο πλήρες init
+    if font:
+        pygame.font.init()
+    mixer_ok = False
+    if sound:
+        try:
+            pygame.mixer.init(**mixer_args)
+            MIXER_OPENED.clear()
+            MIXER_OPENED.update(mixer_args)
+            mixer_ok = True
+        except pygame.error:
+            mixer_ok = False
+    return mixer_ok
+
+
+def find_file(candidates, base_dir=None):
+    """Το πρώτο αρχείο από τη λίστα που υπάρχει (ή None)."""
+    for name in candidates:
+        path = name if base_dir is None else os.path.join(base_dir, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """
+    Font με cache ανά (όνομα, μέγεθος).
+    Για name=None χρησιμοποιεί κατευθείαν το ενσωματωμένο font του pygame, όπως το
+    SysFont(None, ...), αλλά χωρίς το σκανάρισμα του καταλόγου fonts του συστήματος.
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if name is None:
+            font = pygame.font.Font(None, size)
+        else:
+            font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    LRU cache για έτοιμα (rendered) κείμενα.
+    Το font.render() ραστεροποιεί glyphs κάθε φορά· εδώ το κάνουμε μία φορά ανά
+    (font, κείμενο, antialias, χρώμα) και μετά ξαναχρησιμοποιούμε την ίδια εικόνα.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+        surf = self._items.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._items.move_to_end(key)    # πιο πρόσφατα χρησιμοποιημένο
+            return surf
+
+        self.misses += 1
+        if background is None:
+            surf = font.render(text, antialias, color)
+        else:
+            surf = font.render(text, antialias, color, background)
+        self._items[key] = surf
+        if len(self._items) > self.max_entries:
+            self._items.popitem(last=False)  # πετάμε το λιγότερο πρόσφατο
+        return surf
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {"entries": len(self._items), "hits": self.hits,
+                "misses": self.misses, "hit_rate": self.hit_rate()}
+
+    def clear(self):
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+# κοινό cache για όλα τα scripts
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Όπως το font.render(...), αλλά περνάει από το κοινό TEXT_CACHE."""
+    return TEXT_CACHE.render(font, text, antialias, color, background)